@@ -1,12 +1,17 @@
 import abc
+import base64
+import binascii
 import dataclasses
 import json
 import logging
+import pickletools
+import struct
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, BinaryIO, Callable, Dict, Optional, Type, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, NoReturn, Optional, Sequence, Tuple, Type, Union
 
 from serialzy.types import get_type
+from serialzy.utils import CacheInfo, LRUCache
 
 _LOG = logging.getLogger(__name__)
 
@@ -22,6 +27,30 @@ class StandardSchemaFormats(Enum):
     no_schema = "no_schema"
 
 
+class _FrozenMeta(Dict[str, str]):
+    """
+    Immutable and hashable dict, allows schemas to be used as cache keys
+    """
+
+    def __hash__(self) -> int:  # type: ignore
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return _FrozenMeta, (dict(self),)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError('Schema meta is immutable')
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable  # type: ignore
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+
 @dataclass(frozen=True)
 class Schema:
     data_format: str
@@ -29,6 +58,10 @@ class Schema:
     schema_content: str = ''
     meta: Dict[str, str] = field(default_factory=lambda: {})
 
+    def __post_init__(self):
+        if not isinstance(self.meta, _FrozenMeta):
+            object.__setattr__(self, 'meta', _FrozenMeta(self.meta))
+
 
 @dataclass(frozen=True)
 class VersionBoundary:
@@ -36,13 +69,142 @@ class VersionBoundary:
     less_than: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class TypeMatcher:
+    """
+    Types that a serializer may support, the registry checks supported_types() only for matching types
+    """
+    # top-level modules of types, of their base classes or of origins of generic types
+    modules: Tuple[str, ...] = ()
+    # types or origins of generic types, e.g. list for List[int]
+    types: Tuple[Any, ...] = ()
+    # base classes of types
+    bases: Tuple[Type, ...] = ()
+
+
 UserMeta = Dict[str, Any]
 
 
+# binary header content encodings
+_CONTENT_TEXT = 0
+_CONTENT_BASE64 = 1  # base64 text stored as raw decoded bytes
+
+
+def _encode_schema(schema: Schema) -> bytes:
+    """
+    Layout (little-endian): u16 + data format, u16 + schema format, u8 content encoding, u32 + schema content,
+    u16 meta entries count, then u16 + key and u32 + value for every meta entry
+    """
+    content_encoding = _CONTENT_TEXT
+    content = schema.schema_content.encode('utf-8')
+    if schema.schema_format == StandardSchemaFormats.pickled_type.name:
+        try:
+            raw = base64.b64decode(content, validate=True)
+            # store raw bytes only if the content can be restored exactly
+            if base64.b64encode(raw) == content:
+                content_encoding = _CONTENT_BASE64
+                content = raw
+        except binascii.Error:
+            pass
+
+    data_format = schema.data_format.encode('utf-8')
+    schema_format = schema.schema_format.encode('utf-8')
+    parts = [
+        struct.pack('<H', len(data_format)), data_format,
+        struct.pack('<H', len(schema_format)), schema_format,
+        struct.pack('<BI', content_encoding, len(content)), content,
+        struct.pack('<H', len(schema.meta))
+    ]
+    for key, value in schema.meta.items():
+        key_bytes = key.encode('utf-8')
+        value_bytes = value.encode('utf-8')
+        parts.extend((struct.pack('<H', len(key_bytes)), key_bytes, struct.pack('<I', len(value_bytes)), value_bytes))
+    return b''.join(parts)
+
+
+def _decode_schema(header: bytes) -> Schema:
+    view = memoryview(header)
+    offset = 0
+
+    def read(fmt: str) -> Tuple[int, ...]:
+        nonlocal offset
+        values = struct.unpack_from(fmt, view, offset)
+        offset += struct.calcsize(fmt)
+        return values
+
+    def read_bytes(length: int) -> bytes:
+        nonlocal offset
+        value = view[offset:offset + length].tobytes()
+        offset += length
+        return value
+
+    data_format = read_bytes(read('<H')[0]).decode('utf-8')
+    schema_format = read_bytes(read('<H')[0]).decode('utf-8')
+    content_encoding, content_len = read('<BI')
+    content = read_bytes(content_len)
+    if content_encoding == _CONTENT_TEXT:
+        schema_content = content.decode('utf-8')
+    elif content_encoding == _CONTENT_BASE64:
+        schema_content = base64.b64encode(content).decode('ascii')
+    else:
+        raise ValueError(f'Unknown schema content encoding {content_encoding}')
+
+    meta = {}
+    for _ in range(read('<H')[0]):
+        key = read_bytes(read('<H')[0]).decode('utf-8')
+        meta[key] = read_bytes(read('<I')[0]).decode('utf-8')
+    return Schema(data_format, schema_format, schema_content, meta)
+
+
+# pickle opcodes which depend on the protocol and the pickler rather than on the pickled type
+_PICKLE_FRAMING_OPCODES = frozenset({'PROTO', 'FRAME', 'MEMOIZE', 'PUT', 'BINPUT', 'LONG_BINPUT', 'STOP'})
+
+
+def _pickled_type_fingerprint(content: str) -> Any:
+    """
+    :return: opcodes of a pickled type without framing, they are the same for types pickled by reference
+    with other versions of python and cloudpickle; the content itself if it is not a valid pickle
+    """
+    try:
+        return tuple((op.name, arg) for op, arg, _ in pickletools.genops(base64.b64decode(content, validate=True))
+                     if op.name not in _PICKLE_FRAMING_OPCODES)
+    except (binascii.Error, ValueError):
+        return content
+
+
+def _schema_fingerprint(data_format: str, schema_format: str, schema_content: str) -> Any:
+    """
+    :return: hashable schema without meta of the schema and of nested schemas, i.e., without versions of dependencies
+    """
+    if schema_format == StandardSchemaFormats.pickled_type.name:
+        return data_format, schema_format, _pickled_type_fingerprint(schema_content)
+    try:
+        content = json.loads(schema_content)
+    except ValueError:
+        return data_format, schema_format, schema_content
+    return data_format, schema_format, _content_fingerprint(content)
+
+
+def _content_fingerprint(value: Any) -> Any:
+    if isinstance(value, dict):
+        if {'data_format', 'schema_format', 'schema_content'} <= value.keys():  # nested schema
+            return _schema_fingerprint(value['data_format'], value['schema_format'], value['schema_content'])
+        return tuple(sorted(((key, _content_fingerprint(item)) for key, item in value.items()), key=lambda x: x[0]))
+    if isinstance(value, list):
+        return tuple(_content_fingerprint(item) for item in value)
+    return value
+
+
 class Serializer(abc.ABC):
+    # header with json-encoded schema, only read for backward compatibility
     HEADER_BYTES = 'serialzy'.encode('utf-8')
     HEADER_BYTES_LEN = len(HEADER_BYTES)
+    # header with binary-encoded schema, see _encode_schema for the layout
+    BINARY_HEADER_BYTES = 'serialzb'.encode('utf-8')
+    BINARY_HEADER_VERSION = 1
     USER_META_KEY = 'user-meta'
+    SCHEMA_CACHE_SIZE = 256
+    RESOLVE_CACHE_SIZE = 256
 
     def serialize(self, obj: Any, dest: BinaryIO, user_meta: Optional[UserMeta] = None) -> None:
         """
@@ -67,15 +229,20 @@ class Serializer(abc.ABC):
         :return: None
         """
 
-    def deserialize(self, source: BinaryIO, typ: Optional[Type] = None) -> Any:
+    def deserialize(self, source: BinaryIO, typ: Optional[Type] = None, trusted: bool = False) -> Any:
         """
         :param source: buffer of file with serialized data
         :param typ: type of the resulting object, fetched from the header if None
+        :param trusted: if True and typ is provided, the header is only compared with the schema of typ
+        and TypeError is raised if they differ, so nothing is unpickled or imported to resolve the header
         :return: deserialized object
         """
 
         # read schema header
-        schema_type = self._deserialize_type(source)
+        if trusted and typ is not None:
+            schema_type = self._deserialize_trusted_type(source, typ)
+        else:
+            schema_type = self._deserialize_type(source)
 
         # read serialized data
         return self._deserialize(source, schema_type, typ)
@@ -95,6 +262,13 @@ class Serializer(abc.ABC):
         :return: type suitable for the serializer or types filter
         """
 
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        """
+        :return: types that the serializer may support, must not import anything,
+        None if the serializer may support types of any module
+        """
+        return None
+
     @abc.abstractmethod
     def available(self) -> bool:
         """
@@ -146,17 +320,38 @@ class Serializer(abc.ABC):
             )
 
     @classmethod
-    def _deserialize_schema(cls, source: BinaryIO) -> Schema:
+    def _read_header(cls, source: BinaryIO) -> Tuple[bool, bytes]:
+        """
+        :param source: buffer of file with serialized data
+        :return: True if the header is binary-encoded, False if it is json-encoded, and raw header content
+        """
         first_str = source.read(cls.HEADER_BYTES_LEN)
         if len(first_str) == 0:
             raise ValueError('Source is empty')
-        if first_str != cls.HEADER_BYTES:
+
+        if first_str == cls.BINARY_HEADER_BYTES:
+            header_version = int.from_bytes(source.read(1), byteorder='little', signed=False)
+            if header_version > cls.BINARY_HEADER_VERSION:
+                raise ValueError(f'Unsupported header version {header_version}, '
+                                 f'expected at most {cls.BINARY_HEADER_VERSION}')
+            binary = True
+        elif first_str == cls.HEADER_BYTES:
+            binary = False
+        else:
             raise ValueError(f'Missing header in source, expected {cls.HEADER_BYTES!r}, got {first_str!r}')
 
         header_len = int.from_bytes(source.read(8), byteorder='little', signed=False)
-        schema_json = source.read(header_len).decode('utf-8')
-        schema = Schema(**json.loads(schema_json))
-        return schema
+        return binary, source.read(header_len)
+
+    @staticmethod
+    def _decode_header(binary: bool, header: bytes) -> Schema:
+        if binary:
+            return _decode_schema(header)
+        return Schema(**json.loads(header.decode('utf-8')))
+
+    @classmethod
+    def _deserialize_schema(cls, source: BinaryIO) -> Schema:
+        return cls._decode_header(*cls._read_header(source))
 
     @classmethod
     def deserialize_data_format(cls, source: BinaryIO) -> str:
@@ -173,20 +368,114 @@ class Serializer(abc.ABC):
         return user_meta
 
     def _deserialize_type(self, source: BinaryIO) -> Type:
-        schema = self._deserialize_schema(source)
-        typ = self.resolve(schema)
+        binary, header = self._read_header(source)
+        return self._resolve_header(binary, header)
+
+    def _deserialize_trusted_type(self, source: BinaryIO, typ: Type) -> Type:
+        binary, header = self._read_header(source)
+        schema = self._decode_header(binary, header)
+        expected_schema, _ = self._cached_schema(typ)
+        if (
+            schema.data_format == expected_schema.data_format and
+            schema.schema_format == expected_schema.schema_format and
+            schema.schema_content == expected_schema.schema_content
+        ):
+            return typ
+        # nested schemas carry versions of dependencies in their meta and pickled types depend on the versions
+        # of python and cloudpickle, so schemas written with other versions are compared without them
+        if (
+            _schema_fingerprint(schema.data_format, schema.schema_format, schema.schema_content) ==
+            _schema_fingerprint(expected_schema.data_format, expected_schema.schema_format,
+                                expected_schema.schema_content)
+        ):
+            return typ
+
+        # resolving the header could unpickle or import anything, e.g. a type pickled by another version of cloudpickle
+        raise TypeError(f'Cannot deserialize data with schema type of data format {schema.data_format} '
+                        f'into trusted type {typ}: schema differs from the schema of the type')
+
+    def _resolve_header(self, binary: bool, header: bytes) -> Type:
+        schema = self._decode_header(binary, header)
+        # resolved types are cached by schema without user meta, so version warnings are logged once per schema
+        # and artifacts that differ only in user meta share the entry
+        key = schema
+        if self.USER_META_KEY in schema.meta:
+            key = dataclasses.replace(schema, meta={k: v for k, v in schema.meta.items() if k != self.USER_META_KEY})
+        cache = self.__resolve_cache()
+        typ = cache.get(key)
+        if typ is None:
+            typ = self.resolve(schema)
+            cache.put(key, typ)
         return typ
 
+    def clear_caches(self) -> None:
+        """
+        drops cached schemas and resolved types, registries call it when the set of registered serializers changes
+        """
+        self.__schema_cache().clear()
+        self.__resolve_cache().clear()
+
+    def schema_cache_info(self) -> CacheInfo:
+        """
+        :return: hits, misses and size of the cache of schemas by type
+        """
+        return self.__schema_cache().info()
+
+    def resolve_cache_info(self) -> CacheInfo:
+        """
+        :return: hits, misses and size of the cache of types resolved from schema headers
+        """
+        return self.__resolve_cache().info()
+
     def _write_schema(self, typ: Type, dest: BinaryIO, user_meta: Optional[UserMeta] = None) -> None:
-        schema = self.schema(typ)
+        schema, header = self._cached_schema(typ)
         if user_meta is not None:
-            schema.meta[self.USER_META_KEY] = json.dumps(user_meta)
-        schema_json = json.dumps(dataclasses.asdict(schema))
-        schema_bytes = schema_json.encode('utf-8')
-        header_len = len(schema_bytes)
-        dest.write(self.HEADER_BYTES)
-        dest.write(header_len.to_bytes(length=8, byteorder='little', signed=False))
-        dest.write(schema_bytes)
+            schema = dataclasses.replace(schema, meta={**schema.meta, self.USER_META_KEY: json.dumps(user_meta)})
+            header = self._encode_header(schema)
+        dest.write(header)
+
+    def _cached_schema(self, typ: Type) -> Tuple[Schema, bytes]:
+        """
+        :param typ: type of object for serialization
+        :return: schema for the type and ready-to-write header with the schema
+        """
+        cache = self.__schema_cache()
+        try:
+            cached = cache.get(typ)
+        except TypeError:  # unhashable type
+            schema = self.schema(typ)
+            return schema, self._encode_header(schema)
+
+        if cached is None:
+            schema = self.schema(typ)
+            cached = schema, self._encode_header(schema)
+            cache.put(typ, cached)
+        return cached
+
+    def __schema_cache(self) -> LRUCache[Type, Tuple[Schema, bytes]]:
+        # serializers do not call super().__init__, so the cache is created on first use
+        try:
+            return self.__schema_cache_storage
+        except AttributeError:
+            self.__schema_cache_storage: LRUCache[Type, Tuple[Schema, bytes]] = LRUCache(self.SCHEMA_CACHE_SIZE)
+            return self.__schema_cache_storage
+
+    def __resolve_cache(self) -> LRUCache[Schema, Type]:
+        try:
+            return self.__resolve_cache_storage
+        except AttributeError:
+            self.__resolve_cache_storage: LRUCache[Schema, Type] = LRUCache(self.RESOLVE_CACHE_SIZE)
+            return self.__resolve_cache_storage
+
+    @classmethod
+    def _encode_header(cls, schema: Schema) -> bytes:
+        schema_bytes = _encode_schema(schema)
+        return b''.join((
+            cls.BINARY_HEADER_BYTES,
+            bytes((cls.BINARY_HEADER_VERSION,)),
+            len(schema_bytes).to_bytes(length=8, byteorder='little', signed=False),
+            schema_bytes
+        ))
 
     def _check_type(self, typ: Type) -> None:
         supported = self.supported_types()
@@ -203,6 +492,38 @@ class Serializer(abc.ABC):
             raise TypeError(f'Cannot deserialize data with schema type {schema_type} into type {user_type}')
 
 
+class BlockSerializer(Serializer, abc.ABC):
+    """
+    Serializer which writes sequences of objects of the same type as single blocks, e.g. column-wise.
+    Sequence serializers write lists of such objects as blocks
+    """
+
+    @abc.abstractmethod
+    def _supports_block(self, typ: Type) -> bool:
+        """
+        :param typ: type of objects
+        :return: True if a sequence of objects of the type can be written as a single block, otherwise False
+        """
+
+    @abc.abstractmethod
+    def _serialize_block(self, objs: Sequence[Any], typ: Type, dest: BinaryIO) -> None:
+        """
+        :param objs: objects of the same type to serialize into a single self-delimited block
+        :param typ: type of the objects
+        :param dest: serialized block is written into dest
+        :return: None
+        """
+
+    @abc.abstractmethod
+    def _deserialize_block(self, source: BinaryIO, typ: Type, count: int) -> List[Any]:
+        """
+        :param source: buffer of file with serialized block
+        :param typ: type of the objects in the block
+        :param count: number of objects in the block
+        :return: deserialized objects
+        """
+
+
 class SerializerRegistry(abc.ABC):
     @abc.abstractmethod
     def register_serializer(self, serializer: Serializer, priority: Optional[int] = None) -> None:
@@ -252,3 +573,10 @@ class SerializerRegistry(abc.ABC):
         """
         reloads all registered serializers, useful if libraries are updated
         """
+
+    def _add_lookup_dependencies(self, types: Iterable[Any]) -> None:
+        """
+        Serializers which cache results of lookups, e.g. serializers of fields, call it when a cached result is used,
+        so registries which cache lookups know which types the lookup in progress depends on
+        :param types: types which serializers were looked up to build the cached result
+        """
@@ -1,11 +1,8 @@
 import logging
 from typing import Any, BinaryIO, Callable, Dict, Type, Union, Optional
 
-from serialzy.api import StandardDataFormats, Schema, VersionBoundary
+from serialzy.api import StandardDataFormats, VersionBoundary
 from serialzy.base import DefaultSchemaSerializerByValue
-from packaging import version  # type: ignore
-
-from serialzy.utils import cached_installed_packages
 
 _LOG = logging.getLogger(__name__)
 
@@ -45,14 +42,5 @@ class CloudpickleSerializer(DefaultSchemaSerializerByValue):
         import cloudpickle  # type: ignore
         return {"cloudpickle": cloudpickle.__version__}
 
-    def resolve(self, schema: Schema) -> Type:
-        typ = super().resolve(schema)
-        if 'cloudpickle' not in schema.meta:
-            _LOG.warning('No cloudpickle version in meta')
-        elif version.parse(schema.meta['cloudpickle']) > version.parse(cached_installed_packages["cloudpickle"]):
-            _LOG.warning(f'Installed version of cloudpickle {cached_installed_packages["cloudpickle"]} '
-                         f'is older than used for serialization {schema.meta["cloudpickle"]}')
-        return typ
-
     def requirements(self) -> Dict[str, VersionBoundary]:
         return {"cloudpickle": VersionBoundary()}
@@ -0,0 +1,107 @@
+import enum
+import functools
+import importlib
+import logging
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple, Type, Union, cast
+
+from serialzy.api import Serializer, TypeMatcher
+from serialzy.types import STDLIB_VALUE_TYPES
+from serialzy.utils import _importlib_metadata
+
+_LOG = logging.getLogger(__name__)
+
+# entry points of the group refer to manifest entries or sequences of them,
+# so plugins are imported only when their serializers may be used
+PLUGINS_ENTRY_POINT_GROUP = 'serialzy.serializers'
+
+
+@dataclass(frozen=True)
+class SerializerManifestEntry:
+    """
+    Serializer known without importing its module, the module is imported when a lookup may match the serializer
+    """
+    module: str
+    name: str
+    data_format: str
+    stable: bool
+    type_matcher: Optional[TypeMatcher]
+
+    def load(self) -> Type[Serializer]:
+        return cast(Type[Serializer], getattr(importlib.import_module(self.module), self.name))
+
+
+def _entry(module: str, name: str, data_format: str, stable: bool,
+           type_matcher: Optional[TypeMatcher]) -> SerializerManifestEntry:
+    return SerializerManifestEntry(f'serialzy.serializers.{module}', name, data_format, stable, type_matcher)
+
+
+def _model(module: str, name: str, data_format: str, library: str) -> SerializerManifestEntry:
+    return _entry(module, name, data_format, True, TypeMatcher(modules=(library,)))
+
+
+# serializers of serialzy.serializers in the order of discovery, which breaks ties between equal priorities
+SERIALIZERS_MANIFEST: Tuple[SerializerManifestEntry, ...] = (
+    _entry('binary', 'BytesSerializer', 'raw_bytes', True,
+           TypeMatcher(types=(bytes, bytearray, memoryview, array))),
+    _model('catboost', 'CatboostModelSerializer', 'cbm', 'catboost'),
+    _model('catboost', 'CatboostPoolSerializer', 'catboost_quantized_pool', 'catboost'),
+    _entry('ellipsis', 'EllipsisSerializer', 'serialzy_python_ellipsis', True, TypeMatcher(types=(Ellipsis,))),
+    _model('lightgbm', 'LightGBMSerializer', 'lgbm', 'lightgbm'),
+    _entry('mapping', 'DictSerializerStable', 'serialzy_dict_stable', True, TypeMatcher(types=(dict,))),
+    _entry('mapping', 'DictSerializerUnstable', 'serialzy_dict_unstable', False, TypeMatcher(types=(dict,))),
+    _model('numpy', 'NumpySerializer', 'npy', 'numpy'),
+    _model('onnx', 'ONNXSerializer', 'onnx', 'onnx'),
+    _model('pandas', 'PandasSerializer', 'pandas_arrow', 'pandas'),
+    _entry('primitive', 'PrimitiveSerializer', 'primitive_type', True,
+           TypeMatcher(types=(int, float, str, bool, type(None)))),
+    _entry('proto', 'ProtoMessageSerializer', 'proto', True, None),
+    _model('pyarrow', 'PyarrowSerializer', 'arrow', 'pyarrow'),
+    _entry('record', 'RecordSerializerStable', 'serialzy_record_stable', True, None),
+    _entry('record', 'RecordSerializerUnstable', 'serialzy_record_unstable', False, None),
+    _entry('sequence', 'SequenceSerializerStable', 'serialzy_sequence_stable', True,
+           TypeMatcher(types=(list, tuple))),
+    _entry('sequence', 'SequenceSerializerUnstable', 'serialzy_sequence_unstable', False,
+           TypeMatcher(types=(list, tuple))),
+    _entry('sets', 'SetSerializerStable', 'serialzy_set_stable', True, TypeMatcher(types=(set, frozenset))),
+    _entry('sets', 'SetSerializerUnstable', 'serialzy_set_unstable', False, TypeMatcher(types=(set, frozenset))),
+    _model('sklearn', 'SciKitLearnSerializer', 'skl', 'sklearn'),
+    _entry('stdlib', 'StdlibValueSerializer', 'serialzy_stdlib_value', True,
+           TypeMatcher(types=STDLIB_VALUE_TYPES, bases=(enum.Enum,))),
+    _model('tensorflow', 'TensorflowKerasSerializer', 'tf_keras', 'keras'),
+    _model('tensorflow', 'TensorflowPureSerializer', 'tf_pure', 'tensorflow'),
+    _model('torch', 'TorchSerializer', 'pt', 'torch'),
+    _entry('union', 'UnionSerializerStable', 'serialzy_union_stable', True, TypeMatcher(types=(Union,))),
+    _entry('union', 'UnionSerializerUnstable', 'serialzy_union_unstable', False, TypeMatcher(types=(Union,))),
+    _model('xgboost', 'XGBoostSerializer', 'xgb', 'xgboost'),
+)
+
+
+def _entry_points(group: str) -> Iterable[Any]:
+    entry_points = _importlib_metadata().entry_points()
+    if hasattr(entry_points, 'select'):
+        return cast(Iterable[Any], entry_points.select(group=group))
+    # dict of groups before python 3.10
+    return cast(Iterable[Any], entry_points.get(group, ()))
+
+
+@functools.lru_cache(maxsize=None)
+def plugins_manifest() -> Tuple[SerializerManifestEntry, ...]:
+    """
+    :return: entries declared by installed packages in the entry point group, loaded once per process
+    """
+    entries: List[SerializerManifestEntry] = []
+    for entry_point in sorted(_entry_points(PLUGINS_ENTRY_POINT_GROUP), key=lambda ep: ep.name):
+        try:
+            declared = entry_point.load()
+        except Exception as e:
+            _LOG.warning(f'Cannot load serializers plugin {entry_point.name}: {e}')
+            continue
+
+        declared = (declared,) if isinstance(declared, SerializerManifestEntry) else tuple(declared)
+        if not all(isinstance(entry, SerializerManifestEntry) for entry in declared):
+            _LOG.warning(f'Serializers plugin {entry_point.name} must refer to manifest entries')
+            continue
+        entries.extend(declared)
+    return tuple(entries)
@@ -1,21 +1,153 @@
 import inspect
 import logging
 import sys
+import threading
 from collections import defaultdict
+from dataclasses import dataclass, field
 from types import ModuleType
-from typing import Dict, List, Optional, Type, cast, Iterable, Any, overload
+from typing import Dict, List, Optional, Type, cast, Iterable, Any, overload, Generic, TypeVar, Hashable, Tuple, \
+    NamedTuple, FrozenSet, Set, Sequence
 
-import serialzy.serializers
-from serialzy.api import Serializer, SerializerRegistry
+from typing_extensions import get_origin
+
+from serialzy.api import Serializer, SerializerRegistry, TypeMatcher
 from serialzy.cloudpickle import CloudpickleSerializer
 from serialzy.exception import register_exception_serializer_to_pickle
-from serialzy.utils import load_all_modules_from
+from serialzy.manifest import SERIALIZERS_MANIFEST, SerializerManifestEntry, plugins_manifest
 from serialzy.types import get_type
+from serialzy.utils import CacheInfo, LRUCache
 
 _LOG = logging.getLogger(__name__)
 
+T = TypeVar('T', bound=Hashable)
+
+# serializers with equal priorities are ordered by groups and then by registration
+_MANIFEST_GROUP = 0
+_PLUGINS_GROUP = 1
+_REGISTERED_GROUP = 2
+
+
+class _CachedLookup(NamedTuple):
+    serializer: Optional[Serializer]  # None if no serializer supports the type
+    # types looked up by serializers while checking the type, directly or transitively
+    dependencies: FrozenSet[Any]
+
+
+@dataclass
+class _Lookup:
+    typ: Any
+    dependencies: Set[Any] = field(default_factory=set)
+    provisional: bool = False
+
+
+class _MatcherIndex(Generic[T]):
+    """
+    Items indexed by type matchers, items without matchers match every type
+    """
+
+    def __init__(self):
+        self._items: Dict[T, Optional[TypeMatcher]] = {}
+        self._types: Dict[Any, List[T]] = defaultdict(list)
+        self._bases: Dict[Type, List[T]] = defaultdict(list)
+        self._modules: Dict[str, List[T]] = defaultdict(list)
+        self._not_indexed: List[T] = []
+
+    def add(self, item: T, matcher: Optional[TypeMatcher]) -> None:
+        self._items[item] = matcher
+        for index in self.__indices(matcher):
+            index.append(item)
+
+    def remove(self, item: T) -> None:
+        for index in self.__indices(self._items.pop(item)):
+            index.remove(item)
+
+    def match(self, typ: Any) -> List[T]:
+        """
+        :return: items which type matchers match the type, origin of the generic type or classes of its MRO
+        """
+        origin = get_origin(typ)
+        cls = typ if origin is None else origin
+        try:
+            found = dict.fromkeys(self._types.get(cls, ()))
+        except TypeError:  # unhashable
+            return list(self._items)
+        found.update(dict.fromkeys(self._not_indexed))
+
+        for base in (cls.__mro__ if isinstance(cls, type) else (cls,)):
+            found.update(dict.fromkeys(self._bases.get(base, ())))
+            module = getattr(base, '__module__', None)
+            if isinstance(module, str):
+                found.update(dict.fromkeys(self._modules.get(module.split('.')[0], ())))
+        return list(found)
+
+    def __indices(self, matcher: Optional[TypeMatcher]) -> Iterable[List[T]]:
+        if matcher is None:
+            yield self._not_indexed
+            return
+        for typ in matcher.types:
+            yield self._types[typ]
+        for base in matcher.bases:
+            yield self._bases[base]
+        for module in matcher.modules:
+            yield self._modules[module]
+
+
+def _takes_registry(class_value: Type[Serializer]) -> bool:
+    """
+    :return: whether the serializer is created with a registry, raises ValueError if it cannot be created
+    """
+    sig = inspect.signature(class_value)
+    # parameters with default values are options, serializers are created with the defaults
+    parameters = [p for p in sig.parameters.values() if p.default is inspect.Parameter.empty]
+    if len(parameters) == 0:
+        return False
+    elif len(parameters) == 1 and issubclass(parameters[0].annotation, SerializerRegistry):
+        return True
+    raise ValueError(
+        f'Serializer {class_value.__name__} has unexpected arguments in __init__: '
+        f'only empty arguments or SerializerRegistry are allowed')
+
+
+def _instantiate(class_value: Type[Serializer], registry: SerializerRegistry) -> Serializer:
+    if _takes_registry(class_value):
+        # noinspection PyArgumentList
+        return class_value(registry)  # type: ignore
+    return class_value()
+
+
+def _select_serializer(typ: Any, candidates: Iterable[Serializer], exact: Iterable[Serializer],
+                       priorities: Dict[Type[Serializer], int]) -> Optional[Serializer]:
+    """
+    :param candidates: serializers which type matchers match the type, in the order of registration
+    :param exact: serializers registered for exactly the type, in the order of registration
+    :return: the serializer with the least priority which supports the type
+    """
+    result: Optional[Serializer] = None
+    priority = sys.maxsize
+    for serializer in candidates:
+        serializer_type = type(serializer)
+        try:
+            if (
+                    # mypy issue: https://github.com/python/mypy/issues/3060
+                    not isinstance(serializer.supported_types(), Type)  # type: ignore
+                    and serializer.supported_types()(typ)
+                    and priorities[serializer_type] < priority
+            ):
+                priority = priorities[serializer_type]
+                result = serializer
+        except (ImportError, ModuleNotFoundError, AttributeError):
+            continue
+
+    for serializer in exact:
+        if priorities[type(serializer)] <= priority:
+            result = serializer
+    return result
+
 
 class DefaultSerializerRegistry(SerializerRegistry):
+    TYPE_CACHE_SIZE = 4096
+    DATA_FORMAT_CACHE_SIZE = 256
+
     def __init__(self):
         self._default_priority_stable = sys.maxsize - 10
         self._default_priority_unstable = sys.maxsize - 5
@@ -25,39 +157,49 @@ class DefaultSerializerRegistry(SerializerRegistry):
 
         self._serializer_priorities: Dict[Type[Serializer], int] = {}
         self._serializer_registry: Dict[Type[Serializer], Serializer] = {}
+        # serializers with equal priorities are ordered by registration, serializers of the manifest go first
+        self._serializer_order: Dict[Type[Serializer], Tuple[int, int]] = {}
+        self._serializers_index: _MatcherIndex[Serializer] = _MatcherIndex()
+
+        # serializers of the manifest and plugins are imported and registered when a lookup may match them
+        self._pending: Dict[Tuple[str, str], Tuple[Tuple[int, int], SerializerManifestEntry]] = {}
+        self._pending_index: _MatcherIndex[SerializerManifestEntry] = _MatcherIndex()
+        self._pending_data_formats: Dict[str, List[SerializerManifestEntry]] = defaultdict(list)
+        for order, entry in enumerate(SERIALIZERS_MANIFEST):
+            self.__add_pending(entry, (_MANIFEST_GROUP, order))
+        # entry points of plugins are scanned on the first lookup
+        self._plugins_loaded = False
+        self._next_order = 0
+
+        self._serializer_type_cache: LRUCache[Any, _CachedLookup] = LRUCache(self.TYPE_CACHE_SIZE)
+        self._serializer_data_format_cache: LRUCache[str, Optional[Serializer]] = LRUCache(
+            self.DATA_FORMAT_CACHE_SIZE)
+        # dependencies of type lookups in progress, serializers of generic types and records look up their arguments
+        self._lookups = threading.local()
 
-        self._serializer_type_cache: Dict[Type, Serializer] = {}
-        self._serializer_data_format_cache: Dict[str, Serializer] = {}
-
-        load_all_modules_from(serialzy.serializers)
-        for serializer in self._fetch_serializers_from(serialzy.serializers):
-            if self.is_registered(serializer):
-                continue
-            if serializer.stable():
-                self.register_serializer(serializer, self._default_priority_stable)
-            else:
-                self.register_serializer(serializer, self._default_priority_unstable)
         # cloudpickle has the least priority
-        self.register_serializer(CloudpickleSerializer(), sys.maxsize - 1)
+        self._register(CloudpickleSerializer(), sys.maxsize - 1, self.__registration_order())
         register_exception_serializer_to_pickle()
 
     def register_serializer(self, serializer: Serializer, priority: Optional[int] = None) -> None:
-        self._serializer_type_cache.clear()
-        self._serializer_data_format_cache.clear()
-
-        serializer_type = type(serializer)
-        if serializer_type in self._serializer_registry:
-            raise ValueError(f"Serializer {serializer_type} has been already registered")
-
-        self._serializer_registry[serializer_type] = serializer
-        self._data_formats_serializer_registry[serializer.data_format()].append(serializer)
+        if self.is_registered(serializer):
+            raise ValueError(f"Serializer {type(serializer)} has been already registered")
 
         if priority is None:
             if serializer.stable():
                 priority = self._default_priority_stable
             else:
                 priority = self._default_priority_unstable
+        self._register(serializer, priority, self.__registration_order())
+
+    def _register(self, serializer: Serializer, priority: int, order: Tuple[int, int],
+                  invalidate_caches: bool = True) -> None:
+        serializer_type = type(serializer)
+        self._serializer_registry[serializer_type] = serializer
+        self._data_formats_serializer_registry[serializer.data_format()].append(serializer)
         self._serializer_priorities[serializer_type] = priority
+        self._serializer_order[serializer_type] = order
+        self._serializers_index.add(serializer, serializer.type_matcher())
 
         try:
             # mypy issue: https://github.com/python/mypy/issues/3060
@@ -66,15 +208,25 @@ class DefaultSerializerRegistry(SerializerRegistry):
         except (ImportError, ModuleNotFoundError, AttributeError):
             pass
 
+        # lookups made while invalidating see the registration completed
+        if invalidate_caches:
+            self._invalidate_caches(serializer)
+
     def unregister_serializer(self, serializer: Serializer):
-        self._serializer_type_cache.clear()
-        self._serializer_data_format_cache.clear()
+        self._load_plugins()
 
         serializer_type = type(serializer)
+        pending = self._pending.get(self.__key(serializer_type))
+        if pending is not None:
+            # lookups that could match the serializer would have loaded it, so caches are not affected
+            self.__remove_pending(pending[1])
+
         if serializer_type in self._serializer_registry:
+            registered = self._serializer_registry.pop(serializer_type)
             self._data_formats_serializer_registry[serializer.data_format()].remove(serializer)
             del self._serializer_priorities[serializer_type]
-            del self._serializer_registry[serializer_type]
+            del self._serializer_order[serializer_type]
+            self._serializers_index.remove(registered)
 
             try:
                 # mypy issue: https://github.com/python/mypy/issues/3060
@@ -84,8 +236,14 @@ class DefaultSerializerRegistry(SerializerRegistry):
             except (ImportError, ModuleNotFoundError, AttributeError):
                 pass
 
+            # lookups made while invalidating see the serializer removed
+            registered.clear_caches()
+            self._invalidate_caches(registered)
+
     def is_registered(self, serializer: Serializer) -> bool:
-        return type(serializer) in self._serializer_registry
+        self._load_plugins()
+        serializer_type = type(serializer)
+        return serializer_type in self._serializer_registry or self.__key(serializer_type) in self._pending
 
     @overload
     def find_serializer_by_type(self, typ: object) -> Optional[Serializer]:
@@ -99,59 +257,254 @@ class DefaultSerializerRegistry(SerializerRegistry):
         pass
 
     def find_serializer_by_type(self, typ) -> Optional[Serializer]:
-        if typ in self._serializer_type_cache:
-            return self._serializer_type_cache[typ]
-
-        result: Optional[Serializer] = None
-        priority = sys.maxsize
-        for serializer_type, serializer in self._serializer_registry.items():
-            try:
-                if (
-                        # mypy issue: https://github.com/python/mypy/issues/3060
-                        not isinstance(serializer.supported_types(), Type)  # type: ignore
-                        and serializer.supported_types()(typ)
-                        and self._serializer_priorities[serializer_type] < priority
-                ):
-                    priority = self._serializer_priorities[serializer_type]
-                    result = serializer
-            except (ImportError, ModuleNotFoundError, AttributeError):
-                continue
-
-        for serializer in self._type_registry[typ]:
-            if self._serializer_priorities[type(serializer)] <= priority:
-                result = serializer
-
-        if result:
-            self._serializer_type_cache[typ] = result
-
+        lookups: List[_Lookup] = self._lookups.__dict__.setdefault('stack', [])
+        try:
+            cached = self._serializer_type_cache.get(typ)
+            hashable = True
+        except TypeError:  # unhashable generics are not cached
+            cached = None
+            hashable = False
+
+        if cached is not None:
+            if lookups:
+                lookups[-1].dependencies.add(typ)
+                lookups[-1].dependencies.update(cached.dependencies)
+            return cached.serializer
+
+        lookup = _Lookup(typ)
+        for i, parent in enumerate(lookups):
+            if parent.typ == typ:
+                # results of recursive lookups are not final until the outer lookup of the type finishes
+                for nested in lookups[i + 1:]:
+                    nested.provisional = True
+                lookup.provisional = True
+                break
+
+        lookups.append(lookup)
+        try:
+            result = self.__find_serializer_by_type(typ)
+        finally:
+            lookups.pop()
+
+        if hashable and not lookup.provisional:
+            self._serializer_type_cache.put(typ, _CachedLookup(result, frozenset(lookup.dependencies)))
+        if lookups:
+            if hashable:
+                lookups[-1].dependencies.add(typ)
+            lookups[-1].dependencies.update(lookup.dependencies)
         return result
 
+    def _add_lookup_dependencies(self, types: Iterable[Any]) -> None:
+        lookups: Optional[List[_Lookup]] = getattr(self._lookups, 'stack', None)
+        if not lookups:
+            return
+        for typ in types:
+            # lookups in progress already depend on themselves
+            if not any(lookup.typ == typ for lookup in lookups):
+                # cached lookups add the type and its dependencies to the lookup in progress
+                self.find_serializer_by_type(typ)
+
+    def __find_serializer_by_type(self, typ: Any) -> Optional[Serializer]:
+        self._load_plugins()
+        self._load_pending(self._pending_index.match(typ))
+        try:
+            exact = self._type_registry.get(typ, [])
+        except TypeError:  # unhashable
+            exact = []
+        return _select_serializer(typ, self.__ordered(self._serializers_index.match(typ)), self.__ordered(exact),
+                                  self._serializer_priorities)
+
     def find_serializer_by_instance(self, obj: Any) -> Optional[Serializer]:
         typ = get_type(obj)
         return self.find_serializer_by_type(typ)
 
     def find_serializer_by_data_format(self, data_format: str) -> Optional[Serializer]:
-        if data_format in self._serializer_data_format_cache:
-            return self._serializer_data_format_cache[data_format]
+        cached = self._serializer_data_format_cache.get(data_format)
+        if cached is not None or data_format in self._serializer_data_format_cache:
+            return cached
 
+        self._load_plugins()
+        self._load_pending(self._pending_data_formats.get(data_format, ()))
         serializer: Optional[Serializer] = None
         serializer_priority = sys.maxsize
-        for ser in self._data_formats_serializer_registry[data_format]:
+        for ser in self.__ordered(self._data_formats_serializer_registry.get(data_format, ())):
             ser_type = type(ser)
             if self._serializer_priorities[ser_type] < serializer_priority:
                 serializer = ser
                 serializer_priority = self._serializer_priorities[ser_type]
 
-        if serializer:
-            self._serializer_data_format_cache[data_format] = serializer
-
+        self._serializer_data_format_cache.put(data_format, serializer)
         return serializer
 
+    def type_cache_info(self) -> CacheInfo:
+        """
+        :return: hits, misses, evictions and size of the cache of serializers by type, misses are cached too
+        """
+        return self._serializer_type_cache.info()
+
+    def data_format_cache_info(self) -> CacheInfo:
+        """
+        :return: hits, misses, evictions and size of the cache of serializers by data format
+        """
+        return self._serializer_data_format_cache.info()
+
     def reload_registry(self) -> None:
         for typ, serializer in self._serializer_registry.copy().items():
             priority = self._serializer_priorities[typ]
+            order = self._serializer_order[typ]
             self.unregister_serializer(serializer)
-            self.register_serializer(serializer, priority)
+            self._register(serializer, priority, order, invalidate_caches=False)
+        self._clear_caches()
+
+    def _load_plugins(self) -> None:
+        """
+        Adds serializers declared by plugins to the pending ones, serializers registered before are kept.
+        Called on the first lookup or the first call of register_serializer, unregister_serializer or is_registered,
+        so that serializers of plugins can be found, removed or checked like the built-in ones
+        """
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+        registered = {self.__key(typ) for typ in self._serializer_registry}
+        for order, entry in enumerate(plugins_manifest()):
+            key = (entry.module, entry.name)
+            if key in self._pending or key in registered:
+                _LOG.warning(f'Serializer {entry.module}.{entry.name} of a plugin has been already registered')
+                continue
+            self.__add_pending(entry, (_PLUGINS_GROUP, order))
+
+    def _load_pending(self, entries: Iterable[SerializerManifestEntry]) -> None:
+        """
+        Imports and registers serializers of the manifest. Caches are kept, since every lookup
+        loads all serializers that could match it before the result is cached.
+        Serializers that cannot be loaded are skipped with a warning and are not loaded again
+        """
+        for entry in list(entries):
+            order = self.__remove_pending(entry)
+            if order is None:  # loaded by a nested lookup
+                continue
+            try:
+                serializer = self._instantiate(entry.load())
+            except Exception as e:
+                _LOG.warning(f'Cannot load serializer {entry.module}.{entry.name}: {e}')
+                continue
+            priority = self._default_priority_stable if serializer.stable() else self._default_priority_unstable
+            self._register(serializer, priority, order, invalidate_caches=False)
+
+    def __add_pending(self, entry: SerializerManifestEntry, order: Tuple[int, int]) -> None:
+        self._pending[(entry.module, entry.name)] = order, entry
+        self._pending_index.add(entry, entry.type_matcher)
+        self._pending_data_formats[entry.data_format].append(entry)
+
+    def __remove_pending(self, entry: SerializerManifestEntry) -> Optional[Tuple[int, int]]:
+        pending = self._pending.pop((entry.module, entry.name), None)
+        if pending is None:
+            return None
+        self._pending_index.remove(entry)
+        self._pending_data_formats[entry.data_format].remove(entry)
+        return pending[0]
+
+    def __registration_order(self) -> Tuple[int, int]:
+        self._next_order += 1
+        return _REGISTERED_GROUP, self._next_order
+
+    @staticmethod
+    def __key(serializer_type: Type[Serializer]) -> Tuple[str, str]:
+        return serializer_type.__module__, serializer_type.__name__
+
+    def __ordered(self, serializers: Iterable[Serializer]) -> List[Serializer]:
+        return sorted(serializers, key=lambda serializer: self._serializer_order[type(serializer)])
+
+    def _clear_caches(self) -> None:
+        self._serializer_type_cache.clear()
+        self._serializer_data_format_cache.clear()
+        # schemas of generic types are built by other serializers from the registry
+        for serializer in self._serializer_registry.values():
+            serializer.clear_caches()
+
+    def _invalidate_caches(self, serializer: Serializer) -> None:
+        """
+        Drops cached lookups which results could change with registration or removal of the serializer:
+        lookups of types the serializer supports and lookups that depend on them.
+        Serializers of exact types are checked by equality, serializers with type matchers by matchers and predicates
+        of cached types they match. Caches are cleared for serializers without type matchers, since their predicates
+        would be called for every cached type
+        """
+        # schemas of generic types and plans of records are built by other serializers from the registry
+        for registered in self._serializer_registry.values():
+            registered.clear_caches()
+        self._serializer_data_format_cache.pop(serializer.data_format())
+
+        matcher = serializer.type_matcher()
+        try:
+            supported = serializer.supported_types()
+        except (ImportError, ModuleNotFoundError, AttributeError):
+            return  # lookups skip such serializers
+        # mypy issue: https://github.com/python/mypy/issues/3060
+        exact = isinstance(supported, Type)  # type: ignore
+        if matcher is None and not exact:
+            self._serializer_type_cache.clear()
+            return
+
+        index: _MatcherIndex[Serializer] = _MatcherIndex()
+        index.add(serializer, matcher)
+        affected: Dict[Any, bool] = {}
+
+        def is_affected(typ: Any) -> bool:
+            if typ not in affected:
+                if exact:
+                    affected[typ] = bool(supported == typ)
+                else:
+                    affected[typ] = len(index.match(typ)) > 0 and self.__supports(serializer, typ)
+            return affected[typ]
+
+        # predicates may look up other types and cache lookups, which are checked in the next rounds
+        checked: Dict[Any, _CachedLookup] = {}
+        while True:
+            entries = [(typ, cached) for typ, cached in self._serializer_type_cache.items()
+                       if checked.get(typ) is not cached]
+            if not entries:
+                break
+            for typ, cached in entries:
+                checked[typ] = cached
+                if is_affected(typ) or any(is_affected(dependency) for dependency in cached.dependencies):
+                    self._serializer_type_cache.pop(typ)
+
+    @staticmethod
+    def __supports(serializer: Serializer, typ: Any) -> bool:
+        try:
+            supported = serializer.supported_types()
+            # mypy issue: https://github.com/python/mypy/issues/3060
+            if isinstance(supported, Type):  # type: ignore
+                return bool(supported == typ)
+            return bool(supported(typ))
+        except (ImportError, ModuleNotFoundError, AttributeError):
+            return False
+
+    def _instantiate(self, class_value: Type[Serializer]) -> Serializer:
+        return _instantiate(class_value, self)
+
+    def freeze(self) -> 'FrozenSerializerRegistry':
+        """
+        Loads all serializers of the manifest and plugins and makes an immutable snapshot of the registry.
+        Serializers that look up other serializers are created anew with the snapshot. Other serializers are shared
+        with this registry to keep their options, e.g. file formats. Changes of this registry may clear their caches
+        of schemas and resolved types, which do not depend on registries, so lookups of the snapshot are not affected
+        :return: registry with precomputed lookups of types known by now
+        """
+        self._load_plugins()
+        self._load_pending([entry for _, entry in self._pending.values()])
+
+        serializers = sorted(self._serializer_registry.values(),
+                             key=lambda serializer: self._serializer_order[type(serializer)])
+        known_types: List[Any] = [typ for typ, _ in self._serializer_type_cache.items()]
+        for serializer in serializers:
+            matcher = serializer.type_matcher()
+            if matcher is not None:
+                known_types.extend(typ for typ in matcher.types if isinstance(typ, type))
+        known_types.extend(self._type_registry)
+        return FrozenSerializerRegistry(
+            [(serializer, self._serializer_priorities[type(serializer)]) for serializer in serializers], known_types)
 
     def _fetch_serializers_from(self, module: ModuleType) -> Iterable[Serializer]:
         stable_serializer_modules = dir(module)
@@ -163,16 +516,111 @@ class DefaultSerializerRegistry(SerializerRegistry):
                     class_value = getattr(module_value, class_attr)
                     if inspect.isclass(class_value) and not inspect.isabstract(class_value) and issubclass(class_value,
                                                                                                            Serializer):
-                        sig = inspect.signature(class_value)
-                        if len(sig.parameters) == 0:
-                            instance = class_value()
-                        elif len(sig.parameters) == 1 and issubclass(list(sig.parameters.values())[0].annotation,
-                                                                     SerializerRegistry):
-                            # noinspection PyArgumentList
-                            instance = class_value(self)  # type: ignore
-                        else:
-                            raise ValueError(
-                                f'Serializer {class_value.__name__} has unexpected arguments in __init__: '
-                                f'only empty arguments or SerializerRegistry are allowed')
-
-                        yield instance
+                        yield self._instantiate(class_value)
+
+
+class FrozenSerializerRegistry(SerializerRegistry):
+    """
+    Immutable registry made by DefaultSerializerRegistry.freeze(). Serializers of known types and data formats
+    are found by a single dict access, so lookups need neither locks nor cache invalidation.
+    Create it before forking, so child processes share the precomputed lookups.
+    Lookups of types unknown at freezing are memoized in a bounded LRU cache
+    """
+    TYPE_CACHE_SIZE = DefaultSerializerRegistry.TYPE_CACHE_SIZE
+
+    def __init__(self, serializers: Sequence[Tuple[Serializer, int]], known_types: Iterable[Any]):
+        """
+        :param serializers: serializers with their priorities in the order of registration
+        :param known_types: types which lookups are precomputed
+        """
+        self._serializers: Dict[Type[Serializer], Serializer] = {}
+        self._priorities: Dict[Type[Serializer], int] = {}
+        self._order: Dict[Type[Serializer], int] = {}
+        self._index: _MatcherIndex[Serializer] = _MatcherIndex()
+        self._type_registry: Dict[Type, List[Serializer]] = defaultdict(list)
+        self._by_data_format: Dict[str, Serializer] = {}
+
+        for order, (registered, priority) in enumerate(serializers):
+            serializer_type = type(registered)
+            serializer = _instantiate(serializer_type, self) if _takes_registry(serializer_type) else registered
+            self._serializers[serializer_type] = serializer
+            self._priorities[serializer_type] = priority
+            self._order[serializer_type] = order
+            self._index.add(serializer, serializer.type_matcher())
+            try:
+                # mypy issue: https://github.com/python/mypy/issues/3060
+                if isinstance(serializer.supported_types(), Type):  # type: ignore
+                    self._type_registry[cast(Type, serializer.supported_types())].append(serializer)
+            except (ImportError, ModuleNotFoundError, AttributeError):
+                pass
+
+            data_format = serializer.data_format()
+            current = self._by_data_format.get(data_format)
+            if current is None or priority < self._priorities[type(current)]:
+                self._by_data_format[data_format] = serializer
+
+        # lookups of known types are precomputed and never evicted
+        self._by_type: Dict[Any, Optional[Serializer]] = {}
+        self._unknown_types: LRUCache[Any, _CachedLookup] = LRUCache(self.TYPE_CACHE_SIZE)
+        # depth of lookups in progress, results of nested lookups may be incomplete for recursive types
+        self._lookups = threading.local()
+        self._frozen = False
+        for typ in known_types:
+            self.find_serializer_by_type(typ)
+        self._frozen = True
+
+    def register_serializer(self, serializer: Serializer, priority: Optional[int] = None) -> None:
+        raise TypeError('Frozen registry is immutable')
+
+    def unregister_serializer(self, serializer: Serializer) -> None:
+        raise TypeError('Frozen registry is immutable')
+
+    def is_registered(self, serializer: Serializer) -> bool:
+        return type(serializer) in self._serializers
+
+    @overload
+    def find_serializer_by_type(self, typ: object) -> Optional[Serializer]:
+        pass
+
+    @overload
+    def find_serializer_by_type(self, typ: Type) -> Optional[Serializer]:  # type: ignore[misc]
+        pass
+
+    def find_serializer_by_type(self, typ) -> Optional[Serializer]:
+        try:
+            return self._by_type[typ]
+        except KeyError:
+            cached = self._unknown_types.get(typ)
+            if cached is not None:
+                return cached.serializer
+            hashable = True
+        except TypeError:  # unhashable
+            hashable = False
+
+        depth = getattr(self._lookups, 'depth', 0)
+        self._lookups.depth = depth + 1
+        try:
+            try:
+                exact = self._type_registry.get(typ, [])
+            except TypeError:
+                exact = []
+            result = _select_serializer(typ, sorted(self._index.match(typ), key=lambda s: self._order[type(s)]),
+                                        exact, self._priorities)
+        finally:
+            self._lookups.depth = depth
+
+        if hashable and depth == 0:
+            if self._frozen:
+                self._unknown_types.put(typ, _CachedLookup(result, frozenset()))
+            else:
+                self._by_type[typ] = result
+        return result
+
+    def find_serializer_by_instance(self, obj: Any) -> Optional[Serializer]:
+        return self.find_serializer_by_type(get_type(obj))
+
+    def find_serializer_by_data_format(self, data_format: str) -> Optional[Serializer]:
+        return self._by_data_format.get(data_format)
+
+    def reload_registry(self) -> None:
+        raise TypeError('Frozen registry is immutable')
@@ -1,6 +1,9 @@
 import importlib
+import io
 import logging
+import mmap
 import os
+import pickle
 import shutil
 import tempfile
 from abc import ABC, abstractmethod
@@ -10,7 +13,7 @@ from typing import Dict, Type, BinaryIO, Any, Union, Callable, Optional, IO
 from packaging import version  # type: ignore
 
 from serialzy.types import get_type
-from serialzy.api import Schema, VersionBoundary
+from serialzy.api import Schema, TypeMatcher, VersionBoundary
 from serialzy.base import DefaultSchemaSerializerByReference
 from serialzy.utils import cached_installed_packages, module_name
 
@@ -71,6 +74,34 @@ def deserialize_from_dir(source: BinaryIO, read_from_dir) -> Any:
         return model
 
 
+def map_file(source: BinaryIO) -> Optional[mmap.mmap]:
+    """
+    :param source: source to map
+    :return: read-only memory map of the whole file if the source is a real file, None otherwise
+    """
+    try:
+        fileno = source.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    if os.fstat(fileno).st_size == 0:
+        return None
+    return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+def dump_pickle(obj: Any, dest: BinaryIO) -> None:
+    """
+    Pickles objects which have no binary form in the format of a library, e.g., arrays with object dtype.
+    Objects are pickled with cloudpickle when it is installed, as they were before the library got a serializer,
+    so they may reference local classes. Pickled objects are read with pickle.load
+    """
+    try:
+        import cloudpickle  # type: ignore
+    except ImportError:
+        pickle.dump(obj, dest, protocol=pickle.HIGHEST_PROTOCOL)
+        return
+    cloudpickle.dump(obj, dest)
+
+
 def unpack_model_file(source: IO[bytes], destination: Path) -> None:
     with destination.open("wb") as handle:
         __unpack_model(source, handle)
@@ -147,6 +178,9 @@ class ModelBaseSerializer(DefaultSchemaSerializerByReference, ABC):
     def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
         return lambda t: self.__check_module_fits_serializer(t) and self._types_filter(t)
 
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(modules=(self.module,))
+
     def _types_filter(self, typ: Type) -> bool:
         return False
 
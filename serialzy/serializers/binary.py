@@ -0,0 +1,87 @@
+import os
+import sys
+from array import array
+from typing import Any, BinaryIO, Callable, Dict, Optional, Type, Union
+
+from serialzy.api import TypeMatcher, VersionBoundary
+from serialzy.base import DefaultSchemaSerializerByReference
+from serialzy.serializers.base_model import map_file
+from serialzy.utils import read_into
+from serialzy.version import __version__
+
+
+class BytesSerializer(DefaultSchemaSerializerByReference):
+    """
+    Writes the raw buffer of bytes-like objects after its u64 length, arrays are prefixed with their typecode
+    and are written in little-endian byte order. Memoryviews are read as views of bytes
+    """
+    SUPPORTED_TYPES = (bytes, bytearray, memoryview, array)
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        view = memoryview(obj)
+        if isinstance(obj, array):
+            dest.write(obj.typecode.encode('ascii'))
+            if sys.byteorder == 'big' and obj.itemsize > 1:
+                swapped = array(obj.typecode, obj)
+                swapped.byteswap()
+                view = memoryview(swapped)
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+
+        dest.write(view.nbytes.to_bytes(length=8, byteorder='little', signed=False))
+        # the buffer of the object is written as is, without copying
+        dest.write(view.cast('B') if view.ndim > 0 else view.tobytes())
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        typecode = source.read(1).decode('ascii') if schema_type is array else None
+        size = int.from_bytes(source.read(8), byteorder='little', signed=False)
+
+        if schema_type is bytes:
+            data = source.read(size)
+            if len(data) != size:
+                raise EOFError(f'Unexpected end of data: read {len(data)} of {size} bytes')
+            return data
+
+        if schema_type is memoryview:
+            mapped = map_file(source)
+            if mapped is not None:
+                offset = source.tell()
+                source.seek(size, os.SEEK_CUR)
+                return memoryview(mapped)[offset:offset + size]
+
+        if typecode is not None:
+            itemsize = array(typecode).itemsize
+            if size % itemsize != 0:
+                raise ValueError(f'Invalid size {size} of array with typecode {typecode}')
+            # preallocate the array and read data into its buffer
+            result = array(typecode, bytes(itemsize)) * (size // itemsize)
+            read_into(source, result)
+            if sys.byteorder == 'big' and result.itemsize > 1:
+                result.byteswap()
+            return result
+
+        buffer = bytearray(size)
+        read_into(source, buffer)
+        return memoryview(buffer) if schema_type is memoryview else buffer
+
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: t in self.SUPPORTED_TYPES
+
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=self.SUPPORTED_TYPES)
+
+    def available(self) -> bool:
+        return True
+
+    def stable(self) -> bool:
+        return True
+
+    def data_format(self) -> str:
+        return "raw_bytes"
+
+    def meta(self) -> Dict[str, str]:
+        return {'serialzy': __version__}
+
+    def requirements(self) -> Dict[str, VersionBoundary]:
+        return {}
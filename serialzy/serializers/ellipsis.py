@@ -1,7 +1,7 @@
 import sys
 from typing import Any, BinaryIO, Type, Optional, Union, Callable, Dict
 
-from serialzy.api import VersionBoundary, Serializer, Schema, StandardSchemaFormats
+from serialzy.api import VersionBoundary, Serializer, Schema, StandardSchemaFormats, TypeMatcher
 from serialzy.version import __version__
 
 
@@ -19,6 +19,9 @@ class EllipsisSerializer(Serializer):
         # noinspection PyTypeChecker
         return lambda x: x == Ellipsis  # type: ignore
 
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=(Ellipsis,))
+
     def available(self) -> bool:
         return True
 
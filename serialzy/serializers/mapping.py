@@ -0,0 +1,158 @@
+import dataclasses
+import json
+import logging
+from abc import ABC
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union, cast
+
+from packaging import version  # type: ignore
+from typing_extensions import get_args, get_origin
+
+from serialzy.api import Schema, Serializer, SerializerRegistry, TypeMatcher, VersionBoundary
+from serialzy.serializers.sequence import SequenceSerializerBase
+from serialzy.types import EmptyContent, get_type
+from serialzy.utils import cached_installed_packages
+from serialzy.version import __version__
+
+_LOG = logging.getLogger(__name__)
+
+
+class LazyDict(Mapping[Any, Any]):
+    """
+    Read-only mapping over serialized dict: keys are deserialized eagerly, values are deserialized on access
+    """
+
+    def __init__(self, keys: Sequence[Any], values: Sequence[Any]):
+        self._indices = {key: i for i, key in enumerate(keys)}
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._values[self._indices[key]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+
+class DictSerializerBase(Serializer, ABC):
+    """
+    Writes keys and values of a dict as two lists, so they are packed into blocks or share schemas
+    the same way as elements of sequences
+    """
+    SCHEMA_FORMAT = "serialzy_dict_schema"
+
+    LAZY_CACHE_SIZE = SequenceSerializerBase.LAZY_CACHE_SIZE
+
+    def __init__(self, registry: SerializerRegistry):
+        self._registry = registry
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        key_type, value_type = self.__args(get_type(obj))
+        self.__list_serializer(key_type)._serialize_typed(list(obj.keys()), List[key_type], dest)  # type: ignore
+        self.__list_serializer(value_type)._serialize_typed(list(obj.values()), List[value_type], dest)  # type: ignore
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        key_type, value_type = self.__args(schema_type)
+        keys = self.__list_serializer(key_type)._deserialize(source, List[key_type])  # type: ignore
+        values = self.__list_serializer(value_type)._deserialize(source, List[value_type])  # type: ignore
+        return dict(zip(keys, values))
+
+    def deserialize_lazy(self, source: BinaryIO, typ: Optional[Type] = None,
+                         cache_size: int = LAZY_CACHE_SIZE) -> Mapping[Any, Any]:
+        """
+        :param source: seekable buffer or file with serialized data, must stay open while the result is used
+        :param typ: type of the resulting object, fetched from the header if None
+        :param cache_size: max number of deserialized values kept by the result
+        :return: mapping that deserializes values on access, or fully deserialized values
+        if the source is not seekable or values are packed into a block
+        """
+        schema_type = self._deserialize_type(source)
+        self._check_types_valid(schema_type, typ)
+        key_type, value_type = self.__args(schema_type)
+        keys = self.__list_serializer(key_type)._deserialize(source, List[key_type])  # type: ignore
+        values = self.__list_serializer(value_type)._deserialize_lazy(
+            source, List[value_type], cache_size)  # type: ignore
+        return LazyDict(keys, values)
+
+    def __list_serializer(self, typ: Type) -> SequenceSerializerBase:
+        serializer = self._registry.find_serializer_by_type(List[typ])  # type: ignore
+        if not isinstance(serializer, SequenceSerializerBase):
+            raise TypeError(f'Cannot find sequence serializer for list of {typ}')
+        return serializer
+
+    @staticmethod
+    def __args(typ: Type) -> Tuple[Type, Type]:
+        args: Tuple[Any, ...] = get_args(typ)
+        return args[0], args[1]
+
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=(dict,))
+
+    def available(self) -> bool:
+        return True
+
+    def meta(self) -> Dict[str, str]:
+        return {'serialzy': __version__}
+
+    def schema(self, typ: Type) -> Schema:
+        args: Tuple[Type, ...] = get_args(typ)
+        schema_dict = {
+            "args": [dataclasses.asdict(cast(Serializer, self._registry.find_serializer_by_type(arg)).schema(arg)) for
+                     arg in args]
+        }
+        return Schema(self.data_format(), self.SCHEMA_FORMAT, json.dumps(schema_dict), self.meta())
+
+    def resolve(self, schema: Schema) -> Type:
+        # do not check data format here to allow dict deserialization by both stable and unstable serializers
+        if schema.schema_format != self.SCHEMA_FORMAT:
+            raise ValueError(f'Invalid schema format {schema.schema_format}')
+
+        if 'serialzy' not in schema.meta:
+            _LOG.warning('No serialzy version in meta')
+        elif version.parse(schema.meta['serialzy']) > version.parse(cached_installed_packages["serialzy"]):
+            _LOG.warning(f'Installed version of serialzy {cached_installed_packages["serialzy"]} '
+                         f'is older than used for serialization {schema.meta["serialzy"]}')
+
+        schemas = [Schema(**arg) for arg in json.loads(schema.schema_content)["args"]]
+        key_type, value_type = (
+            cast(Serializer, self._registry.find_serializer_by_data_format(s.data_format)).resolve(s) for s in schemas)
+        return Dict[key_type, value_type]  # type: ignore
+
+    def requirements(self) -> Dict[str, VersionBoundary]:
+        return {}
+
+    def _check_args(self, args: Tuple[Any, ...], stable: bool) -> bool:
+        if len(args) != 2:
+            return False
+        elif args[0] == EmptyContent:
+            return True
+
+        for arg in args:
+            serializer = self._registry.find_serializer_by_type(arg)
+            if serializer is None or not serializer.available() or (stable and not serializer.stable()):
+                return False
+        return True
+
+
+class DictSerializerStable(DictSerializerBase):
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: get_origin(t) is dict and self._check_args(get_args(t), stable=True)
+
+    def stable(self) -> bool:
+        return True
+
+    def data_format(self) -> str:
+        return "serialzy_dict_stable"
+
+
+class DictSerializerUnstable(DictSerializerBase):
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: get_origin(t) is dict and self._check_args(get_args(t), stable=False)
+
+    def stable(self) -> bool:
+        return False
+
+    def data_format(self) -> str:
+        return "serialzy_dict_unstable"
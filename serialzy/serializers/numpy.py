@@ -0,0 +1,99 @@
+import io
+import os
+import pickle
+from pathlib import Path
+from typing import BinaryIO, Union, Type, Optional, Any, cast
+
+from serialzy.errors import SerialzyError
+from serialzy.serializers.base_model import ModelBaseSerializer, dump_pickle, unpack_model_file
+from serialzy.utils import read_into
+
+
+# noinspection PyPackageRequirements
+class NumpySerializer(ModelBaseSerializer):
+    """
+    Writes arrays and numpy scalars in the .npy format: the header with dtype, shape and order is followed
+    by the raw buffer of the array. Scalars are written as 0-d arrays.
+    Arrays with object dtype have no raw buffer, they are pickled after their own marker instead of the .npy magic
+    """
+    # arrays of at least this size are memory-mapped when they are read from a real file
+    MMAP_THRESHOLD = 1 << 20
+    # same length as the .npy magic with version, so the payload kind is known after one read
+    PICKLE_MAGIC = b'\x93PICKLE\x01'
+
+    def __init__(self):
+        super().__init__("numpy", __name__)
+
+    def unpack_model(self, source: BinaryIO, dest_dir: Union[str, os.PathLike]) -> os.PathLike:
+        model_path = Path(dest_dir) / "array.npy"
+        unpack_model_file(source, model_path)
+        return model_path
+
+    def _types_filter(self, typ: Type) -> bool:
+        import numpy as np  # type: ignore
+        return typ is np.ndarray or (isinstance(typ, type) and issubclass(typ, np.generic))
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        import numpy as np  # type: ignore
+        array = np.asarray(obj)
+        if array.dtype.hasobject:
+            dest.write(self.PICKLE_MAGIC)
+            dump_pickle(obj, dest)
+            return
+        if not array.flags.c_contiguous and not array.flags.f_contiguous:
+            array = np.ascontiguousarray(array)
+
+        header = np.lib.format.header_data_from_array_1_0(array)
+        try:
+            np.lib.format.write_array_header_1_0(dest, header)
+        except ValueError:
+            np.lib.format.write_array_header_2_0(dest, header)
+        # raveling of a contiguous array in memory order is a view, so the buffer is written without a copy
+        dest.write(array.ravel(order='K').view(np.uint8).data)
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        import numpy as np  # type: ignore
+
+        magic = source.read(len(self.PICKLE_MAGIC))
+        if magic == self.PICKLE_MAGIC:
+            return pickle.load(source)
+        if len(magic) != len(self.PICKLE_MAGIC) or not magic.startswith(np.lib.format.MAGIC_PREFIX):
+            raise SerialzyError(f'Invalid magic string {magic!r} of {__name__} data')
+
+        major = magic[-2]
+        if major == 1:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(source)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(source)
+        if dtype.hasobject:
+            raise SerialzyError(f'Arrays with object dtype {dtype} cannot be deserialized with {__name__}')
+        order: Any = 'F' if fortran_order else 'C'
+
+        array = self.__mmap(source, shape, order, dtype)
+        if array is None:
+            array = np.empty(shape, dtype=dtype, order=order)
+            read_into(source, array.ravel(order='K').view(np.uint8).data)
+
+        if schema_type is np.ndarray:
+            return array
+        return array[()]
+
+    def __mmap(self, source: BinaryIO, shape: Any, order: Any, dtype: Any) -> Optional[Any]:
+        import numpy as np  # type: ignore
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        if nbytes < self.MMAP_THRESHOLD:
+            return None
+        try:
+            source.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+        offset = source.tell()
+        # copy-on-write mapping: the array is writable and the file is never modified
+        array = np.memmap(cast(Any, source), dtype=dtype, mode='c', offset=offset, shape=shape, order=order)
+        source.seek(offset + nbytes)
+        return array.view(np.ndarray)
+
+    def data_format(self) -> str:
+        return "npy"
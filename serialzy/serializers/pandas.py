@@ -0,0 +1,153 @@
+import importlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Sequence, Type, Union, cast
+
+from serialzy.api import VersionBoundary
+from serialzy.serializers.base_model import ModelBaseSerializer, dump_pickle, map_file, unpack_model_file
+from serialzy.serializers.pyarrow import open_ipc_stream, write_ipc_stream
+
+
+# noinspection PyPackageRequirements
+class PandasSerializer(ModelBaseSerializer):
+    """
+    Writes DataFrames and Series as Arrow IPC stream or Parquet. Index and dtypes are kept in the pandas metadata
+    of the Arrow schema, so the result does not depend on the pandas version used for serialization.
+    Frames which cannot be converted to Arrow, e.g., with duplicate column names or mixed object columns, are pickled
+    """
+    ARROW_IPC = 'arrow'
+    PARQUET = 'parquet'
+
+    # payload starts with one of these bytes
+    ARROW_IPC_PAYLOAD = b'a'  # followed by Arrow IPC stream, which is self-delimited
+    PARQUET_PAYLOAD = b'p'  # followed by u64 length of parquet file and the file
+    PICKLE_PAYLOAD = b'c'  # followed by pickled DataFrame or Series
+
+    # Series without name are written as a column with this name
+    UNNAMED_SERIES = '__serialzy_series__'
+
+    def __init__(self, file_format: str = ARROW_IPC):
+        super().__init__("pandas", __name__)
+        if file_format not in (self.ARROW_IPC, self.PARQUET):
+            raise ValueError(f'Invalid file format {file_format}, expected {self.ARROW_IPC} or {self.PARQUET}')
+        self.file_format = file_format
+
+    def available(self) -> bool:
+        # noinspection PyBroadException
+        try:
+            importlib.import_module("pyarrow")
+        except Exception:
+            return False
+        return super().available()
+
+    def meta(self) -> Dict[str, str]:
+        import pyarrow  # type: ignore
+        return {**super().meta(), "pyarrow": pyarrow.__version__}
+
+    def requirements(self) -> Dict[str, VersionBoundary]:
+        return {**super().requirements(), "pyarrow": VersionBoundary()}
+
+    def unpack_model(self, source: BinaryIO, dest_dir: Union[str, os.PathLike]) -> os.PathLike:
+        kind = source.read(1)
+        if kind == self.PARQUET_PAYLOAD:
+            source.read(8)
+            model_path = Path(dest_dir) / "data.parquet"
+        elif kind == self.PICKLE_PAYLOAD:
+            model_path = Path(dest_dir) / "data.pkl"
+        else:
+            model_path = Path(dest_dir) / "data.arrows"
+        unpack_model_file(source, model_path)
+        return model_path
+
+    def _types_filter(self, typ: Type) -> bool:
+        import pandas as pd  # type: ignore
+        return typ in (pd.DataFrame, pd.Series)
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        import pandas as pd  # type: ignore
+        import pyarrow as pa  # type: ignore
+
+        frame = obj
+        if isinstance(obj, pd.Series):
+            frame = obj.to_frame(name=self.UNNAMED_SERIES if obj.name is None else obj.name)
+        try:
+            table = pa.Table.from_pandas(frame)
+        except (pa.ArrowException, ValueError):
+            dest.write(self.PICKLE_PAYLOAD)
+            dump_pickle(obj, dest)
+            return
+
+        if self.file_format == self.PARQUET:
+            import pyarrow.parquet as pq  # type: ignore
+            sink = pa.BufferOutputStream()
+            pq.write_table(table, sink)
+            data = sink.getvalue()
+            dest.write(self.PARQUET_PAYLOAD)
+            dest.write(data.size.to_bytes(8, byteorder='little', signed=False))
+            dest.write(cast(bytes, data))
+            return
+
+        dest.write(self.ARROW_IPC_PAYLOAD)
+        write_ipc_stream(dest, table.schema, iter(table.to_batches()))
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        return self.__to_pandas(self.__read_table(source, None), schema_type)
+
+    def deserialize_columns(self, source: BinaryIO, columns: Sequence[str], typ: Optional[Type] = None) -> Any:
+        """
+        :param source: buffer or file with serialized DataFrame
+        :param columns: names of columns to read, the index is always read
+        :param typ: type of the resulting object, fetched from the header if None
+        :return: DataFrame with the given columns only
+        """
+        schema_type = self._deserialize_type(source)
+        self._check_types_valid(schema_type, typ)
+        return self.__to_pandas(self.__read_table(source, columns), schema_type)
+
+    def __read_table(self, source: BinaryIO, columns: Optional[Sequence[str]]) -> Any:
+        import pyarrow as pa  # type: ignore
+
+        kind = source.read(1)
+        if kind == self.PICKLE_PAYLOAD:
+            # pickled objects are already DataFrames or Series
+            obj = pickle.load(source)
+            return obj if columns is None else obj[list(columns)]
+        if kind == self.PARQUET_PAYLOAD:
+            import pyarrow.parquet as pq  # type: ignore
+            length = int.from_bytes(source.read(8), byteorder='little', signed=False)
+            mapped = map_file(source)
+            if mapped is not None:
+                data = pa.py_buffer(mapped).slice(source.tell(), length)
+                source.seek(length, os.SEEK_CUR)
+            else:
+                data = pa.py_buffer(source.read(length))
+            return pq.read_table(pa.BufferReader(data), columns=columns, use_pandas_metadata=True)
+
+        if kind != self.ARROW_IPC_PAYLOAD:
+            raise ValueError(f'Invalid payload kind {kind!r}')
+        reader, finish = open_ipc_stream(source)
+        table = reader.read_all()
+        finish()
+
+        if columns is not None:
+            index_columns = [c for c in table.schema.pandas_metadata['index_columns'] if isinstance(c, str)]
+            table = table.select([*columns, *(c for c in index_columns if c not in columns)])
+        return table
+
+    def __to_pandas(self, table: Any, schema_type: Type) -> Any:
+        import pandas as pd  # type: ignore
+
+        if isinstance(table, (pd.DataFrame, pd.Series)):
+            return table
+        frame = table.to_pandas()
+        if schema_type is pd.Series:
+            series = frame.iloc[:, 0]
+            if series.name == self.UNNAMED_SERIES:
+                series.name = None
+            return series
+        return frame
+
+    def data_format(self) -> str:
+        return "pandas_arrow"
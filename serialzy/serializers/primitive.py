@@ -1,31 +1,167 @@
 import logging
-from typing import Any, BinaryIO, Callable, Dict, Type, Union, Optional
+import struct
+import sys
+from array import array
+from typing import Any, BinaryIO, Callable, Dict, List, Sequence, Type, Union, Optional
 
-from serialzy.api import StandardDataFormats, VersionBoundary
+from serialzy.api import BlockSerializer, StandardDataFormats, TypeMatcher, VersionBoundary
 from serialzy.base import DefaultSchemaSerializerByReference
 from serialzy.version import __version__
 
 _LOG = logging.getLogger(__name__)
 
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _int_to_bytes(value: int) -> bytes:
+    """
+    :return: u32 length and little-endian two's complement bytes of the value
+    """
+    bit_length = value.bit_length() if value >= 0 else (~value).bit_length()
+    length = bit_length // 8 + 1
+    return length.to_bytes(length=4, byteorder='little', signed=False) + value.to_bytes(
+        length=length, byteorder='little', signed=True)
+
+
+def _packed(typecode: str, objs: Sequence[Any]) -> array:
+    packed = array(typecode, objs)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed
+
+
+def _unpacked(typecode: str, data: Union[bytes, memoryview]) -> List[Any]:
+    packed = array(typecode)
+    packed.frombytes(data)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _pack_strs(objs: Sequence[str]) -> bytes:
+    """
+    :return: u64 lengths of utf-8 encoded strings followed by the strings
+    """
+    encoded = [x.encode('utf-8') for x in objs]
+    return _packed('Q', [len(x) for x in encoded]).tobytes() + b''.join(encoded)
+
+
+def _unpack_strs(data: Union[bytes, memoryview], count: int) -> List[str]:
+    result: List[str] = []
+    offset = 8 * count
+    for length in _unpacked('Q', data[:offset]):
+        result.append(str(data[offset:offset + length], 'utf-8'))
+        offset += length
+    return result
+
 
 # noinspection PyPackageRequirements
-class PrimitiveSerializer(DefaultSchemaSerializerByReference):
+class PrimitiveSerializer(DefaultSchemaSerializerByReference, BlockSerializer):
+    # kinds of packed blocks of sequence elements
+    INT64_BLOCK = b'q'
+    BIG_INT_BLOCK = b'i'  # ints are written one by one as length-prefixed two's complement bytes
+    FLOAT64_BLOCK = b'd'
+    BOOL_BLOCK = b'?'
+    STR_BLOCK = b's'  # u64 lengths of utf-8 encoded strings followed by the strings
+
+    # binary payloads of ints, floats and bools start with a zero byte, text representations never do
+    BINARY_PAYLOAD_MARKER = b'\x00'
+    BINARY_PAYLOAD_VERSION = 1
+
     def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        typ = type(obj)
+        if typ in (int, float, bool):
+            dest.write(self.BINARY_PAYLOAD_MARKER)
+            dest.write(bytes((self.BINARY_PAYLOAD_VERSION,)))
+            if typ == bool:
+                dest.write(b'\x01' if obj else b'\x00')
+            elif typ == float:
+                dest.write(struct.pack('<d', obj))
+            else:
+                dest.write(_int_to_bytes(obj))
+            return
+
         dumps = str(obj).encode("utf-8")
         dest.write(dumps)
 
     def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
         self._check_types_valid(schema_type, user_type)
-        read = source.read().decode("utf-8")
+        data = source.read()
+        if schema_type in (int, float, bool) and data[:1] == self.BINARY_PAYLOAD_MARKER:
+            return self.__from_binary(data, schema_type)
+
+        # text representation
+        read = data.decode("utf-8")
         if schema_type == type(None):  # noqa
             return None
         elif schema_type == bool:
             return read == "True"
         return schema_type(read)
 
+    def __from_binary(self, data: bytes, schema_type: Type) -> Any:
+        version = data[1]
+        if version > self.BINARY_PAYLOAD_VERSION:
+            raise ValueError(f'Unsupported primitive payload version {version}')
+
+        if schema_type == bool:
+            return data[2] == 1
+        elif schema_type == float:
+            return struct.unpack_from('<d', data, 2)[0]
+        length = int.from_bytes(data[2:6], byteorder='little', signed=False)
+        return int.from_bytes(data[6:6 + length], byteorder='little', signed=True)
+
+    def _supports_block(self, typ: Type) -> bool:
+        return typ in (int, float, bool, str)
+
+    def _serialize_block(self, objs: Sequence[Any], typ: Type, dest: BinaryIO) -> None:
+        data: Union[bytes, array]
+        if typ == str:
+            kind, data = self.STR_BLOCK, _pack_strs(objs)
+        elif typ == bool:
+            kind, data = self.BOOL_BLOCK, bytes(objs)
+        elif typ == float:
+            kind, data = self.FLOAT64_BLOCK, _packed('d', objs)
+        elif len(objs) == 0 or (min(objs) >= _INT64_MIN and max(objs) <= _INT64_MAX):
+            kind, data = self.INT64_BLOCK, _packed('q', objs)
+        else:
+            kind, data = self.BIG_INT_BLOCK, b''.join(_int_to_bytes(x) for x in objs)
+
+        dest.write(kind)
+        dest.write(memoryview(data).nbytes.to_bytes(length=8, byteorder='little', signed=False))
+        dest.write(data)
+
+    def _deserialize_block(self, source: BinaryIO, typ: Type, count: int) -> List[Any]:
+        kind = source.read(1)
+        size = int.from_bytes(source.read(8), byteorder='little', signed=False)
+        data = source.read(size)
+
+        if kind == self.BOOL_BLOCK:
+            return [x == 1 for x in data]
+        elif kind == self.FLOAT64_BLOCK:
+            return _unpacked('d', data)
+        elif kind == self.INT64_BLOCK:
+            return _unpacked('q', data)
+        elif kind == self.STR_BLOCK:
+            return _unpack_strs(data, count)
+        elif kind == self.BIG_INT_BLOCK:
+            result: List[Any] = []
+            view = memoryview(data)
+            offset = 0
+            for _ in range(count):
+                length = int.from_bytes(view[offset:offset + 4], byteorder='little', signed=False)
+                offset += 4
+                result.append(int.from_bytes(view[offset:offset + length], byteorder='little', signed=True))
+                offset += length
+            return result
+        raise ValueError(f'Unknown block kind {kind!r}')
+
     def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
         return lambda t: t in [int, float, str, bool, type(None)]
 
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=(int, float, str, bool, type(None)))
+
     def available(self) -> bool:
         return True
 
@@ -1,5 +1,6 @@
 import logging
 import inspect
+import sys
 from typing import Any, BinaryIO, Callable, Dict, Type, Union, Optional
 
 from serialzy.api import StandardDataFormats, Schema, VersionBoundary
@@ -64,6 +65,10 @@ class ProtoMessageSerializer(DefaultSchemaSerializerByValue):
         return {'pure-protobuf': VersionBoundary()}
 
     def _check_is_message(self, obj: Any) -> bool:
+        # messages are registered as virtual subclasses of Message, so they cannot be matched by base classes,
+        # but there are no messages until pure_protobuf is imported
+        if 'pure_protobuf.dataclasses_' not in sys.modules:
+            return False
         from pure_protobuf.dataclasses_ import Message  # type: ignore
         try:
             return inspect.isclass(obj) and issubclass(obj, Message)
@@ -0,0 +1,88 @@
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Tuple, Type, Union
+
+from serialzy.serializers.base_model import ModelBaseSerializer, map_file, unpack_model_file
+
+
+# noinspection PyPackageRequirements
+def write_ipc_stream(dest: BinaryIO, schema: Any, batches: Iterator[Any]) -> None:
+    """
+    Writes record batches one by one in the Arrow IPC stream format
+    :param dest: destination of the stream, it is not closed
+    :param schema: schema of the batches
+    :param batches: batches to write
+    """
+    import pyarrow as pa  # type: ignore
+    with pa.ipc.new_stream(pa.PythonFile(dest, mode='w'), schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+# noinspection PyPackageRequirements
+def open_ipc_stream(source: BinaryIO) -> Tuple[Any, Callable[[], None]]:
+    """
+    :param source: source with the Arrow IPC stream at the current position
+    :return: reader of the stream and a function that moves the source to the end of the stream after reading.
+    Real files are memory-mapped, so batches reference the mapped file and nothing is copied while reading
+    """
+    import pyarrow as pa  # type: ignore
+    mapped = map_file(source)
+    if mapped is None:
+        return pa.ipc.open_stream(pa.PythonFile(source, mode='r')), lambda: None
+
+    offset = source.tell()
+    reader = pa.BufferReader(pa.py_buffer(mapped).slice(offset))
+
+    def finish() -> None:
+        source.seek(offset + reader.tell())
+
+    return pa.ipc.open_stream(reader), finish
+
+
+# noinspection PyPackageRequirements
+class PyarrowSerializer(ModelBaseSerializer):
+    def __init__(self):
+        super().__init__("pyarrow", __name__)
+
+    def unpack_model(self, source: BinaryIO, dest_dir: Union[str, os.PathLike]) -> os.PathLike:
+        model_path = Path(dest_dir) / "data.arrows"
+        unpack_model_file(source, model_path)
+        return model_path
+
+    def _types_filter(self, typ: Type) -> bool:
+        import pyarrow as pa  # type: ignore
+        return typ in (pa.Table, pa.RecordBatch)
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        import pyarrow as pa  # type: ignore
+        batches = obj.to_batches() if isinstance(obj, pa.Table) else [obj]
+        write_ipc_stream(dest, obj.schema, iter(batches))
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        import pyarrow as pa  # type: ignore
+
+        reader, finish = open_ipc_stream(source)
+        table = reader.read_all()
+        finish()
+        if schema_type is pa.RecordBatch:
+            batches = table.combine_chunks().to_batches()
+            return batches[0] if batches else pa.RecordBatch.from_pylist([], schema=table.schema)
+        return table
+
+    def iter_deserialize(self, source: BinaryIO, typ: Optional[Type] = None) -> Iterator[Any]:
+        """
+        :param source: buffer or file with serialized Table or RecordBatch
+        :param typ: type of the serialized object, fetched from the header if None
+        :return: iterator over record batches, the whole table is never materialized
+        """
+        schema_type = self._deserialize_type(source)
+        self._check_types_valid(schema_type, typ)
+
+        reader, finish = open_ipc_stream(source)
+        yield from reader
+        finish()
+
+    def data_format(self) -> str:
+        return "arrow"
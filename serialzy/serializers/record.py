@@ -0,0 +1,423 @@
+import dataclasses
+import importlib
+import json
+import logging
+import threading
+import typing
+from abc import ABC
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
+
+from packaging import version  # type: ignore
+from typing_extensions import get_args, get_origin
+
+from serialzy.api import BlockSerializer, Schema, Serializer, SerializerRegistry, VersionBoundary
+from serialzy.serializers.sequence import SequenceSerializerBase, _FrameWriter, _read_int, _read_str, _write_str
+from serialzy.types import get_type
+from serialzy.utils import BoundedReader, LRUCache, cached_installed_packages
+from serialzy.version import __version__
+
+_LOG = logging.getLogger(__name__)
+
+
+def _is_record(typ: Any) -> bool:
+    """
+    :return: True for dataclasses and NamedTuples that can be referenced by module and name
+    """
+    # nested and local classes cannot be resolved, classes of __main__ cannot be resolved in other processes
+    if not isinstance(typ, type) or typ.__qualname__ != typ.__name__ or typ.__module__ == '__main__':
+        return False
+    return dataclasses.is_dataclass(typ) or (issubclass(typ, tuple) and hasattr(typ, '_fields')
+                                             and hasattr(typ, '_make'))
+
+
+def _record_fields(typ: Any) -> Optional[Tuple[Tuple[str, ...], Tuple[Any, ...]]]:
+    """
+    :return: names and annotated types of fields of a dataclass or a typed NamedTuple, None for other types
+    """
+    if not _is_record(typ):
+        return None
+    if dataclasses.is_dataclass(typ):
+        names = tuple(f.name for f in dataclasses.fields(typ))
+    else:
+        names = typ._fields
+
+    try:
+        hints = typing.get_type_hints(typ)
+    except Exception:  # noqa
+        return None
+    if any(name not in hints for name in names):
+        return None
+    return names, tuple(hints[name] for name in names)
+
+
+def _without_none(typ: Any) -> Any:
+    """
+    :return: X for Optional[X], otherwise the type itself
+    """
+    if get_origin(typ) is Union:
+        args = tuple(arg for arg in get_args(typ) if arg is not type(None))  # noqa
+        if len(args) == 1:
+            return args[0]
+    return typ
+
+
+class _RecordPlan:
+    """
+    Codec of a record type built once: serializers of fields are found in the registry when the plan is built
+    """
+
+    def __init__(self, typ: Type, names: Tuple[str, ...], types: Tuple[Any, ...], serializers: Tuple[Serializer, ...],
+                 list_serializers: Tuple[SequenceSerializerBase, ...], flags_serializer: SequenceSerializerBase,
+                 lengths_serializer: SequenceSerializerBase):
+        self.typ = typ
+        self.names = names
+        self.types = types
+        self.serializers = serializers
+        # serializers of lists of field values, bools and ints write columns of record blocks
+        self.list_serializers = list_serializers
+        self.flags_serializer = flags_serializer
+        self.lengths_serializer = lengths_serializer
+        self.is_tuple = issubclass(typ, tuple)
+        self.has_dict = hasattr(typ, '__dict__') and '__slots__' not in typ.__dict__
+        # values of fields with non-generic types are checked by the exact type, others by the inferred type
+        self.exact = tuple(get_origin(t) is None for t in types)
+
+    def matches(self, index: int, value: Any) -> bool:
+        if self.exact[index]:
+            return type(value) is self.types[index]
+        return bool(get_type(value) == self.types[index])
+
+    def values(self, obj: Any) -> Sequence[Any]:
+        if self.is_tuple:
+            return cast(Sequence[Any], obj)
+        return [getattr(obj, name) for name in self.names]
+
+    def extras(self, obj: Any) -> Dict[str, Any]:
+        """
+        :return: attributes of the instance which are not fields, e.g. set in __post_init__
+        """
+        if not self.has_dict:
+            return {}
+        return {name: value for name, value in vars(obj).items() if name not in self.names}
+
+    def make(self, values: Sequence[Any], extras: Optional[Dict[str, Any]] = None) -> Any:
+        if self.is_tuple:
+            return self.typ._make(values)  # type: ignore
+        # like pickle, __init__ is not called
+        obj = object.__new__(self.typ)
+        if self.has_dict:
+            obj.__dict__.update(zip(self.names, values))
+            if extras:
+                obj.__dict__.update(extras)
+        else:
+            for name, value in zip(self.names, values):
+                object.__setattr__(obj, name, value)
+        return obj
+
+
+class RecordSerializerBase(BlockSerializer, ABC):
+    """
+    Writes dataclasses and typed NamedTuples field by field. Values that match annotated types of fields are written
+    by serializers of the annotations without headers, other values are written with their own headers.
+    Attributes of instances which are not fields follow the fields as a dict with its header.
+    Lists of records are written column-wise, one list per field
+    """
+    SCHEMA_FORMAT = "serialzy_record_schema"
+
+    # every field value starts with one of these bytes
+    VALUE = 0  # u64 length and payload written by the serializer of the field annotation
+    NONE = 1  # None without payload
+    SELF_DESCRIBED = 2  # u64 length, data format and the value with header
+
+    # flags of columns of record blocks, every column is written as lists
+    NULLS_COLUMN = 1  # list of flags of present values, followed by the present values
+    FLATTENED_COLUMN = 2  # list values are written as list of their lengths and list of their elements
+
+    PLAN_CACHE_SIZE = 256
+
+    def __init__(self, registry: SerializerRegistry):
+        self._registry = registry
+        # plans of record types with types which serializers were looked up to build them
+        self._plans: LRUCache[Type, Tuple[Optional[_RecordPlan], Tuple[Any, ...]]] = LRUCache(self.PLAN_CACHE_SIZE)
+        self._building = threading.local()
+
+    def clear_caches(self) -> None:
+        super().clear_caches()
+        self._plans.clear()
+
+    def _plan(self, typ: Type) -> Optional[_RecordPlan]:
+        """
+        :return: codec of the record type, None if the type is not a record or fields have no serializers
+        """
+        # the predicate runs for every looked up type, plans of other types are not cached
+        if not _is_record(typ):
+            return None
+        cached = self._plans.get(typ)
+        if cached is not None:
+            plan, dependencies = cached
+            # the cached plan stands for lookups of serializers of fields, so they are reported to the registry
+            self._registry._add_lookup_dependencies(dependencies)
+            return plan
+
+        # types whose plans are being built mapped to whether they are referenced from their own fields
+        building: Dict[Type, bool] = self._building.__dict__.setdefault('types', {})
+        if typ in building:
+            building[typ] = True
+            return None
+        building[typ] = False
+        looked_up: List[Any] = []
+        try:
+            plan = self.__build_plan(typ, looked_up)
+        finally:
+            # recursive records are not supported
+            if building.pop(typ):
+                plan = None
+
+        self._plans.put(typ, (plan, tuple(looked_up)))
+        return plan
+
+    def __build_plan(self, typ: Type, dependencies: List[Any]) -> Optional[_RecordPlan]:
+        """
+        :param dependencies: types which serializers are looked up are appended to the list
+        """
+        fields = _record_fields(typ)
+        if fields is None:
+            return None
+
+        def find(t: Any) -> Optional[Serializer]:
+            dependencies.append(t)
+            return self._registry.find_serializer_by_type(t)
+
+        names, annotations = fields
+        types = tuple(_without_none(t) for t in annotations)
+        flags_serializer = find(List[bool])
+        lengths_serializer = find(List[int])
+        if not isinstance(flags_serializer, SequenceSerializerBase):
+            return None
+        if not isinstance(lengths_serializer, SequenceSerializerBase):
+            return None
+
+        serializers = []
+        list_serializers = []
+        for field_type in types:
+            serializer = find(field_type)
+            list_serializer = find(List[field_type])  # type: ignore
+            if serializer is None or not serializer.available():
+                return None
+            if not isinstance(list_serializer, SequenceSerializerBase):
+                return None
+            serializers.append(serializer)
+            list_serializers.append(list_serializer)
+        return _RecordPlan(typ, names, types, tuple(serializers), tuple(list_serializers), flags_serializer,
+                           lengths_serializer)
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        plan = cast(_RecordPlan, self._plan(type(obj)))
+        for i, value in enumerate(plan.values(obj)):
+            if value is None:
+                dest.write(bytes((self.NONE,)))
+                continue
+
+            if plan.matches(i, value):
+                dest.write(bytes((self.VALUE,)))
+                frame = _FrameWriter(dest)
+                plan.serializers[i]._serialize(value, cast(BinaryIO, frame))
+            else:
+                dest.write(bytes((self.SELF_DESCRIBED,)))
+                frame = self.__write_self_described(value, plan.names[i], dest)
+            frame.finish()
+        self.__write_extras(plan.extras(obj), dest)
+
+    def __write_self_described(self, value: Any, name: str, dest: BinaryIO) -> _FrameWriter:
+        serializer = self._registry.find_serializer_by_type(get_type(value))
+        if serializer is None:
+            raise TypeError(f'Cannot find serializer for {name} of type {get_type(value)}')
+        frame = _FrameWriter(dest)
+        _write_str(cast(BinaryIO, frame), serializer.data_format())
+        serializer.serialize(value, cast(BinaryIO, frame))
+        return frame
+
+    def __read_self_described(self, source: BinaryIO) -> Any:
+        data_format = _read_str(source)
+        serializer = self._registry.find_serializer_by_data_format(data_format)
+        if serializer is None:
+            raise ValueError(f'Cannot find serializer for data format {data_format}')
+        return serializer.deserialize(source)
+
+    def __write_extras(self, extras: Any, dest: BinaryIO) -> None:
+        """
+        Writes attributes which are not fields, a dict for a record or a list of dicts for a block, with a header
+        """
+        if not extras:
+            dest.write(bytes((self.NONE,)))
+            return
+        dest.write(bytes((self.SELF_DESCRIBED,)))
+        self.__write_self_described(extras, 'attributes', dest).finish()
+
+    def __read_extras(self, source: BinaryIO) -> Any:
+        marker = source.read(1)[0]
+        if marker == self.NONE:
+            return None
+        with BoundedReader(source, _read_int(source)) as handle:
+            extras = self.__read_self_described(cast(BinaryIO, handle))
+            handle.skip()
+        return extras
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        plan = self._plan(schema_type)
+        if plan is None:
+            raise TypeError(f'Cannot deserialize record of type {schema_type}')
+
+        values: List[Any] = []
+        for i in range(len(plan.names)):
+            marker = source.read(1)[0]
+            if marker == self.NONE:
+                values.append(None)
+                continue
+
+            with BoundedReader(source, _read_int(source)) as handle:
+                if marker == self.VALUE:
+                    values.append(plan.serializers[i]._deserialize(cast(BinaryIO, handle), plan.types[i]))
+                elif marker == self.SELF_DESCRIBED:
+                    values.append(self.__read_self_described(cast(BinaryIO, handle)))
+                else:
+                    raise ValueError(f'Unknown record field marker {marker}')
+                handle.skip()
+        return plan.make(values, self.__read_extras(source))
+
+    def _supports_block(self, typ: Type) -> bool:
+        return self._plan(typ) is not None
+
+    def _serialize_block(self, objs: Sequence[Any], typ: Type, dest: BinaryIO) -> None:
+        plan = cast(_RecordPlan, self._plan(typ))
+        rows = [plan.values(obj) for obj in objs]
+        for i in range(len(plan.names)):
+            self.__serialize_column([row[i] for row in rows], plan, i, dest)
+        extras = [plan.extras(obj) for obj in objs]
+        self.__write_extras(extras if any(extras) else None, dest)
+
+    def __serialize_column(self, column: List[Any], plan: _RecordPlan, index: int, dest: BinaryIO) -> None:
+        field_type = plan.types[index]
+        kind = 0
+        present = [value is not None for value in column]
+        if not all(present):
+            kind |= self.NULLS_COLUMN
+            column = [value for value in column if value is not None]
+        if get_origin(field_type) is list and all(type(value) is list for value in column):
+            kind |= self.FLATTENED_COLUMN
+
+        dest.write(bytes((kind,)))
+        if kind & self.NULLS_COLUMN:
+            plan.flags_serializer._serialize_typed(present, List[bool], dest)
+        if kind & self.FLATTENED_COLUMN:
+            plan.lengths_serializer._serialize_typed([len(value) for value in column], List[int], dest)
+            flat = [x for value in column for x in value]
+            plan.list_serializers[index]._serialize_typed(flat, field_type, dest)
+        else:
+            plan.list_serializers[index]._serialize_typed(column, List[field_type], dest)  # type: ignore
+
+    def _deserialize_block(self, source: BinaryIO, typ: Type, count: int) -> List[Any]:
+        plan = self._plan(typ)
+        if plan is None:
+            raise TypeError(f'Cannot deserialize records of type {typ}')
+
+        columns = [self.__deserialize_column(source, plan, i) for i in range(len(plan.names))]
+        extras = self.__read_extras(source) or [None] * count
+        return [plan.make(values, row_extras) for values, row_extras in zip(zip(*columns), extras)]
+
+    def __deserialize_column(self, source: BinaryIO, plan: _RecordPlan, index: int) -> List[Any]:
+        field_type = plan.types[index]
+        kind = source.read(1)[0]
+        present = plan.flags_serializer._deserialize(source, List[bool]) if kind & self.NULLS_COLUMN else None
+
+        column: List[Any]
+        if kind & self.FLATTENED_COLUMN:
+            lengths = plan.lengths_serializer._deserialize(source, List[int])
+            flat = plan.list_serializers[index]._deserialize(source, field_type)
+            column = []
+            offset = 0
+            for length in lengths:
+                column.append(flat[offset:offset + length])
+                offset += length
+        else:
+            column = plan.list_serializers[index]._deserialize(source, List[field_type])  # type: ignore
+
+        if present is not None:
+            values = iter(column)
+            column = [next(values) if flag else None for flag in present]
+        return column
+
+    def available(self) -> bool:
+        return True
+
+    def meta(self) -> Dict[str, str]:
+        return {'serialzy': __version__}
+
+    def schema(self, typ: Type) -> Schema:
+        plan = cast(_RecordPlan, self._plan(typ))
+        schema_dict = {
+            "module": typ.__module__,
+            "name": typ.__qualname__,
+            "fields": [
+                {"name": name, "schema": dataclasses.asdict(serializer.schema(field_type))}
+                for name, field_type, serializer in zip(plan.names, plan.types, plan.serializers)
+            ]
+        }
+        return Schema(self.data_format(), self.SCHEMA_FORMAT, json.dumps(schema_dict), self.meta())
+
+    def resolve(self, schema: Schema) -> Type:
+        # do not check data format here to allow deserialization by both stable and unstable serializers
+        if schema.schema_format != self.SCHEMA_FORMAT:
+            raise ValueError(f'Invalid schema format {schema.schema_format}')
+
+        if 'serialzy' not in schema.meta:
+            _LOG.warning('No serialzy version in meta')
+        elif version.parse(schema.meta['serialzy']) > version.parse(cached_installed_packages["serialzy"]):
+            _LOG.warning(f'Installed version of serialzy {cached_installed_packages["serialzy"]} '
+                         f'is older than used for serialization {schema.meta["serialzy"]}')
+
+        schema_dict = json.loads(schema.schema_content)
+        if 'module' not in schema_dict or 'name' not in schema_dict or 'fields' not in schema_dict:
+            raise ValueError(f'Invalid schema content: {schema.schema_content}')
+
+        typ: Any = importlib.import_module(schema_dict['module'])
+        for name in schema_dict['name'].split('.'):
+            typ = getattr(typ, name)
+
+        fields = _record_fields(typ)
+        names = [field['name'] for field in schema_dict['fields']]
+        if fields is None or list(fields[0]) != names:
+            raise ValueError(f'Fields of {typ} differ from serialized fields {names}')
+        return cast(Type, typ)
+
+    def requirements(self) -> Dict[str, VersionBoundary]:
+        return {}
+
+    def _check(self, typ: Type, stable: bool) -> bool:
+        plan = self._plan(typ)
+        if plan is None:
+            return False
+        return all(serializer.stable() for serializer in plan.serializers) == stable
+
+
+class RecordSerializerStable(RecordSerializerBase):
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: self._check(t, stable=True)
+
+    def stable(self) -> bool:
+        return True
+
+    def data_format(self) -> str:
+        return "serialzy_record_stable"
+
+
+class RecordSerializerUnstable(RecordSerializerBase):
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: self._check(t, stable=False)
+
+    def stable(self) -> bool:
+        return False
+
+    def data_format(self) -> str:
+        return "serialzy_record_unstable"
@@ -1,73 +1,386 @@
 import dataclasses
 import importlib
+import io
 import json
 import logging
+import os
+import threading
 from abc import ABC
+from array import array
 from io import BytesIO
 from packaging import version
-from typing import Any, BinaryIO, Type, Optional, Dict, cast, Union, Callable, Tuple, List
+from typing import Any, BinaryIO, Type, Optional, Dict, cast, Union, Callable, Tuple, List, Sequence, Iterator, \
+    Iterable
 
 from serialzy.serializers.ellipsis import EllipsisSerializer
-from serialzy.utils import cached_installed_packages
+from serialzy.utils import BoundedReader, LRUCache, cached_installed_packages
 from typing_extensions import get_args, get_origin
 
-from serialzy.api import Serializer, SerializerRegistry, Schema, VersionBoundary
+from serialzy.api import BlockSerializer, Serializer, SerializerRegistry, Schema, TypeMatcher, UserMeta, VersionBoundary
 from serialzy.types import EmptyContent, get_type
 from serialzy.version import __version__
 
 _LOG = logging.getLogger(__name__)
 
 
+def _write_int(dest: BinaryIO, value: int) -> None:
+    dest.write(value.to_bytes(length=8, byteorder='little', signed=False))
+
+
+def _read_int(source: BinaryIO) -> int:
+    data = source.read(8)
+    if len(data) != 8:
+        raise EOFError(f'Unexpected end of data: read {len(data)} of 8 bytes')
+    return int.from_bytes(data, byteorder='little', signed=False)
+
+
+def _write_str(dest: BinaryIO, value: str) -> None:
+    encoded = value.encode('utf-8')
+    _write_int(dest, len(encoded))
+    dest.write(encoded)
+
+
+def _read_str(source: BinaryIO) -> str:
+    return source.read(_read_int(source)).decode('utf-8')
+
+
+class _FrameWriter(io.RawIOBase):
+    """
+    Writes u64 length and data of an element. Small elements are buffered and written after their length.
+    Large elements are written into a seekable destination directly, and their length is patched afterwards
+    """
+    BUFFER_SIZE = 65536
+
+    def __init__(self, dest: BinaryIO):
+        super().__init__()
+        self._dest = dest
+        self._buffer: Optional[BytesIO] = BytesIO()
+        self._length_position = -1
+        self._length = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        size = memoryview(data).nbytes
+        if self._buffer is not None:
+            if self._buffer.tell() + size <= self.BUFFER_SIZE or not self._dest.seekable():
+                self._buffer.write(data)
+                self._length += size
+                return size
+
+            self._length_position = self._dest.tell()
+            _write_int(self._dest, 0)
+            with self._buffer.getbuffer() as buffered:
+                self._dest.write(buffered)
+            self._buffer = None
+
+        self._dest.write(data)
+        self._length += size
+        return size
+
+    def finish(self) -> None:
+        if self._buffer is not None:
+            _write_int(self._dest, self._length)
+            with self._buffer.getbuffer() as buffered:
+                self._dest.write(buffered)
+            self._buffer = None
+        else:
+            end = self._dest.tell()
+            self._dest.seek(self._length_position)
+            _write_int(self._dest, self._length)
+            self._dest.seek(end)
+
+
+class LazySequence(Sequence[Any]):
+    """
+    Read-only sequence that deserializes elements from a seekable source on access
+    """
+
+    def __init__(self, source: BinaryIO, offsets: array, lengths: array,
+                 decode: Callable[[int, BinaryIO], Any], cache_size: int):
+        self._source = source
+        self._offsets = offsets
+        self._lengths = lengths
+        self._decode = decode
+        # values are wrapped into tuples to cache None elements
+        self._cache: LRUCache[int, Tuple[Any]] = LRUCache(cache_size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('sequence index out of range')
+
+        cached = self._cache.get(index)
+        if cached is None:
+            with self._lock:
+                self._source.seek(self._offsets[index])
+                with BoundedReader(self._source, self._lengths[index]) as handle:
+                    cached = (self._decode(index, cast(BinaryIO, handle)),)
+            self._cache.put(index, cached)
+        return cached[0]
+
+
 class SequenceSerializerBase(Serializer, ABC):
     SUPPORTED_TYPES = {list, tuple}
     SCHEMA_FORMAT = "serialzy_sequence_schema"
 
+    # the highest byte of the sequence length selects the layout of elements
+    LAYOUT_SHIFT = 56
+    LENGTH_MASK = (1 << LAYOUT_SHIFT) - 1
+    # every element is written with its own data format and schema header
+    PER_ELEMENT_LAYOUT = 0
+    # elements are written without headers, their schemas are stored once in the sequence schema
+    SHARED_SCHEMA_LAYOUT = 1
+    # elements of the same type are written as a single block by the element serializer
+    BLOCK_LAYOUT = 2
+    # length of sequences written to non-seekable destinations, their elements are followed by END_OF_ELEMENTS
+    UNKNOWN_LENGTH = LENGTH_MASK
+    END_OF_ELEMENTS = (1 << 64) - 1
+
+    LAZY_CACHE_SIZE = 128
+
     def __init__(self, registry: SerializerRegistry):
         self._registry = registry
 
-    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
-        length = len(obj)
-        dest.write(length.to_bytes(length=8, byteorder='little', signed=False))
+    def serialize(self, obj: Any, dest: BinaryIO, user_meta: Optional[UserMeta] = None) -> None:
+        typ = get_type(obj)
+        self._check_type(typ)
+        self._write_schema(typ, dest, user_meta)
+        self._serialize_typed(obj, typ, dest)
 
-        for i in range(len(obj)):
-            with BytesIO() as handle:
-                serializer = cast(Serializer, self._registry.find_serializer_by_type(get_type(obj[i])))
-                data_format = serializer.data_format()
-                handle.write(len(data_format).to_bytes(length=8, byteorder='little', signed=False))
-                handle.write(data_format.encode("utf-8"))
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        self._serialize_typed(obj, get_type(obj), dest)
+
+    def _serialize_typed(self, obj: Any, typ: Type, dest: BinaryIO) -> None:
+        args = self._element_args(typ)
+        if len(obj) == 0 or not self.__is_homogeneous(obj, args):
+            self.__serialize_per_element(obj, dest)
+            return
+
+        serializer = cast(Serializer, self._registry.find_serializer_by_type(args[0]))
+        if len(args) == 1 and isinstance(serializer, BlockSerializer) and serializer._supports_block(args[0]):
+            _write_int(dest, self._length_word(self.BLOCK_LAYOUT, len(obj)))
+            _write_str(dest, serializer.data_format())
+            serializer._serialize_block(obj, args[0], dest)
+        else:
+            self.__serialize_shared_schema(obj, args, dest)
 
-                serializer.serialize(obj[i], handle)
-                handle.flush()
+    def __serialize_per_element(self, obj: Any, dest: BinaryIO) -> None:
+        _write_int(dest, self._length_word(self.PER_ELEMENT_LAYOUT, len(obj)))
 
-                serialized_value = handle.getvalue()
-                elem_size = len(serialized_value)
-                dest.write(elem_size.to_bytes(length=8, byteorder='little', signed=False))
-                dest.write(serialized_value)
+        for i in range(len(obj)):
+            serializer = cast(Serializer, self._registry.find_serializer_by_type(get_type(obj[i])))
+            frame = _FrameWriter(dest)
+            _write_str(cast(BinaryIO, frame), serializer.data_format())
+            serializer.serialize(obj[i], cast(BinaryIO, frame))
+            frame.finish()
+
+    def __serialize_shared_schema(self, obj: Any, args: Tuple[Type, ...], dest: BinaryIO) -> None:
+        serializers = [cast(Serializer, self._registry.find_serializer_by_type(arg)) for arg in args]
+        self._write_shared_schema_prefix(dest, len(obj), serializers)
+        for i in range(len(obj)):
+            serializer = serializers[0] if len(serializers) == 1 else serializers[i]
+            self._write_payload(dest, serializer, obj[i])
+
+    def _write_shared_schema_prefix(self, dest: BinaryIO, length: int, serializers: List[Serializer]) -> None:
+        _write_int(dest, self._length_word(self.SHARED_SCHEMA_LAYOUT, length))
+        _write_int(dest, len(serializers))
+        for serializer in serializers:
+            _write_str(dest, serializer.data_format())
+
+    @staticmethod
+    def _write_payload(dest: BinaryIO, serializer: Serializer, obj: Any) -> None:
+        frame = _FrameWriter(dest)
+        serializer._serialize(obj, cast(BinaryIO, frame))
+        frame.finish()
+
+    def writer(self, dest: BinaryIO, user_meta: Optional[UserMeta] = None) -> 'SequenceWriter':
+        """
+        :param dest: serialized list is written into dest
+        :param user_meta: user meta of the list
+        :return: writer of list elements, the list is finished when the writer is closed
+        """
+        return SequenceWriter(self, dest, user_meta)
+
+    def serialize_iter(self, iterable: Iterable[Any], dest: BinaryIO, user_meta: Optional[UserMeta] = None) -> None:
+        """
+        Serializes elements of the iterable as a list without materializing it,
+        type of the list is inferred from the first element
+        :param iterable: elements of the list
+        :param dest: serialized list is written into dest
+        :param user_meta: user meta of the list
+        :return: None
+        """
+        with self.writer(dest, user_meta) as writer:
+            for obj in iterable:
+                writer.write(obj)
 
     def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
         self._check_types_valid(schema_type, user_type)
 
-        length = int.from_bytes(source.read(8), byteorder='little', signed=False)
+        layout, length = self.__read_length_word(source)
         if length == 0:
             return get_origin(schema_type)([])  # type: ignore
         # allow list deserialization by both stable and unstable serializers
 
-        result = list()
-        for i in range(length):
-            elem_length = int.from_bytes(source.read(8), byteorder='little', signed=False)
-            with BytesIO() as handle:
-                handle.write(source.read(elem_length))
-                handle.flush()
-                handle.seek(0)
-
-                data_format_length = int.from_bytes(handle.read(8), byteorder='little', signed=False)
-                data_format = handle.read(data_format_length).decode("utf-8")
-                serializer = cast(Serializer, self._registry.find_serializer_by_data_format(data_format))
-                obj = serializer.deserialize(handle)
-                result.append(obj)
+        if layout == self.BLOCK_LAYOUT:
+            result = self.__deserialize_block(source, schema_type, length)
+        else:
+            decode = self.__element_decoder(source, layout, schema_type)
+            result = list()
+            for i, elem_length in enumerate(self.__element_lengths(source, length)):
+                with BoundedReader(source, elem_length) as handle:
+                    result.append(decode(i, cast(BinaryIO, handle)))
+                    handle.skip()
 
         return get_origin(schema_type)(result)  # type: ignore
 
+    def iter_deserialize(self, source: BinaryIO, typ: Optional[Type] = None) -> Iterator[Any]:
+        """
+        :param source: buffer or file with serialized data, may be not seekable
+        :param typ: type of the resulting object, fetched from the header if None
+        :return: iterator that deserializes elements one by one while reading the source
+        """
+        schema_type = self._deserialize_type(source)
+        self._check_types_valid(schema_type, typ)
+
+        layout, length = self.__read_length_word(source)
+        if length == 0:
+            return
+        if layout == self.BLOCK_LAYOUT:
+            yield from self.__deserialize_block(source, schema_type, length)
+            return
+
+        decode = self.__element_decoder(source, layout, schema_type)
+        for i, elem_length in enumerate(self.__element_lengths(source, length)):
+            with BoundedReader(source, elem_length) as handle:
+                obj = decode(i, cast(BinaryIO, handle))
+                handle.skip()
+            yield obj
+
+    def deserialize_lazy(self, source: BinaryIO, typ: Optional[Type] = None,
+                         cache_size: int = LAZY_CACHE_SIZE) -> Sequence[Any]:
+        """
+        :param source: seekable buffer or file with serialized data, must stay open while the result is used
+        :param typ: type of the resulting object, fetched from the header if None
+        :param cache_size: max number of deserialized elements kept by the result
+        :return: sequence that deserializes elements on access, or fully deserialized object
+        if the source is not seekable or elements are packed into a block
+        """
+        schema_type = self._deserialize_type(source)
+        self._check_types_valid(schema_type, typ)
+        return self._deserialize_lazy(source, schema_type, cache_size)
+
+    def _deserialize_lazy(self, source: BinaryIO, schema_type: Type, cache_size: int) -> Sequence[Any]:
+        if not source.seekable():
+            return cast(Sequence[Any], self._deserialize(source, schema_type))
+
+        start = source.tell()
+        layout, length = self.__read_length_word(source)
+        if length == 0 or layout == self.BLOCK_LAYOUT:
+            source.seek(start)
+            return cast(Sequence[Any], self._deserialize(source, schema_type))
+
+        decode = self.__element_decoder(source, layout, schema_type)
+        # read only lengths of elements and skip their data
+        offsets = array('Q')
+        lengths = array('Q')
+        for elem_length in self.__element_lengths(source, length):
+            offsets.append(source.tell())
+            lengths.append(elem_length)
+            source.seek(elem_length, os.SEEK_CUR)
+        return LazySequence(source, offsets, lengths, decode, cache_size)
+
+    def __read_length_word(self, source: BinaryIO) -> Tuple[int, int]:
+        length_word = _read_int(source)
+        return length_word >> self.LAYOUT_SHIFT, length_word & self.LENGTH_MASK
+
+    def __element_lengths(self, source: BinaryIO, length: int) -> Iterator[int]:
+        if length != self.UNKNOWN_LENGTH:
+            for _ in range(length):
+                yield _read_int(source)
+            return
+
+        while True:
+            elem_length = _read_int(source)
+            if elem_length == self.END_OF_ELEMENTS:
+                return
+            yield elem_length
+
+    def __deserialize_block(self, source: BinaryIO, schema_type: Type, length: int) -> List[Any]:
+        data_format = _read_str(source)
+        serializer = self._registry.find_serializer_by_data_format(data_format)
+        if serializer is None:
+            raise ValueError(f'Cannot find serializer for data format {data_format}')
+        if not isinstance(serializer, BlockSerializer):
+            raise ValueError(f'Serializer of data format {data_format} cannot read blocks')
+        return serializer._deserialize_block(source, self._element_args(schema_type)[0], length)
+
+    def __element_decoder(self, source: BinaryIO, layout: int, schema_type: Type) -> Callable[[int, BinaryIO], Any]:
+        """
+        Reads what is shared by elements of the layout
+        :return: function that deserializes element by its index from a buffer with the element
+        """
+        if layout == self.PER_ELEMENT_LAYOUT:
+            return self.__deserialize_element
+        elif layout != self.SHARED_SCHEMA_LAYOUT:
+            raise ValueError(f'Unknown sequence layout {layout}')
+
+        args = self._element_args(schema_type)
+        serializers = []
+        for _ in range(_read_int(source)):
+            data_format = _read_str(source)
+            serializer = self._registry.find_serializer_by_data_format(data_format)
+            if serializer is None:
+                raise ValueError(f'Cannot find serializer for data format {data_format}')
+            serializers.append(serializer)
+
+        if len(serializers) == 1:
+            serializer, arg = serializers[0], args[0]
+            return lambda index, handle: serializer._deserialize(handle, arg)
+        return lambda index, handle: serializers[index]._deserialize(handle, args[index])
+
+    def __deserialize_element(self, index: int, handle: BinaryIO) -> Any:
+        data_format = _read_str(handle)
+        serializer = cast(Serializer, self._registry.find_serializer_by_data_format(data_format))
+        return serializer.deserialize(handle)
+
+    @staticmethod
+    def _element_args(typ: Type) -> Tuple[Type, ...]:
+        """
+        :return: single element type for lists and tuples with ellipsis, otherwise types of tuple elements
+        """
+        args: Tuple[Any, ...] = get_args(typ)
+        if len(args) == 2 and args[1] == Ellipsis:
+            return args[:1]
+        return args
+
+    @staticmethod
+    def __is_homogeneous(obj: Any, args: Tuple[Type, ...]) -> bool:
+        if len(args) == 0 or args[0] == EmptyContent:
+            return False
+        if len(args) == 1:
+            arg = args[0]
+            if get_origin(arg) is None:
+                # get_type returns the type itself for everything except lists, tuples and dicts
+                return all(type(x) is arg for x in obj)
+            return all(get_type(x) == arg for x in obj)
+        return len(obj) == len(args) and all(get_type(x) == arg for x, arg in zip(obj, args))
+
+    def _length_word(self, layout: int, length: int) -> int:
+        return (layout << self.LAYOUT_SHIFT) | length
+
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=(list, tuple))
+
     def available(self) -> bool:
         return True
 
@@ -130,6 +443,77 @@ class SequenceSerializerBase(Serializer, ABC):
         return serializers
 
 
+class SequenceWriter:
+    """
+    Writes elements of a list one by one, all elements must have the type of the first one.
+    The length of the list is patched on close if the destination is seekable,
+    otherwise the elements are followed by an end marker
+    """
+
+    def __init__(self, serializer: SequenceSerializerBase, dest: BinaryIO, user_meta: Optional[UserMeta] = None):
+        self._serializer = serializer
+        self._dest = dest
+        self._user_meta = user_meta
+        self._elem_type: Optional[Type] = None
+        self._elem_serializer: Optional[Serializer] = None
+        self._length_position: Optional[int] = None
+        self._length = 0
+        self._closed = False
+
+    def write(self, obj: Any) -> None:
+        if self._closed:
+            raise ValueError('Sequence writer is closed')
+
+        typ = get_type(obj)
+        if self._elem_serializer is None:
+            self._start(typ)
+        elif typ != self._elem_type:
+            raise TypeError(f'Cannot write element of type {typ} into sequence of {self._elem_type}')
+
+        self._serializer._write_payload(self._dest, cast(Serializer, self._elem_serializer), obj)
+        self._length += 1
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        serializer = self._serializer
+        if self._elem_serializer is None:
+            serializer.serialize([], self._dest, self._user_meta)
+        elif self._length_position is None:
+            _write_int(self._dest, serializer.END_OF_ELEMENTS)
+        else:
+            end = self._dest.tell()
+            self._dest.seek(self._length_position)
+            _write_int(self._dest, serializer._length_word(serializer.SHARED_SCHEMA_LAYOUT, self._length))
+            self._dest.seek(end)
+
+    def _start(self, elem_type: Type) -> None:
+        typ = cast(Type, List[elem_type])  # type: ignore
+        self._serializer._check_type(typ)
+        elem_serializer = self._serializer._registry.find_serializer_by_type(elem_type)
+        if elem_serializer is None:
+            raise TypeError(f'Cannot find serializer for type {elem_type}')
+
+        self._serializer._write_schema(typ, self._dest, self._user_meta)
+        if self._dest.seekable():
+            self._length_position = self._dest.tell()
+        # the length is unknown until close, so streams of aborted writers fail to be read
+        self._serializer._write_shared_schema_prefix(self._dest, self._serializer.UNKNOWN_LENGTH, [elem_serializer])
+        self._elem_type = elem_type
+        self._elem_serializer = elem_serializer
+
+    def __enter__(self) -> 'SequenceWriter':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+
+
 class SequenceSerializerStable(SequenceSerializerBase):
     def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
         return lambda t: get_origin(t) in self.SUPPORTED_TYPES and self.__check_arg(get_args(t))
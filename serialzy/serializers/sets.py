@@ -0,0 +1,121 @@
+import dataclasses
+import json
+import logging
+from abc import ABC
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union, cast
+
+from packaging import version  # type: ignore
+from typing_extensions import get_args, get_origin
+
+from serialzy.api import Schema, Serializer, SerializerRegistry, TypeMatcher, VersionBoundary
+from serialzy.serializers.sequence import SequenceSerializerBase
+from serialzy.types import EmptyContent, get_type
+from serialzy.utils import cached_installed_packages
+from serialzy.version import __version__
+
+_LOG = logging.getLogger(__name__)
+
+
+class SetSerializerBase(Serializer, ABC):
+    """
+    Writes elements of a set or frozenset as a list, so they are packed into a block or share a schema
+    the same way as elements of sequences
+    """
+    SCHEMA_FORMAT = "serialzy_set_schema"
+    SUPPORTED_TYPES = {"set": Set, "frozenset": FrozenSet}
+
+    def __init__(self, registry: SerializerRegistry):
+        self._registry = registry
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        elem_type = self.__arg(get_type(obj))
+        self.__list_serializer(elem_type)._serialize_typed(list(obj), List[elem_type], dest)  # type: ignore
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        elem_type = self.__arg(schema_type)
+        elems = self.__list_serializer(elem_type)._deserialize(source, List[elem_type])  # type: ignore
+        return get_origin(schema_type)(elems)  # type: ignore
+
+    def __list_serializer(self, typ: Type) -> SequenceSerializerBase:
+        serializer = self._registry.find_serializer_by_type(List[typ])  # type: ignore
+        if not isinstance(serializer, SequenceSerializerBase):
+            raise TypeError(f'Cannot find sequence serializer for list of {typ}')
+        return serializer
+
+    @staticmethod
+    def __arg(typ: Type) -> Type:
+        args: Tuple[Any, ...] = get_args(typ)
+        return cast(Type, args[0])
+
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=(set, frozenset))
+
+    def available(self) -> bool:
+        return True
+
+    def meta(self) -> Dict[str, str]:
+        return {'serialzy': __version__}
+
+    def schema(self, typ: Type) -> Schema:
+        arg = self.__arg(typ)
+        schema_dict = {
+            "origin": cast(type, get_origin(typ)).__name__,
+            "args": [dataclasses.asdict(cast(Serializer, self._registry.find_serializer_by_type(arg)).schema(arg))]
+        }
+        return Schema(self.data_format(), self.SCHEMA_FORMAT, json.dumps(schema_dict), self.meta())
+
+    def resolve(self, schema: Schema) -> Type:
+        # do not check data format here to allow set deserialization by both stable and unstable serializers
+        if schema.schema_format != self.SCHEMA_FORMAT:
+            raise ValueError(f'Invalid schema format {schema.schema_format}')
+
+        if 'serialzy' not in schema.meta:
+            _LOG.warning('No serialzy version in meta')
+        elif version.parse(schema.meta['serialzy']) > version.parse(cached_installed_packages["serialzy"]):
+            _LOG.warning(f'Installed version of serialzy {cached_installed_packages["serialzy"]} '
+                         f'is older than used for serialization {schema.meta["serialzy"]}')
+
+        schema_dict = json.loads(schema.schema_content)
+        if schema_dict.get("origin") not in self.SUPPORTED_TYPES:
+            raise ValueError(f'Invalid schema content: {schema.schema_content}')
+        arg_schema = Schema(**schema_dict["args"][0])
+        serializer = cast(Serializer, self._registry.find_serializer_by_data_format(arg_schema.data_format))
+        return self.SUPPORTED_TYPES[schema_dict["origin"]][serializer.resolve(arg_schema)]  # type: ignore
+
+    def requirements(self) -> Dict[str, VersionBoundary]:
+        return {}
+
+    def _check_arg(self, typ: Type, stable: bool) -> bool:
+        if get_origin(typ) not in (set, frozenset):
+            return False
+        args: Tuple[Any, ...] = get_args(typ)
+        if len(args) != 1:
+            return False
+        elif args[0] == EmptyContent:
+            return True
+
+        serializer = self._registry.find_serializer_by_type(args[0])
+        return serializer is not None and serializer.available() and (not stable or serializer.stable())
+
+
+class SetSerializerStable(SetSerializerBase):
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: self._check_arg(t, stable=True)
+
+    def stable(self) -> bool:
+        return True
+
+    def data_format(self) -> str:
+        return "serialzy_set_stable"
+
+
+class SetSerializerUnstable(SetSerializerBase):
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: self._check_arg(t, stable=False)
+
+    def stable(self) -> bool:
+        return False
+
+    def data_format(self) -> str:
+        return "serialzy_set_unstable"
@@ -0,0 +1,213 @@
+import datetime
+import decimal
+import enum
+import uuid
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from serialzy.api import BlockSerializer, TypeMatcher, VersionBoundary
+from serialzy.base import DefaultSchemaSerializerByReference
+from serialzy.serializers.primitive import _pack_strs, _packed, _unpack_strs, _unpacked
+from serialzy.types import STDLIB_VALUE_TYPES
+from serialzy.version import __version__
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# kinds of timezones of datetimes
+_NAIVE = 0
+_FIXED_OFFSET = 1
+_ZONE_KEY = 2
+
+# kinds of decimals, stored in the upper bits of the sign byte
+_DECIMAL_KINDS = {'n': 1 << 1, 'N': 2 << 1, 'F': 3 << 1}
+_DECIMAL_EXPONENTS = {kind: exponent for exponent, kind in _DECIMAL_KINDS.items()}
+
+
+def _is_enum(typ: Type) -> bool:
+    # enums are referenced by module and name, so nested classes and classes of __main__ cannot be resolved,
+    # values of flags may be combinations of members without names
+    return (isinstance(typ, type) and issubclass(typ, enum.Enum) and not issubclass(typ, enum.Flag)
+            and typ.__qualname__ == typ.__name__ and typ.__module__ != '__main__')
+
+
+def _zone(obj: datetime.datetime) -> Tuple[int, Union[int, str, None], int]:
+    tz = obj.tzinfo
+    if tz is None:
+        return _NAIVE, None, obj.fold
+    key = getattr(tz, 'key', None)  # zoneinfo.ZoneInfo
+    if isinstance(key, str) and type(tz).__module__ == 'zoneinfo':
+        return _ZONE_KEY, key, obj.fold
+    # timezones of other kinds are written as fixed offsets, so the moment in time is preserved
+    offset = obj.utcoffset()
+    return _FIXED_OFFSET, offset // datetime.timedelta(microseconds=1) if offset is not None else 0, obj.fold
+
+
+def _zone_info(kind: int, value: Union[int, str, None]) -> Optional[datetime.tzinfo]:
+    if kind == _NAIVE:
+        return None
+    elif kind == _FIXED_OFFSET:
+        return datetime.timezone(datetime.timedelta(microseconds=value))  # type: ignore
+    elif kind == _ZONE_KEY:
+        import zoneinfo  # type: ignore
+        return zoneinfo.ZoneInfo(value)  # type: ignore
+    raise ValueError(f'Unknown timezone kind {kind}')
+
+
+class StdlibValueSerializer(DefaultSchemaSerializerByReference, BlockSerializer):
+    """
+    Writes values of std lib types in binary form: datetimes as microseconds since epoch with timezones,
+    dates as ordinals, decimals as digit tuples, UUIDs as 16 bytes, enums by member names, paths as strings.
+    Sequences of values are packed column-wise
+    """
+
+    def _serialize(self, obj: Any, dest: BinaryIO) -> None:
+        dest.write(self.__encode([obj], type(obj)))
+
+    def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
+        self._check_types_valid(schema_type, user_type)
+        return self.__decode(memoryview(source.read()), schema_type, 1)[0]
+
+    def _supports_block(self, typ: Type) -> bool:
+        return typ in STDLIB_VALUE_TYPES or _is_enum(typ)
+
+    def _serialize_block(self, objs: Sequence[Any], typ: Type, dest: BinaryIO) -> None:
+        data = self.__encode(objs, typ)
+        dest.write(len(data).to_bytes(length=8, byteorder='little', signed=False))
+        dest.write(data)
+
+    def _deserialize_block(self, source: BinaryIO, typ: Type, count: int) -> List[Any]:
+        size = int.from_bytes(source.read(8), byteorder='little', signed=False)
+        return self.__decode(memoryview(source.read(size)), typ, count)
+
+    def __encode(self, objs: Sequence[Any], typ: Type) -> bytes:
+        if typ is datetime.datetime:
+            return self.__encode_datetimes(objs)
+        elif typ is datetime.date:
+            return _packed('q', [x.toordinal() for x in objs]).tobytes()
+        elif typ is datetime.timedelta:
+            return _packed('i', [x.days for x in objs]).tobytes() + _packed(
+                'q', [x.seconds * 1000000 + x.microseconds for x in objs]).tobytes()
+        elif typ is decimal.Decimal:
+            return self.__encode_decimals(objs)
+        elif typ is uuid.UUID:
+            return b''.join(x.bytes for x in objs)
+        elif _is_enum(typ):
+            return _pack_strs([x.name for x in objs])
+        return _pack_strs([str(x) for x in objs])
+
+    def __decode(self, data: memoryview, typ: Type, count: int) -> List[Any]:
+        if typ is datetime.datetime:
+            return self.__decode_datetimes(data, count)
+        elif typ is datetime.date:
+            return [datetime.date.fromordinal(x) for x in _unpacked('q', data)]
+        elif typ is datetime.timedelta:
+            days = _unpacked('i', data[:4 * count])
+            microseconds = _unpacked('q', data[4 * count:])
+            return [datetime.timedelta(days=d, microseconds=m) for d, m in zip(days, microseconds)]
+        elif typ is decimal.Decimal:
+            return self.__decode_decimals(data, count)
+        elif typ is uuid.UUID:
+            return [uuid.UUID(bytes=bytes(data[i:i + 16])) for i in range(0, 16 * count, 16)]
+        elif _is_enum(typ):
+            return [typ[name] for name in _unpack_strs(data, count)]
+        return [typ(x) for x in _unpack_strs(data, count)]
+
+    @staticmethod
+    def __encode_datetimes(objs: Sequence[datetime.datetime]) -> bytes:
+        """
+        Layout: i64 wall clock microseconds since epoch, u32 number of distinct timezones,
+        timezones as (kind, fold, offset or key), u32 timezone indices if there are several timezones
+        """
+        microseconds = _packed('q', [
+            ((x.toordinal() - _EPOCH_ORDINAL) * 86400 + x.hour * 3600 + x.minute * 60 + x.second) * 1000000 +
+            x.microsecond for x in objs])
+
+        zones: Dict[Tuple[int, Union[int, str, None], int], int] = {}
+        indices = [zones.setdefault(_zone(x), len(zones)) for x in objs]
+
+        parts = [microseconds.tobytes(), len(zones).to_bytes(length=4, byteorder='little', signed=False)]
+        for kind, value, fold in zones:
+            parts.append(bytes((kind, fold)))
+            if kind == _FIXED_OFFSET:
+                parts.append(_packed('q', [value]).tobytes())
+            elif kind == _ZONE_KEY:
+                parts.append(_pack_strs([value]))  # type: ignore
+        if len(zones) > 1:
+            parts.append(_packed('I', indices).tobytes())
+        return b''.join(parts)
+
+    @staticmethod
+    def __decode_datetimes(data: memoryview, count: int) -> List[datetime.datetime]:
+        microseconds = _unpacked('q', data[:8 * count])
+        offset = 8 * count
+        zones_count = int.from_bytes(data[offset:offset + 4], byteorder='little', signed=False)
+        offset += 4
+
+        zones: List[Tuple[Optional[datetime.tzinfo], int]] = []
+        for _ in range(zones_count):
+            kind, fold = data[offset], data[offset + 1]
+            offset += 2
+            value: Union[int, str, None] = None
+            if kind == _FIXED_OFFSET:
+                value = _unpacked('q', data[offset:offset + 8])[0]
+                offset += 8
+            elif kind == _ZONE_KEY:
+                length = _unpacked('Q', data[offset:offset + 8])[0]
+                value = _unpack_strs(data[offset:offset + 8 + length], 1)[0]
+                offset += 8 + length
+            zones.append((_zone_info(kind, value), fold))
+
+        indices = _unpacked('I', data[offset:offset + 4 * count]) if zones_count > 1 else [0] * count
+        result = []
+        for micros, index in zip(microseconds, indices):
+            tz, fold = zones[index]
+            wall = _EPOCH + datetime.timedelta(microseconds=micros)
+            result.append(wall.replace(tzinfo=tz, fold=fold) if tz is not None or fold else wall)
+        return result
+
+    @staticmethod
+    def __encode_decimals(objs: Sequence[decimal.Decimal]) -> bytes:
+        """
+        Layout: sign and kind bytes, i64 exponents, u32 numbers of digits, digits as bytes
+        """
+        tuples = [x.as_tuple() for x in objs]
+        flags = bytes(t.sign | _DECIMAL_KINDS.get(t.exponent, 0) for t in tuples)  # type: ignore
+        exponents = _packed('q', [t.exponent if isinstance(t.exponent, int) else 0 for t in tuples])
+        lengths = _packed('I', [len(t.digits) for t in tuples])
+        return b''.join((flags, exponents.tobytes(), lengths.tobytes(), b''.join(bytes(t.digits) for t in tuples)))
+
+    @staticmethod
+    def __decode_decimals(data: memoryview, count: int) -> List[decimal.Decimal]:
+        flags = data[:count]
+        exponents = _unpacked('q', data[count:9 * count])
+        lengths = _unpacked('I', data[9 * count:13 * count])
+        offset = 13 * count
+        result = []
+        for flag, exponent, length in zip(flags, exponents, lengths):
+            digits = tuple(data[offset:offset + length])
+            offset += length
+            kind = flag & ~1
+            value = (flag & 1, digits, _DECIMAL_EXPONENTS[kind] if kind else exponent)
+            result.append(decimal.Decimal(value))  # type: ignore
+        return result
+
+    def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
+        return lambda t: t in STDLIB_VALUE_TYPES or _is_enum(t)
+
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=STDLIB_VALUE_TYPES, bases=(enum.Enum,))
+
+    def available(self) -> bool:
+        return True
+
+    def stable(self) -> bool:
+        return True
+
+    def data_format(self) -> str:
+        return "serialzy_stdlib_value"
+
+    def meta(self) -> Dict[str, str]:
+        return {'serialzy': __version__}
+
+    def requirements(self) -> Dict[str, VersionBoundary]:
+        return {}
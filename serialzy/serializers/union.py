@@ -8,7 +8,7 @@ from typing import Type, Dict, Union, BinaryIO, Any, cast, Optional, Callable, T
 from packaging import version  # type: ignore
 from typing_extensions import get_args, get_origin
 
-from serialzy.api import Serializer, Schema, SerializerRegistry, UserMeta, VersionBoundary
+from serialzy.api import Serializer, Schema, SerializerRegistry, TypeMatcher, UserMeta, VersionBoundary
 from serialzy.types import get_type
 from serialzy.utils import cached_installed_packages
 from serialzy.version import __version__
@@ -81,6 +81,9 @@ class UnionSerializerBase(Serializer, ABC):
 
                     raise ValueError(f'Cannot deserialize data into type {user_type}')
 
+    def type_matcher(self) -> Optional[TypeMatcher]:
+        return TypeMatcher(types=(Union,))
+
     def available(self) -> bool:
         return True
 
@@ -1,4 +1,13 @@
-from typing import Any, Type, List, Tuple, Callable, Optional, Dict
+import datetime
+import decimal
+import pathlib
+import uuid
+from typing import Any, Type, List, Tuple, Callable, Optional, Dict, Set, FrozenSet
+
+# std lib types written by value by serialzy.serializers.stdlib, the manifest refers to them without importing it
+STDLIB_VALUE_TYPES = (datetime.datetime, datetime.date, datetime.timedelta, decimal.Decimal, uuid.UUID,
+                      pathlib.PurePath, pathlib.PurePosixPath, pathlib.PureWindowsPath,
+                      pathlib.Path, pathlib.PosixPath, pathlib.WindowsPath)
 
 
 class EmptyContent:
@@ -22,5 +31,10 @@ def get_type(obj: Any, type_provider: Optional[Callable[[Any], Type]] = None) ->
         return Dict[get_type(k), get_type(v)]  # type: ignore
     elif original_type == dict and len(obj) == 0:
         return Dict[EmptyContent, EmptyContent]  # type: ignore
+    elif original_type in (set, frozenset):
+        generic = Set if original_type == set else FrozenSet
+        if len(obj) > 0:
+            return generic[get_type(next(iter(obj)), type_provider)]  # type: ignore
+        return generic[EmptyContent]  # type: ignore
     else:
         return original_type
@@ -1,22 +1,68 @@
 import importlib
 import inspect
+import io
+import os
 import pkgutil
+import sys
+import threading
+from collections import OrderedDict
 from types import ModuleType
-from typing import Dict, Type, Optional
+from typing import Any, BinaryIO, Dict, List, Tuple, Type, Optional, Generic, Iterator, Mapping, TypeVar, NamedTuple, \
+    cast
 
-# TODO: change to importlib.metadata after dropping 3.7
-import pkg_resources
+
+def _importlib_metadata() -> Any:
+    # importing importlib.metadata takes tens of milliseconds, so it is imported on first lookup
+    if sys.version_info >= (3, 8):
+        from importlib import metadata
+        return metadata
+    import importlib_metadata  # type: ignore
+    return importlib_metadata
 
 
 def all_installed_packages() -> Dict[str, str]:
     return {
-        entry.project_name: entry.version
-        # working_set is actually iterable see sources
-        for entry in pkg_resources.working_set  # pylint: disable=not-an-iterable
+        distribution.metadata['Name']: distribution.version
+        for distribution in _importlib_metadata().distributions()
     }
 
 
-cached_installed_packages = all_installed_packages()
+class InstalledPackages(Mapping[str, str]):
+    """
+    Versions of installed packages, every package is looked up on first access and memoized,
+    so nothing is scanned until a version is actually needed
+    """
+
+    def __init__(self):
+        self._versions: Dict[str, Optional[str]] = {}
+
+    def __getitem__(self, name: str) -> str:
+        if name not in self._versions:
+            self._versions[name] = self.__lookup(name)
+        found = self._versions[name]
+        if found is None:
+            raise KeyError(name)
+        return found
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(all_installed_packages())
+
+    def __len__(self) -> int:
+        return len(all_installed_packages())
+
+    @staticmethod
+    def __lookup(name: str) -> Optional[str]:
+        metadata = _importlib_metadata()
+        # names of distributions are not normalized by importlib.metadata before python 3.10
+        for candidate in (name, name.replace('-', '_')):
+            try:
+                return cast(str, metadata.version(candidate))
+            except metadata.PackageNotFoundError:
+                continue
+        return None
+
+
+cached_installed_packages = InstalledPackages()
 
 
 def load_all_modules_from(module: ModuleType) -> None:
@@ -29,3 +75,142 @@ def module_name(typ: Type) -> Optional[str]:
     if not module:
         return None
     return module.__name__.split(".")[0]
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    evictions: int = 0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe mapping bounded by maxsize, the least recently used entries are evicted first
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: 'OrderedDict[K, V]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def pop(self, key: K) -> Optional[V]:
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def items(self) -> List[Tuple[K, V]]:
+        """
+        :return: snapshot of entries from the least to the most recently used, statistics are not updated
+        """
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data), self._evictions)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+
+def read_into(source: BinaryIO, buffer: Any) -> None:
+    """
+    Fills the whole buffer with data of the source
+    :param source: source to read
+    :param buffer: writable object supporting the buffer protocol
+    :return: None
+    """
+    view = memoryview(buffer).cast('B')
+    readinto = getattr(source, 'readinto', None)
+    position = 0
+    while position < view.nbytes:
+        if readinto is not None:
+            read = readinto(view[position:])
+        else:
+            data = source.read(view.nbytes - position)
+            read = len(data)
+            view[position:position + read] = data
+        if not read:
+            raise EOFError(f'Unexpected end of data: read {position} of {view.nbytes} bytes')
+        position += read
+
+
+class BoundedReader(io.RawIOBase):
+    """
+    Read-only view of the next limit bytes of the source, data is read from the source without intermediate copies
+    """
+
+    def __init__(self, source: BinaryIO, limit: int):
+        super().__init__()
+        self._source = source
+        self._remaining = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._source.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast('B')[:self._remaining]
+        if len(view) == 0:
+            return 0
+        if hasattr(self._source, 'readinto'):
+            read = self._source.readinto(view) or 0
+        else:
+            data = self._source.read(len(view))
+            read = len(data)
+            view[:read] = data
+        self._remaining -= read
+        return read
+
+    def skip(self) -> None:
+        """
+        Skips bytes of the view that were not read
+        """
+        if self._remaining > 0 and self._source.seekable():
+            self._source.seek(self._remaining, os.SEEK_CUR)
+            self._remaining = 0
+        while self._remaining > 0 and self.read(min(self._remaining, 65536)):
+            pass
@@ -0,0 +1,85 @@
+import io
+import mmap
+import tempfile
+from array import array
+from typing import List
+from unittest import TestCase
+
+from serialzy.registry import DefaultSerializerRegistry
+from serialzy.serializers.binary import BytesSerializer
+from tests.rich_env.serializers.utils import serialize_and_deserialize
+
+
+class BytesSerializationTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_serialization(self):
+        for obj in (
+            b'data',
+            b'',
+            bytearray(b'\x00\x01\x02'),
+            array('d', [1.5, 2.5]),
+            array('b'),
+            array('u', 'text'),
+            array('Q', [1 << 63]),
+        ):
+            serializer = self.registry.find_serializer_by_instance(obj)
+            assert isinstance(serializer, BytesSerializer)
+            deserialized = serialize_and_deserialize(serializer, obj)
+            self.assertIs(type(obj), type(deserialized))
+            self.assertEqual(obj, deserialized)
+
+        serializer = self.registry.find_serializer_by_type(memoryview)
+        assert serializer
+        for view in (memoryview(array('i', [1, 2, 3])), memoryview(b'abcdef')[::2]):
+            deserialized = serialize_and_deserialize(serializer, view)
+            self.assertIsInstance(deserialized, memoryview)
+            self.assertEqual(view.tobytes(), deserialized.tobytes())
+
+    def test_memoryview_from_file(self):
+        serializer = self.registry.find_serializer_by_type(memoryview)
+        assert serializer
+        data = bytes(range(256)) * 1000
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(memoryview(data), file)
+            serializer.serialize(memoryview(b'tail'), file)
+            file.flush()
+            file.seek(0)
+
+            deserialized = serializer.deserialize(file)
+            self.assertIsInstance(deserialized.obj, mmap.mmap)
+            self.assertEqual(data, deserialized)
+            self.assertEqual(b'tail', serializer.deserialize(file))
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(memoryview(data), buffer)
+            buffer.seek(0)
+            self.assertEqual(data, serializer.deserialize(buffer))
+
+    def test_lists(self):
+        obj: List[bytes] = [b'a' * i for i in range(10)]
+        serializer = self.registry.find_serializer_by_instance(obj)
+        assert serializer
+        self.assertEqual(obj, serialize_and_deserialize(serializer, obj))
+
+    def test_invalid_types(self):
+        serializer = self.registry.find_serializer_by_type(bytes)
+        assert serializer
+
+        with self.assertRaisesRegex(TypeError, 'Invalid object type*'):
+            serializer.serialize(1, io.BytesIO())
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(b'data', buffer)
+            buffer.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(buffer, bytearray)
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(b'data', buffer)
+            buffer.truncate(buffer.tell() - 1)
+            buffer.seek(0)
+            with self.assertRaisesRegex(EOFError, 'Unexpected end of data*'):
+                serializer.deserialize(buffer)
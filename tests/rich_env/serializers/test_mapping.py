@@ -0,0 +1,119 @@
+import io
+import json
+import tempfile
+from typing import Any, BinaryIO, Dict, List, Tuple, cast
+from unittest import TestCase
+
+from serialzy.api import Schema
+from serialzy.registry import DefaultSerializerRegistry
+from serialzy.serializers.mapping import DictSerializerBase, DictSerializerStable, DictSerializerUnstable
+from serialzy.types import get_type
+from tests.rich_env.serializers.test_sequence import NonSeekable
+from tests.rich_env.serializers.utils import serialize_and_deserialize
+
+
+class A:
+    def __init__(self, a: int):
+        self.a = a
+
+    def __eq__(self, other):
+        return isinstance(other, A) and self.a == other.a
+
+    def __hash__(self):
+        return hash(self.a)
+
+
+class DictSerializationTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_find_by_type(self):
+        self.assertIsInstance(self.registry.find_serializer_by_type(Dict[str, int]), DictSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(Dict[str, List[float]]), DictSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(Dict[str, A]), DictSerializerUnstable)
+        self.assertIsInstance(self.registry.find_serializer_by_instance({}), DictSerializerStable)
+        self.assertNotIsInstance(self.registry.find_serializer_by_type(dict), DictSerializerBase)
+
+    def test_serialization(self):
+        for obj in (
+            {'a': 1, 'b': 2},
+            {},
+            {1: 'x', 2: None},
+            {'a': [1, 2], 'b': []},
+            {(1, 'a'): {'x': 1.5}},
+            {'a': 1, 'b': 'str', 'c': [1.5]},
+            {A(1): A(2)},
+        ):
+            serializer = self.registry.find_serializer_by_instance(obj)
+            assert serializer
+            self.assertEqual(obj, serialize_and_deserialize(serializer, obj))
+
+    def test_packed_keys_and_values(self):
+        serializer = self.registry.find_serializer_by_type(Dict[str, float])
+        assert serializer
+
+        obj = {f'key{i}': i / 2 for i in range(1000)}
+        with io.BytesIO() as buffer:
+            serializer.serialize(obj, buffer)
+            self.assertLess(buffer.tell(), 1000 * (8 + 8 + 8) + 1000)
+            buffer.seek(0)
+            self.assertEqual(obj, serializer.deserialize(buffer))
+
+    def test_schema(self):
+        serializer = self.registry.find_serializer_by_type(Dict[str, List[int]])
+        assert serializer
+
+        schema = serializer.schema(Dict[str, List[int]])
+        self.assertEqual('serialzy_dict_stable', schema.data_format)
+        self.assertEqual('serialzy_dict_schema', schema.schema_format)
+        self.assertEqual(['primitive_type', 'serialzy_sequence_stable'],
+                         [arg['data_format'] for arg in json.loads(schema.schema_content)['args']])
+        self.assertEqual(Dict[str, List[int]], serializer.resolve(schema))
+
+        with self.assertRaisesRegex(ValueError, 'Invalid schema format*'):
+            serializer.resolve(Schema('serialzy_dict_stable', 'invalid', schema.schema_content, schema.meta))
+
+        with self.assertLogs() as cm:
+            serializer.resolve(Schema(schema.data_format, schema.schema_format, schema.schema_content, {}))
+            self.assertRegex(cm.output[0], 'No serialzy version in meta')
+
+    def test_invalid_types(self):
+        serializer = self.registry.find_serializer_by_type(Dict[str, int])
+        assert serializer
+
+        with self.assertRaisesRegex(TypeError, 'Invalid object type*'):
+            serializer.serialize([1], io.BytesIO())
+
+        with io.BytesIO() as buffer:
+            serializer.serialize({'a': 1}, buffer)
+            buffer.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(buffer, Dict[str, str])
+
+    def test_lazy_deserialization(self):
+        serializer = self.registry.find_serializer_by_type(Dict[str, A])
+        assert isinstance(serializer, DictSerializerBase)
+
+        obj: Dict[Any, Any] = {f'key{i}': A(i) for i in range(100)}
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(obj, file)
+            file.flush()
+            file.seek(0)
+
+            lazy = serializer.deserialize_lazy(file)
+            self.assertEqual(100, len(lazy))
+            self.assertEqual(A(42), lazy['key42'])
+            self.assertNotIn('key100', lazy)
+            self.assertEqual(obj, dict(lazy))
+
+            file.seek(0)
+            with io.BufferedReader(cast(io.RawIOBase, NonSeekable(file))) as source:
+                self.assertEqual(obj, dict(serializer.deserialize_lazy(cast(BinaryIO, source))))
+
+        obj = {i: (i, str(i)) for i in range(10)}
+        serializer = self.registry.find_serializer_by_type(get_type(obj))
+        assert isinstance(serializer, DictSerializerBase)
+        with io.BytesIO() as buffer:
+            serializer.serialize(obj, buffer)
+            buffer.seek(0)
+            self.assertEqual(obj, dict(serializer.deserialize_lazy(buffer, Dict[int, Tuple[int, str]])))
@@ -0,0 +1,103 @@
+import io
+import tempfile
+from typing import List
+
+# noinspection PyPackageRequirements
+import numpy as np
+
+from serialzy.errors import SerialzyError
+from serialzy.serializers.numpy import NumpySerializer
+from tests.rich_env.serializers.test_base_model import ModelBaseSerializerTests
+
+
+class NumpySerializationTests(ModelBaseSerializerTests):
+    def setUp(self):
+        self.initialize("numpy")
+        self.array = np.arange(24, dtype=np.int32).reshape(2, 3, 4)
+
+    def test_serialization(self):
+        for array in (
+            self.array,
+            np.asfortranarray(np.random.random((5, 7))),
+            np.arange(20)[::3],
+            np.zeros((0, 3)),
+            np.array("str"),
+            np.array([(1, 2.5, b'ab'), (3, 4.5, b'cd')], dtype=[('a', '<i4'), ('b', '>f8'), ('c', 'S2')]),
+        ):
+            deserialized = self.base_test(array, NumpySerializer)
+            self.assertIs(np.ndarray, type(deserialized))
+            self.assertEqual(array.dtype, deserialized.dtype)
+            self.assertEqual(array.shape, deserialized.shape)
+            self.assertTrue(np.array_equal(array, deserialized))
+        self.assertTrue(self.base_test(np.asfortranarray(np.ones((3, 2))), NumpySerializer).flags.f_contiguous)
+
+    def test_serialization_with_meta(self):
+        self.assertTrue(np.array_equal(self.array, self.base_test_with_meta(self.array, NumpySerializer)))
+
+    def test_serialization_with_user_meta(self):
+        self.assertEqual({'a': 'b'}, self.base_test_with_user_meta(self.array, NumpySerializer, {'a': 'b'}))
+
+    def test_scalars(self):
+        for scalar in (np.float32(1.5), np.int64(-3), np.bool_(True), np.datetime64('2020-01-01')):
+            deserialized = self.base_test(scalar, NumpySerializer)
+            self.assertIs(type(scalar), type(deserialized))
+            self.assertEqual(scalar, deserialized)
+
+    def test_mmap(self):
+        serializer = self.registry.find_serializer_by_type(np.ndarray)
+        array = np.random.random(NumpySerializer.MMAP_THRESHOLD // 8 + 1)
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(array, file)
+            file.write(b'tail')
+            file.flush()
+            file.seek(0)
+
+            deserialized = serializer.deserialize(file)
+            self.assertIsInstance(deserialized.base, np.memmap)
+            self.assertTrue(np.array_equal(array, deserialized))
+            self.assertEqual(b'tail', file.read())
+
+            deserialized[0] = 100
+            file.seek(0)
+            self.assertTrue(np.array_equal(array, serializer.deserialize(file)))
+
+    def test_sequence_of_arrays(self):
+        serializer = self.registry.find_serializer_by_type(List[np.ndarray])
+        arrays = [self.array, np.ones(3), np.zeros((2, 2), dtype=np.bool_)]
+        with io.BytesIO() as buffer:
+            serializer.serialize(arrays, buffer)
+            buffer.seek(0)
+            deserialized = serializer.deserialize(buffer)
+        for expected, actual in zip(arrays, deserialized):
+            self.assertEqual(expected.dtype, actual.dtype)
+            self.assertTrue(np.array_equal(expected, actual))
+
+    def test_object_dtype(self):
+        class Local:
+            def __init__(self, x):
+                self.x = x
+
+        for array in (np.array([{'a': 1}, None], dtype=object), np.array([Local(1), 'x', 2], dtype=object)):
+            deserialized = self.base_test(array, NumpySerializer)
+            self.assertEqual(object, deserialized.dtype)
+            self.assertEqual(array.shape, deserialized.shape)
+        self.assertEqual([{'a': 1}, None], list(self.base_test(np.array([{'a': 1}, None]), NumpySerializer)))
+        self.assertEqual(1, self.base_test(np.array([Local(1)]), NumpySerializer)[0].x)
+
+        serializer = self.registry.find_serializer_by_type(np.ndarray)
+        with self.assertRaisesRegex(SerialzyError, 'Invalid magic string*'):
+            serializer.deserialize(io.BytesIO(serializer._encode_header(serializer.schema(np.ndarray)) + b'invalid!'))
+
+    def test_unpack(self):
+        with self.base_unpack_test(self.array, NumpySerializer) as test_dir_name:
+            self.assertTrue(np.array_equal(self.array, np.load(test_dir_name + "/array.npy")))
+
+    def test_schema(self):
+        self.base_schema('npy', np.ndarray)
+
+    def test_resolve(self):
+        self.base_resolve('npy', np.ndarray)
+
+    def test_invalid_types(self):
+        self.base_invalid_types(self.array, np.ndarray)
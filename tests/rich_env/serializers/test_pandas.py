@@ -0,0 +1,118 @@
+import io
+import tempfile
+from typing import List
+
+# noinspection PyPackageRequirements
+import numpy as np
+# noinspection PyPackageRequirements
+import pandas as pd
+
+from serialzy.serializers.pandas import PandasSerializer
+from serialzy.registry import DefaultSerializerRegistry
+from tests.rich_env.serializers.test_base_model import ModelBaseSerializerTests
+from tests.rich_env.serializers.utils import serialize_and_deserialize
+
+
+class PandasSerializationTests(ModelBaseSerializerTests):
+    def setUp(self):
+        self.initialize("pandas")
+        self.frame = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': ['x', 'y', None],
+            'c': pd.Categorical(['u', 'v', 'u']),
+            'd': pd.to_datetime(['2020-01-01', '2021-01-01', '2022-01-01']).tz_localize('UTC'),
+            'e': np.array([1.5, np.nan, 2.5], dtype=np.float32),
+        }, index=pd.Index([10, 20, 30], name='i'))
+
+    def test_serialization(self):
+        pd.testing.assert_frame_equal(self.frame, self.base_test(self.frame, PandasSerializer))
+        pd.testing.assert_frame_equal(self.frame.reset_index(),
+                                      self.base_test(self.frame.reset_index(), PandasSerializer))
+        pd.testing.assert_series_equal(self.frame['a'], self.base_test(self.frame['a'], PandasSerializer))
+        series = pd.Series([1.5, 2.5])
+        pd.testing.assert_series_equal(series, self.base_test(series, PandasSerializer))
+
+    def test_parquet(self):
+        serializer = PandasSerializer(PandasSerializer.PARQUET)
+        pd.testing.assert_frame_equal(self.frame, serialize_and_deserialize(serializer, self.frame))
+        pd.testing.assert_series_equal(self.frame['a'], serialize_and_deserialize(serializer, self.frame['a']))
+
+        # payload describes its format, so any instance of the serializer reads it
+        with io.BytesIO() as buffer:
+            serializer.serialize(self.frame, buffer)
+            buffer.seek(0)
+            pd.testing.assert_frame_equal(self.frame, PandasSerializer().deserialize(buffer))
+
+        with self.assertRaisesRegex(ValueError, 'Invalid file format*'):
+            PandasSerializer('csv')
+
+    def test_frames_without_arrow_form(self):
+        class Local:
+            def __init__(self, x):
+                self.x = x
+
+            def __eq__(self, other):
+                return isinstance(other, Local) and self.x == other.x
+
+        duplicates = pd.DataFrame([[1, 2]], columns=['a', 'a'])
+        for frame in (pd.DataFrame({'a': [1, 'x'], 'b': [1.5, 2.5]}), duplicates, pd.DataFrame({'a': [Local(1)]})):
+            for serializer in (PandasSerializer(), PandasSerializer(PandasSerializer.PARQUET)):
+                with io.BytesIO() as buffer:
+                    serializer.serialize(frame, buffer)
+                    buffer.seek(0)
+                    serializer._read_header(buffer)
+                    self.assertEqual(PandasSerializer.PICKLE_PAYLOAD, buffer.read(1))
+                    buffer.seek(0)
+                    pd.testing.assert_frame_equal(frame, serializer.deserialize(buffer))
+        series = pd.Series([1, 'x'])
+        pd.testing.assert_series_equal(series, self.base_test(series, PandasSerializer))
+
+        with io.BytesIO() as buffer:
+            frame = pd.DataFrame({'a': [1, 'x'], 'b': [1.5, 2.5]})
+            PandasSerializer().serialize(frame, buffer)
+            buffer.seek(0)
+            pd.testing.assert_frame_equal(frame[['b']], PandasSerializer().deserialize_columns(buffer, ['b']))
+
+    def test_serialization_with_meta(self):
+        pd.testing.assert_frame_equal(self.frame, self.base_test_with_meta(self.frame, PandasSerializer))
+
+    def test_serialization_with_user_meta(self):
+        self.assertEqual({'a': 'b'}, self.base_test_with_user_meta(self.frame, PandasSerializer, {'a': 'b'}))
+
+    def test_column_projection(self):
+        for serializer in (PandasSerializer(), PandasSerializer(PandasSerializer.PARQUET)):
+            for buffer in (io.BytesIO(), tempfile.TemporaryFile()):
+                with buffer:
+                    serializer.serialize(self.frame, buffer)
+                    buffer.write(b'tail')
+                    buffer.seek(0)
+                    pd.testing.assert_frame_equal(self.frame[['d', 'a']],
+                                                  serializer.deserialize_columns(buffer, ['d', 'a']))
+                    self.assertEqual(b'tail', buffer.read())
+
+    def test_sequence_of_frames(self):
+        serializer = DefaultSerializerRegistry().find_serializer_by_type(List[pd.DataFrame])
+        frames = [self.frame, self.frame.iloc[:1]]
+        for buffer in (io.BytesIO(), tempfile.TemporaryFile()):
+            with buffer:
+                serializer.serialize(frames, buffer)
+                buffer.seek(0)
+                for expected, actual in zip(frames, serializer.deserialize(buffer)):
+                    pd.testing.assert_frame_equal(expected, actual)
+
+    def test_unpack(self):
+        # noinspection PyPackageRequirements
+        import pyarrow as pa
+
+        with self.base_unpack_test(self.frame, PandasSerializer) as test_dir_name:
+            with pa.OSFile(test_dir_name + "/data.arrows") as file:
+                pd.testing.assert_frame_equal(self.frame, pa.ipc.open_stream(file).read_pandas())
+
+    def test_schema(self):
+        self.base_schema('pandas_arrow', pd.DataFrame)
+
+    def test_resolve(self):
+        self.base_resolve('pandas_arrow', pd.DataFrame)
+
+    def test_invalid_types(self):
+        self.base_invalid_types(self.frame, pd.DataFrame)
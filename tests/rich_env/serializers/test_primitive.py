@@ -107,3 +107,30 @@ class PrimitiveSerializationTests(TestCase):
 
             with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
                 serializer.deserialize(file, List[int])
+
+    def test_binary_payload(self):
+        serializer = self.registry.find_serializer_by_data_format(StandardDataFormats.primitive_type.name)
+        assert serializer
+
+        for var in [0, -1, 255, -256, 2 ** 64, -(10 ** 100000), 0.1, -1e300, float('inf'), True, False]:
+            deserialized = serialize_and_deserialize(serializer, var)
+            self.assertEqual(var, deserialized)
+            self.assertEqual(type(var), type(deserialized))
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(10 ** 100000, file)
+            file.flush()
+            # two's complement takes less than a half of the decimal representation
+            self.assertLess(file.tell(), 50000)
+
+    def test_text_payload(self):
+        serializer = self.registry.find_serializer_by_data_format(StandardDataFormats.primitive_type.name)
+        assert serializer
+
+        for var in [10, -5, 0.0001, float('inf'), True, False]:
+            with tempfile.TemporaryFile() as file:
+                file.write(serializer._encode_header(serializer.schema(type(var))))
+                file.write(str(var).encode('utf-8'))
+                file.flush()
+                file.seek(0)
+                self.assertEqual(var, serializer.deserialize(file))
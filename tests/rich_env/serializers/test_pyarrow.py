@@ -0,0 +1,76 @@
+import io
+import tempfile
+from typing import List, cast, BinaryIO
+
+# noinspection PyPackageRequirements
+import pyarrow as pa
+
+from serialzy.registry import DefaultSerializerRegistry
+from serialzy.serializers.pyarrow import PyarrowSerializer
+from tests.rich_env.serializers.test_base_model import ModelBaseSerializerTests
+from tests.rich_env.serializers.test_sequence import NonSeekable
+
+
+class PyarrowSerializationTests(ModelBaseSerializerTests):
+    def setUp(self):
+        self.initialize("pyarrow")
+        self.batch = pa.RecordBatch.from_pydict({'a': [1, 2, 3], 'b': ['x', None, 'z']})
+        self.table = pa.Table.from_batches([self.batch, self.batch.slice(1)])
+
+    def test_serialization(self):
+        self.assertTrue(self.table.equals(self.base_test(self.table, PyarrowSerializer)))
+        self.assertTrue(self.batch.equals(self.base_test(self.batch, PyarrowSerializer)))
+
+        empty = self.batch.slice(0, 0)
+        self.assertTrue(empty.equals(self.base_test(empty, PyarrowSerializer)))
+
+    def test_serialization_with_meta(self):
+        self.assertTrue(self.table.equals(self.base_test_with_meta(self.table, PyarrowSerializer)))
+
+    def test_serialization_with_user_meta(self):
+        self.assertEqual({'a': 'b'}, self.base_test_with_user_meta(self.table, PyarrowSerializer, {'a': 'b'}))
+
+    def test_iter_deserialization(self):
+        serializer = self.registry.find_serializer_by_type(pa.Table)
+        assert isinstance(serializer, PyarrowSerializer)
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(self.table, file)
+            file.write(b'tail')
+            file.flush()
+
+            file.seek(0)
+            batches = list(serializer.iter_deserialize(file))
+            self.assertEqual(2, len(batches))
+            self.assertTrue(self.table.equals(pa.Table.from_batches(batches)))
+            self.assertEqual(b'tail', file.read())
+
+            file.seek(0)
+            with io.BufferedReader(cast(io.RawIOBase, NonSeekable(file))) as source:
+                batches = list(serializer.iter_deserialize(cast(BinaryIO, source)))
+                self.assertTrue(self.table.equals(pa.Table.from_batches(batches)))
+                self.assertEqual(b'tail', source.read())
+
+    def test_sequence_of_tables(self):
+        serializer = DefaultSerializerRegistry().find_serializer_by_type(List[pa.Table])
+        tables = [self.table, self.table.slice(2)]
+        for buffer in (io.BytesIO(), tempfile.TemporaryFile()):
+            with buffer:
+                serializer.serialize(tables, buffer)
+                buffer.seek(0)
+                for expected, actual in zip(tables, serializer.deserialize(buffer)):
+                    self.assertTrue(expected.equals(actual))
+
+    def test_unpack(self):
+        with self.base_unpack_test(self.table, PyarrowSerializer) as test_dir_name:
+            with pa.OSFile(test_dir_name + "/data.arrows") as file:
+                self.assertTrue(self.table.equals(pa.ipc.open_stream(file).read_all()))
+
+    def test_schema(self):
+        self.base_schema('arrow', pa.Table)
+
+    def test_resolve(self):
+        self.base_resolve('arrow', pa.Table)
+
+    def test_invalid_types(self):
+        self.base_invalid_types(self.table, pa.Table)
@@ -0,0 +1,215 @@
+import dataclasses
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional
+from unittest import TestCase, mock
+
+from serialzy.api import Schema
+from serialzy.registry import DefaultSerializerRegistry
+from serialzy.serializers.record import RecordSerializerBase, RecordSerializerStable, RecordSerializerUnstable
+from serialzy.serializers.sequence import SequenceSerializerBase
+from tests.rich_env.serializers.utils import serialize_and_deserialize
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: float
+    name: str
+    tags: List[str]
+    extra: Optional[int] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class Frozen:
+    point: Point
+    counts: Dict[str, int]
+    total: int = dataclasses.field(init=False, default=0)
+
+
+class Pair(NamedTuple):
+    a: int
+    b: str
+
+
+class Opaque:
+    def __eq__(self, other):
+        return type(other) is Opaque
+
+
+@dataclasses.dataclass
+class WithOpaque:
+    opaque: Opaque
+    anything: Any
+
+
+@dataclasses.dataclass
+class Node:
+    value: int
+    next: Optional['Node'] = None
+
+
+@dataclasses.dataclass
+class WithDerived:
+    value: int
+
+    def __post_init__(self):
+        self.doubled = self.value * 2
+
+
+class RecordSerializationTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_find_by_type(self):
+        self.assertIsInstance(self.registry.find_serializer_by_type(Point), RecordSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(Frozen), RecordSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(Pair), RecordSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(WithOpaque), RecordSerializerUnstable)
+        # recursive records fall back to cloudpickle
+        self.assertNotIsInstance(self.registry.find_serializer_by_type(Node), RecordSerializerBase)
+
+    def test_serialization(self):
+        for obj in (
+            Point(1, 2.5, 'name', ['a', 'b']),
+            Point(True, 1, 'name', [], 5),  # values that do not match annotations are written with their headers
+            Frozen(Point(1, 2.0, 'x', ['q']), {'a': 1}),
+            Pair(1, 'b'),
+            WithOpaque(Opaque(), [1, 'x']),
+        ):
+            serializer = self.registry.find_serializer_by_instance(obj)
+            assert serializer
+            self.assertEqual(obj, serialize_and_deserialize(serializer, obj))
+
+        serializer = self.registry.find_serializer_by_type(Point)
+        assert serializer
+        deserialized = serialize_and_deserialize(serializer, Point(True, 1, 'name', []))
+        self.assertIs(bool, type(deserialized.x))
+        self.assertIs(int, type(deserialized.y))
+
+    def test_attributes_beyond_fields(self):
+        obj = WithDerived(21)
+        obj.note = 'set later'  # type: ignore
+        serializer = self.registry.find_serializer_by_type(WithDerived)
+        assert serializer
+        deserialized = serialize_and_deserialize(serializer, obj)
+        self.assertEqual(obj.__dict__, deserialized.__dict__)
+
+        objs = [WithDerived(1), obj, WithDerived(3)]
+        serializer = self.registry.find_serializer_by_type(List[WithDerived])
+        assert serializer
+        deserialized = serialize_and_deserialize(serializer, objs)
+        self.assertEqual([o.__dict__ for o in objs], [o.__dict__ for o in deserialized])
+
+    def test_plan_is_reused(self):
+        serializer = self.registry.find_serializer_by_type(Pair)
+        assert serializer
+        serialize_and_deserialize(serializer, Pair(0, 'b'))
+        with mock.patch.object(self.registry, 'find_serializer_by_type') as find:
+            for i in range(3):
+                self.assertEqual(Pair(i, 'b'), serialize_and_deserialize(serializer, Pair(i, 'b')))
+        find.assert_not_called()
+
+    def test_plans_of_records_only(self):
+        serializer = self.registry.find_serializer_by_type(Pair)
+        assert isinstance(serializer, RecordSerializerBase)
+        for typ in (int, List[int], Dict[str, int], Optional[Pair], List[Pair]):
+            self.registry.find_serializer_by_type(typ)
+        self.assertEqual(1, serializer._plans.info().currsize)
+
+    def test_local_records(self):
+        @dataclasses.dataclass
+        class Local:
+            value: int
+
+        class LocalPair(NamedTuple):
+            a: int
+
+        self.assertNotIsInstance(self.registry.find_serializer_by_type(LocalPair), RecordSerializerBase)
+        serializer = self.registry.find_serializer_by_type(Local)
+        self.assertNotIsInstance(serializer, RecordSerializerBase)
+        assert serializer
+        self.assertEqual(Local(1), serialize_and_deserialize(serializer, Local(1)))
+
+    def test_main_records(self):
+        with tempfile.TemporaryDirectory() as path:
+            data = os.path.join(path, 'data')
+            write = "import dataclasses, typing; from serialzy.registry import DefaultSerializerRegistry\n" \
+                    "@dataclasses.dataclass\nclass Point:\n    x: int\n" \
+                    "class Pair(typing.NamedTuple):\n    a: int\n" \
+                    "registry = DefaultSerializerRegistry()\n" \
+                    "serializer = registry.find_serializer_by_type(Point)\n" \
+                    f"with open({data!r}, 'wb') as file:\n" \
+                    "    serializer.serialize(Point(1), file)\n" \
+                    "print(serializer.data_format(), registry.find_serializer_by_type(Pair).data_format())"
+            formats = subprocess.run([sys.executable, '-c', write], check=True, capture_output=True,
+                                     text=True).stdout.split()
+            self.assertFalse({'serialzy_record_stable', 'serialzy_record_unstable'} & set(formats))
+
+            read = "import sys; from serialzy.registry import DefaultSerializerRegistry\n" \
+                   f"with open({data!r}, 'rb') as file:\n" \
+                   "    serializer = DefaultSerializerRegistry().find_serializer_by_data_format(sys.argv[1])\n" \
+                   "    print(serializer.deserialize(file))"
+            output = subprocess.run([sys.executable, '-c', read, formats[0]], check=True, capture_output=True,
+                                    text=True).stdout
+            self.assertEqual('Point(x=1)', output.strip())
+
+    def test_columnar_lists(self):
+        points = [Point(i, i / 2, str(i), [str(i)] * (i % 3), i if i % 2 else None) for i in range(100)]
+        serializer = self.registry.find_serializer_by_instance(points)
+        assert isinstance(serializer, SequenceSerializerBase)
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(points, buffer)
+            buffer.seek(0)
+            self.assertEqual(points, serializer.deserialize(buffer))
+
+            buffer.seek(0)
+            serializer._deserialize_type(buffer)
+            length_word = int.from_bytes(buffer.read(8), byteorder='little')
+            self.assertEqual(SequenceSerializerBase.BLOCK_LAYOUT, length_word >> SequenceSerializerBase.LAYOUT_SHIFT)
+
+        for obj in ([Pair(i, str(i)) for i in range(10)], [Point(1, 1.0, 'a', []), Point(False, 1, 'b', ['c'])],
+                    [Frozen(Point(1, 2.0, 'x', ['q']), {'a': 1})] * 3):
+            serializer = self.registry.find_serializer_by_instance(obj)
+            assert serializer
+            self.assertEqual(obj, serialize_and_deserialize(serializer, obj))
+
+    def test_schema(self):
+        serializer = self.registry.find_serializer_by_type(Point)
+        assert serializer
+
+        schema = serializer.schema(Point)
+        self.assertEqual('serialzy_record_stable', schema.data_format)
+        self.assertEqual('serialzy_record_schema', schema.schema_format)
+        content = json.loads(schema.schema_content)
+        self.assertEqual(['x', 'y', 'name', 'tags', 'extra'], [field['name'] for field in content['fields']])
+        self.assertEqual(Point, serializer.resolve(schema))
+
+        content['fields'] = content['fields'][1:]
+        with self.assertRaisesRegex(ValueError, 'Fields of*'):
+            serializer.resolve(Schema(schema.data_format, schema.schema_format, json.dumps(content), schema.meta))
+
+        with self.assertRaisesRegex(ValueError, 'Invalid schema format*'):
+            serializer.resolve(Schema(schema.data_format, 'invalid', schema.schema_content, schema.meta))
+
+        with self.assertLogs() as cm:
+            serializer.resolve(Schema(schema.data_format, schema.schema_format, schema.schema_content, {}))
+            self.assertRegex(cm.output[0], 'No serialzy version in meta')
+
+    def test_invalid_types(self):
+        serializer = self.registry.find_serializer_by_type(Point)
+        assert serializer
+
+        with self.assertRaisesRegex(TypeError, 'Invalid object type*'):
+            serializer.serialize(1, io.BytesIO())
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(Point(1, 2.0, 'a', []), buffer)
+            buffer.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(buffer, Pair)
@@ -1,11 +1,15 @@
+import dataclasses
+import io
+import json
+import math
 import sys
 import tempfile
-from typing import List, Tuple, Any, Optional
+from typing import List, Tuple, Any, Optional, BinaryIO, cast
 from unittest import TestCase
 
 from serialzy.api import Serializer, Schema
 from serialzy.registry import DefaultSerializerRegistry
-from serialzy.serializers.sequence import SequenceSerializerStable, SequenceSerializerUnstable
+from serialzy.serializers.sequence import SequenceSerializerBase, SequenceSerializerStable, SequenceSerializerUnstable
 from serialzy.types import get_type
 from tests.rich_env.serializers.utils import serialize_and_deserialize
 
@@ -18,6 +22,25 @@ class A:
         return other.x == self.x
 
 
+class NonSeekable(io.RawIOBase):
+    def __init__(self, source: BinaryIO):
+        self._source = source
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._source.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def write(self, data: Any) -> int:
+        return self._source.write(data)
+
+
 class SequenceSerializationTests(TestCase):
     def setUp(self):
         self.registry = DefaultSerializerRegistry()
@@ -224,3 +247,216 @@ class SequenceSerializationTests(TestCase):
         self.assertEqual(SequenceSerializerUnstable, type(serializer))
         self._check_serialized_and_deserialized(tuple(A(i) for i in range(1000)), serializer)
         self._check_serialized_and_deserialized(tuple([i] for i in range(1000)), serializer)
+
+    def test_shared_schema_layout(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert serializer
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(list(range(100)), file)
+            file.flush()
+            file.seek(0)
+            data = file.read()
+            # only the sequence itself has a header
+            self.assertEqual(1, data.count(Serializer.BINARY_HEADER_BYTES))
+
+            file.seek(0)
+            self.assertEqual(list(range(100)), serializer.deserialize(file))
+
+        self._check_serialized_and_deserialized([[1, 2], [3], []], serializer)
+        self._check_serialized_and_deserialized((1, "str", 2.0, None), serializer)
+        self._check_serialized_and_deserialized(((1, "str"), (2, "str")), serializer)
+
+    def test_heterogeneous_elements(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert serializer
+
+        # element type is inferred from the first element, so other elements are written with own headers
+        self._check_serialized_and_deserialized([1, "str", 2.0, None, True], serializer)
+        self._check_serialized_and_deserialized([[1, 2], ["str"]], serializer)
+
+    def test_json_header_per_element_layout(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        primitive_serializer = self.registry.find_serializer_by_type(int)
+        assert serializer and primitive_serializer
+
+        def json_header(schema: Schema) -> bytes:
+            schema_bytes = json.dumps(dataclasses.asdict(schema)).encode('utf-8')
+            return Serializer.HEADER_BYTES + len(schema_bytes).to_bytes(8, 'little') + schema_bytes
+
+        with tempfile.TemporaryFile() as file:
+            file.write(json_header(serializer.schema(List[int])))
+            file.write((3).to_bytes(8, 'little'))
+            for i in range(3):
+                data_format = primitive_serializer.data_format().encode('utf-8')
+                elem = len(data_format).to_bytes(8, 'little') + data_format
+                elem += json_header(primitive_serializer.schema(int)) + str(i).encode('utf-8')
+                file.write(len(elem).to_bytes(8, 'little'))
+                file.write(elem)
+            file.flush()
+            file.seek(0)
+
+            self.assertEqual([0, 1, 2], serializer.deserialize(file))
+
+    def test_packed_primitives(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert serializer
+
+        ints = list(range(-1000, 1000))
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(ints, file)
+            file.flush()
+            self.assertLess(file.tell(), len(ints) * 8 + 1000)
+            file.seek(0)
+            self.assertEqual(ints, serializer.deserialize(file))
+
+        self._check_serialized_and_deserialized([2 ** 63 - 1, -2 ** 63], serializer)
+        self._check_serialized_and_deserialized([2 ** 64, -2 ** 63 - 1, 0, -1, 127, 128, -128, -129], serializer)
+        self._check_serialized_and_deserialized([10 ** 5000, -10 ** 5000], serializer)
+        self._check_serialized_and_deserialized([0.5, -1.0, float('inf'), 1e-300], serializer)
+        self._check_serialized_and_deserialized([True, False, True], serializer)
+        self._check_serialized_and_deserialized(tuple(float(i) for i in range(100)), serializer)
+        self._check_serialized_and_deserialized([[0.5, 1.5], [2.5]], serializer)
+        self._check_serialized_and_deserialized(['str', '', 'ünïcode', '\U0001F600'], serializer)
+
+        deserialized = serialize_and_deserialize(serializer, [float('nan')])
+        self.assertTrue(math.isnan(deserialized[0]))
+
+        deserialized = serialize_and_deserialize(serializer, [True, False])
+        self.assertEqual([bool, bool], [type(x) for x in deserialized])
+
+    def test_lazy_deserialization(self):
+        serializer = self.registry.find_serializer_by_type(List[A])
+        assert isinstance(serializer, SequenceSerializerBase)
+        data = [A(i) for i in range(1000)]
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(data, file)
+            file.flush()
+            file.seek(0)
+
+            lazy = serializer.deserialize_lazy(file, cache_size=2)
+            self.assertEqual(1000, len(lazy))
+            self.assertEqual(A(500), lazy[500])
+            self.assertEqual(A(999), lazy[-1])
+            self.assertEqual([A(1), A(3)], lazy[1:5:2])
+            self.assertEqual(data, list(lazy))
+            with self.assertRaises(IndexError):
+                _ = lazy[1000]
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize([A(1), "str", None], file)
+            file.flush()
+            file.seek(0)
+
+            lazy = serializer.deserialize_lazy(file)
+            self.assertEqual([None, "str", A(1)], [lazy[2], lazy[1], lazy[0]])
+
+    def test_lazy_deserialization_fallback(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert isinstance(serializer, SequenceSerializerBase)
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize([1, 2, 3], file)
+            file.flush()
+            file.seek(0)
+            self.assertEqual([1, 2, 3], serializer.deserialize_lazy(file))
+
+            file.seek(0)
+            with io.BufferedReader(cast(io.RawIOBase, NonSeekable(file))) as source:
+                self.assertEqual([1, 2, 3], serializer.deserialize_lazy(cast(BinaryIO, source)))
+
+    def test_iter_deserialization(self):
+        serializer = self.registry.find_serializer_by_type(List[A])
+        assert isinstance(serializer, SequenceSerializerBase)
+
+        for data in ([A(i) for i in range(100)], [A(1), "str", None], [[1, 2], [3]], [1, 2, 3], []):
+            with tempfile.TemporaryFile() as file:
+                serializer.serialize(data, file)
+                file.write(b'tail')
+                file.flush()
+                file.seek(0)
+
+                with io.BufferedReader(cast(io.RawIOBase, NonSeekable(file))) as source:
+                    iterator = serializer.iter_deserialize(cast(BinaryIO, source))
+                    self.assertEqual(data, list(iterator))
+                    self.assertEqual(b'tail', source.read())
+
+    def test_serialize_iter(self):
+        serializer = self.registry.find_serializer_by_type(List[A])
+        assert isinstance(serializer, SequenceSerializerBase)
+
+        for data in ([A(i) for i in range(100)], [1, 2, 3], [[1], [2, 3]], []):
+            with tempfile.TemporaryFile() as file:
+                serializer.serialize_iter((x for x in data), file, {'key': 'value'})
+                file.flush()
+
+                file.seek(0)
+                self.assertEqual(data, serializer.deserialize(file))
+                file.seek(0)
+                self.assertEqual({'key': 'value'}, serializer.deserialize_user_meta(file))
+
+            with io.BytesIO() as buffer:
+                with io.BufferedWriter(cast(io.RawIOBase, NonSeekable(cast(BinaryIO, buffer)))) as dest:
+                    serializer.serialize_iter(iter(data), cast(BinaryIO, dest))
+                    dest.flush()
+
+                    buffer.seek(0)
+                    self.assertEqual(data, serializer.deserialize(buffer))
+                    buffer.seek(0)
+                    self.assertEqual(data, list(serializer.iter_deserialize(buffer)))
+                    buffer.seek(0)
+                    self.assertEqual(data, list(serializer.deserialize_lazy(buffer)))
+
+    def test_sequence_writer(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert isinstance(serializer, SequenceSerializerBase)
+
+        with tempfile.TemporaryFile() as file:
+            with serializer.writer(file) as writer:
+                writer.write(1)
+                with self.assertRaisesRegex(TypeError, 'Cannot write element of type*'):
+                    writer.write("str")
+                writer.write(2)
+            with self.assertRaisesRegex(ValueError, 'Sequence writer is closed'):
+                writer.write(3)
+
+            file.flush()
+            file.seek(0)
+            self.assertEqual([1, 2], serializer.deserialize(file))
+
+        with tempfile.TemporaryFile() as file:
+            with self.assertRaisesRegex(TypeError, "Invalid object type*"):
+                with serializer.writer(file) as writer:
+                    writer.write(A(1))
+
+        with tempfile.TemporaryFile() as file:
+            with self.assertRaisesRegex(RuntimeError, "aborted"):
+                with serializer.writer(file) as writer:
+                    writer.write(1)
+                    raise RuntimeError("aborted")
+            file.flush()
+            file.seek(0)
+            with self.assertRaises(EOFError):
+                serializer.deserialize(file)
+
+    def test_large_elements(self):
+        serializer = self.registry.find_serializer_by_type(List[Any])
+        assert isinstance(serializer, SequenceSerializerBase)
+
+        for data in ([list(range(50000)), [1], list(range(20000))], [list(range(50000)), "y" * 100000, None]):
+            with tempfile.TemporaryFile() as file:
+                serializer.serialize(data, file)
+                file.flush()
+                file.seek(0)
+                self.assertEqual(data, serializer.deserialize(file))
+                file.seek(0)
+                self.assertEqual(data, list(serializer.deserialize_lazy(file)))
+
+            with io.BytesIO() as buffer:
+                with io.BufferedWriter(cast(io.RawIOBase, NonSeekable(cast(BinaryIO, buffer)))) as dest:
+                    serializer.serialize(data, cast(BinaryIO, dest))
+                    dest.flush()
+
+                    buffer.seek(0)
+                    self.assertEqual(data, serializer.deserialize(buffer))
@@ -0,0 +1,104 @@
+import io
+import json
+from typing import FrozenSet, List, Set
+from unittest import TestCase
+
+from serialzy.api import Schema
+from serialzy.registry import DefaultSerializerRegistry
+from serialzy.serializers.sequence import SequenceSerializerBase
+from serialzy.serializers.sets import SetSerializerBase, SetSerializerStable, SetSerializerUnstable
+from serialzy.types import EmptyContent, get_type
+from tests.rich_env.serializers.utils import serialize_and_deserialize
+
+
+class A:
+    def __init__(self, a: int):
+        self.a = a
+
+    def __eq__(self, other):
+        return isinstance(other, A) and self.a == other.a
+
+    def __hash__(self):
+        return hash(self.a)
+
+
+class SetSerializationTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_get_type(self):
+        self.assertEqual(Set[int], get_type({1, 2}))
+        self.assertEqual(FrozenSet[str], get_type(frozenset({'a'})))
+        self.assertEqual(Set[EmptyContent], get_type(set()))
+
+    def test_find_by_type(self):
+        self.assertIsInstance(self.registry.find_serializer_by_type(Set[int]), SetSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(FrozenSet[str]), SetSerializerStable)
+        self.assertIsInstance(self.registry.find_serializer_by_type(Set[A]), SetSerializerUnstable)
+        self.assertIsInstance(self.registry.find_serializer_by_instance(set()), SetSerializerStable)
+        self.assertNotIsInstance(self.registry.find_serializer_by_type(set), SetSerializerBase)
+
+    def test_serialization(self):
+        for obj in (
+            {1, 2, 3},
+            frozenset({'a', 'b'}),
+            set(),
+            frozenset(),
+            {1, 'a', None},
+            {(1, 'a'), (2, 'b')},
+            {A(1), A(2)},
+        ):
+            serializer = self.registry.find_serializer_by_instance(obj)
+            assert serializer
+            deserialized = serialize_and_deserialize(serializer, obj)
+            self.assertEqual(obj, deserialized)
+            self.assertIs(type(obj), type(deserialized))
+
+    def test_packed_elements(self):
+        serializer = self.registry.find_serializer_by_type(Set[int])
+        assert serializer
+
+        obj = set(range(1000))
+        with io.BytesIO() as buffer:
+            serializer.serialize(obj, buffer)
+            self.assertLess(buffer.tell(), 1000 * 8 + 1000)
+            buffer.seek(0)
+            serializer._deserialize_type(buffer)
+            length_word = int.from_bytes(buffer.read(8), byteorder='little')
+            self.assertEqual(SequenceSerializerBase.BLOCK_LAYOUT, length_word >> SequenceSerializerBase.LAYOUT_SHIFT)
+            buffer.seek(0)
+            self.assertEqual(obj, serializer.deserialize(buffer))
+
+    def test_schema(self):
+        serializer = self.registry.find_serializer_by_type(FrozenSet[List[int]])
+        assert serializer
+
+        schema = serializer.schema(FrozenSet[List[int]])
+        self.assertEqual('serialzy_set_stable', schema.data_format)
+        self.assertEqual('serialzy_set_schema', schema.schema_format)
+        self.assertEqual('frozenset', json.loads(schema.schema_content)['origin'])
+        self.assertEqual(FrozenSet[List[int]], serializer.resolve(schema))
+
+        with self.assertRaisesRegex(ValueError, 'Invalid schema format*'):
+            serializer.resolve(Schema(schema.data_format, 'invalid', schema.schema_content, schema.meta))
+
+        with self.assertRaisesRegex(ValueError, 'Invalid schema content*'):
+            serializer.resolve(Schema(schema.data_format, schema.schema_format, json.dumps({'origin': 'list'}),
+                                      schema.meta))
+
+        with self.assertLogs() as cm:
+            serializer.resolve(Schema(schema.data_format, schema.schema_format, schema.schema_content, {}))
+            self.assertRegex(cm.output[0], 'No serialzy version in meta')
+
+    def test_invalid_types(self):
+        serializer = self.registry.find_serializer_by_type(Set[int])
+        assert serializer
+
+        with self.assertRaisesRegex(TypeError, 'Invalid object type*'):
+            serializer.serialize([1], io.BytesIO())
+
+        with io.BytesIO() as buffer:
+            serializer.serialize({1}, buffer)
+            buffer.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(buffer, Set[str])
@@ -0,0 +1,143 @@
+import datetime
+import decimal
+import enum
+import io
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import uuid
+from typing import List
+from unittest import TestCase, skipIf
+
+from serialzy.api import Schema
+from serialzy.registry import DefaultSerializerRegistry
+from serialzy.serializers.stdlib import StdlibValueSerializer
+from tests.rich_env.serializers.utils import serialize_and_deserialize
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 'green'
+
+
+class Permission(enum.Flag):
+    READ = 1
+    WRITE = 2
+
+
+class StdlibValueSerializationTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_find_by_type(self):
+        for typ in (datetime.datetime, datetime.date, datetime.timedelta, decimal.Decimal, uuid.UUID, pathlib.Path,
+                    pathlib.PurePosixPath, pathlib.PureWindowsPath, Color):
+            self.assertIsInstance(self.registry.find_serializer_by_type(typ), StdlibValueSerializer)
+        self.assertNotIsInstance(self.registry.find_serializer_by_type(Permission), StdlibValueSerializer)
+
+    def test_main_enums(self):
+        with tempfile.TemporaryDirectory() as path:
+            data = os.path.join(path, 'data')
+            write = "import enum; from serialzy.registry import DefaultSerializerRegistry\n" \
+                    "class Size(enum.Enum):\n    SMALL = 1\n" \
+                    "serializer = DefaultSerializerRegistry().find_serializer_by_type(Size)\n" \
+                    f"with open({data!r}, 'wb') as file:\n" \
+                    "    serializer.serialize(Size.SMALL, file)\n" \
+                    "print(serializer.data_format())"
+            data_format = subprocess.run([sys.executable, '-c', write], check=True, capture_output=True,
+                                         text=True).stdout.strip()
+            self.assertNotEqual('serialzy_stdlib_value', data_format)
+
+            read = "import sys; from serialzy.registry import DefaultSerializerRegistry\n" \
+                   f"with open({data!r}, 'rb') as file:\n" \
+                   "    serializer = DefaultSerializerRegistry().find_serializer_by_data_format(sys.argv[1])\n" \
+                   "    print(serializer.deserialize(file))"
+            output = subprocess.run([sys.executable, '-c', read, data_format], check=True, capture_output=True,
+                                    text=True).stdout
+            self.assertEqual('Size.SMALL', output.strip())
+
+    def test_serialization(self):
+        utc = datetime.timezone.utc
+        values = [
+            datetime.datetime(2020, 1, 2, 3, 4, 5, 6),
+            datetime.datetime.min,
+            datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=utc),
+            datetime.datetime(2021, 3, 4, tzinfo=datetime.timezone(datetime.timedelta(hours=-3, microseconds=5))),
+            datetime.date(2020, 5, 6),
+            datetime.timedelta.max,
+            datetime.timedelta.min,
+            datetime.timedelta(seconds=-1.5),
+            uuid.uuid4(),
+            pathlib.Path('/a/b'),
+            pathlib.PureWindowsPath('C:\\x\\y'),
+            Color.RED,
+            Color.GREEN,
+        ]
+        for value in values:
+            for obj in (value, [value, value]):
+                serializer = self.registry.find_serializer_by_instance(obj)
+                assert serializer
+                deserialized = serialize_and_deserialize(serializer, obj)
+                self.assertEqual(obj, deserialized)
+                self.assertIs(type(value), type(deserialized[0] if isinstance(obj, list) else deserialized))
+
+        for number in ('1.2300', '-0', 'NaN', '-sNaN', '-Infinity', '1E-100', str(2 ** 100)):
+            serializer = self.registry.find_serializer_by_type(decimal.Decimal)
+            assert serializer
+            self.assertEqual(number, str(serialize_and_deserialize(serializer, decimal.Decimal(number))))
+
+    @skipIf(sys.version_info < (3, 9), "zoneinfo is available since python 3.9")
+    def test_timezones(self):
+        import zoneinfo  # type: ignore
+        zone = zoneinfo.ZoneInfo('America/New_York')
+        obj = [
+            datetime.datetime(2021, 11, 7, 1, 30, fold=1, tzinfo=zone),
+            datetime.datetime(2021, 11, 7, 1, 30, tzinfo=zone),
+            datetime.datetime(2021, 11, 7, 1, 30),
+            datetime.datetime(2021, 11, 7, 1, 30, tzinfo=datetime.timezone.utc),
+        ]
+        serializer = self.registry.find_serializer_by_instance(obj)
+        assert serializer
+        deserialized = serialize_and_deserialize(serializer, obj)
+        self.assertEqual([(x, x.tzinfo, x.fold) for x in obj], [(x, x.tzinfo, x.fold) for x in deserialized])
+
+    def test_packed_sequences(self):
+        obj: List[datetime.datetime] = [datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=i) for i in
+                                        range(1000)]
+        serializer = self.registry.find_serializer_by_instance(obj)
+        assert serializer
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(obj, buffer)
+            self.assertLess(buffer.tell(), 1000 * 8 + 1000)
+            buffer.seek(0)
+            self.assertEqual(obj, serializer.deserialize(buffer))
+
+    def test_schema(self):
+        serializer = self.registry.find_serializer_by_type(Color)
+        assert serializer
+
+        schema = serializer.schema(Color)
+        self.assertEqual('serialzy_stdlib_value', schema.data_format)
+        self.assertEqual({'module': __name__, 'name': 'Color'}, json.loads(schema.schema_content))
+        self.assertEqual(Color, serializer.resolve(schema))
+        self.assertEqual(uuid.UUID, serializer.resolve(serializer.schema(uuid.UUID)))
+
+        with self.assertRaisesRegex(ValueError, 'Invalid schema format*'):
+            serializer.resolve(Schema(schema.data_format, 'invalid', schema.schema_content, schema.meta))
+
+    def test_invalid_types(self):
+        serializer = self.registry.find_serializer_by_type(datetime.datetime)
+        assert serializer
+
+        with self.assertRaisesRegex(TypeError, 'Invalid object type*'):
+            serializer.serialize(1, io.BytesIO())
+
+        with io.BytesIO() as buffer:
+            serializer.serialize(datetime.datetime.now(), buffer)
+            buffer.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(buffer, datetime.date)
@@ -0,0 +1,329 @@
+import base64
+import dataclasses
+import json
+import tempfile
+from typing import List
+from unittest import TestCase
+
+# noinspection PyPackageRequirements
+import cloudpickle
+
+from serialzy.api import Schema, Serializer, StandardDataFormats, StandardSchemaFormats, _encode_schema
+from serialzy.cloudpickle import CloudpickleSerializer
+from serialzy.registry import DefaultSerializerRegistry
+
+
+class B:
+    def __init__(self, x: int):
+        self.x = x
+
+
+class HeaderTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_json_header_is_readable(self):
+        serializer = self.registry.find_serializer_by_type(int)
+        assert serializer
+        schema_bytes = json.dumps(dataclasses.asdict(serializer.schema(int))).encode('utf-8')
+
+        with tempfile.TemporaryFile() as file:
+            file.write(Serializer.HEADER_BYTES)
+            file.write(len(schema_bytes).to_bytes(length=8, byteorder='little', signed=False))
+            file.write(schema_bytes)
+            file.write(b'42')
+            file.flush()
+
+            file.seek(0)
+            self.assertEqual(StandardDataFormats.primitive_type.name, Serializer.deserialize_data_format(file))
+            file.seek(0)
+            self.assertEqual(42, serializer.deserialize(file))
+
+    def test_binary_header(self):
+        serializer = self.registry.find_serializer_by_type(int)
+        assert serializer
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(42, file, {'key': 'value'})
+            file.flush()
+
+            file.seek(0)
+            self.assertEqual(Serializer.BINARY_HEADER_BYTES, file.read(Serializer.HEADER_BYTES_LEN))
+            self.assertEqual(bytes((Serializer.BINARY_HEADER_VERSION,)), file.read(1))
+
+            file.seek(0)
+            schema = Serializer._deserialize_schema(file)
+            self.assertEqual(serializer.schema(int).schema_content, schema.schema_content)
+            self.assertEqual(StandardDataFormats.primitive_type.name, schema.data_format)
+            self.assertIn('serialzy', schema.meta)
+
+            file.seek(0)
+            self.assertEqual({'key': 'value'}, Serializer.deserialize_user_meta(file))
+
+    def test_pickled_type_stored_as_raw_bytes(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+        schema = serializer.schema(B)
+        self.assertEqual(StandardSchemaFormats.pickled_type.name, schema.schema_format)
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(B(42), file)
+            file.flush()
+
+            file.seek(0)
+            data = file.read()
+            self.assertIn(base64.b64decode(schema.schema_content), data)
+            self.assertNotIn(schema.schema_content.encode('ascii'), data)
+
+            file.seek(0)
+            self.assertEqual(schema, Serializer._deserialize_schema(file))
+            file.seek(0)
+            self.assertEqual(42, serializer.deserialize(file).x)
+
+    def test_invalid_base64_content_kept_as_text(self):
+        schema = Schema(StandardDataFormats.pickle.name, StandardSchemaFormats.pickled_type.name, 'not base64!', {})
+        with tempfile.TemporaryFile() as file:
+            file.write(Serializer.BINARY_HEADER_BYTES)
+            file.write(bytes((Serializer.BINARY_HEADER_VERSION,)))
+            schema_bytes = _encode_schema(schema)
+            self.assertIn(b'not base64!', schema_bytes)
+            file.write(len(schema_bytes).to_bytes(length=8, byteorder='little', signed=False))
+            file.write(schema_bytes)
+            file.flush()
+
+            file.seek(0)
+            deserialized = Serializer._deserialize_schema(file)
+            self.assertEqual(schema, deserialized)
+            self.assertIsInstance(deserialized.schema_content, str)
+
+    def test_unsupported_header_version(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(Serializer.BINARY_HEADER_BYTES)
+            file.write(bytes((Serializer.BINARY_HEADER_VERSION + 1,)))
+            file.flush()
+            file.seek(0)
+
+            with self.assertRaisesRegex(ValueError, "Unsupported header version*"):
+                Serializer._deserialize_schema(file)
+
+
+class SchemaCacheTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_schema_is_hashable(self):
+        schema = Schema('format', 'schema_format', 'content', {'key': 'value'})
+        self.assertEqual(hash(schema), hash(Schema('format', 'schema_format', 'content', {'key': 'value'})))
+        self.assertEqual({schema}, {Schema('format', 'schema_format', 'content', {'key': 'value'})})
+
+        with self.assertRaisesRegex(TypeError, "Schema meta is immutable"):
+            schema.meta['key'] = 'other'
+        with self.assertRaisesRegex(TypeError, "Schema meta is immutable"):
+            schema.meta.update({'key': 'other'})
+        self.assertEqual({'key': 'value'}, schema.meta)
+        self.assertEqual({'key': 'value'}, dataclasses.asdict(schema)['meta'])
+
+    def test_schema_is_computed_once_per_type(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+
+        calls = []
+        schema = serializer.schema
+
+        def counting_schema(typ):
+            calls.append(typ)
+            return schema(typ)
+
+        serializer.schema = counting_schema  # type: ignore
+        for i in range(3):
+            with tempfile.TemporaryFile() as file:
+                serializer.serialize(B(i), file)
+        self.assertEqual([B], calls)
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(B(4), file, {'key': 'value'})
+            file.seek(0)
+            self.assertEqual({'key': 'value'}, Serializer.deserialize_user_meta(file))
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(B(5), file)
+            file.seek(0)
+            self.assertNotIn(Serializer.USER_META_KEY, Serializer._deserialize_schema(file).meta)
+        self.assertEqual([B], calls)
+
+    def test_schema_cache_is_invalidated_on_registration(self):
+        serializer = self.registry.find_serializer_by_type(List[B])
+        assert serializer
+        self.assertEqual("serialzy_sequence_unstable", serializer.data_format())
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize([B(1)], file)
+            file.seek(0)
+            self.assertIn(StandardDataFormats.pickle.name, Serializer._deserialize_schema(file).schema_content)
+
+        class StableB(CloudpickleSerializer):
+            def stable(self) -> bool:
+                return True
+
+            def supported_types(self):
+                return B
+
+            def data_format(self) -> str:
+                return "stable_b"
+
+        self.registry.register_serializer(StableB())
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize([B(1)], file)
+            file.seek(0)
+            self.assertIn("stable_b", Serializer._deserialize_schema(file).schema_content)
+
+
+class ResolveCacheTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_resolved_once_per_schema(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+        schema = serializer.schema(B)
+        newer_schema = Schema(schema.data_format, schema.schema_format, schema.schema_content,
+                              {'cloudpickle': '10000.0.0'})
+
+        with tempfile.TemporaryFile() as file:
+            file.write(serializer._encode_header(newer_schema))
+            file.write(cloudpickle.dumps(B(42)))
+            file.flush()
+
+            with self.assertLogs('serialzy') as cm:
+                for _ in range(3):
+                    file.seek(0)
+                    self.assertEqual(42, serializer.deserialize(file).x)
+            self.assertEqual(1, len(cm.output))
+            self.assertRegex(cm.output[0], 'WARNING:serialzy.base:Installed version of cloudpickle*')
+
+        info = serializer.resolve_cache_info()
+        self.assertEqual(2, info.hits)
+        self.assertEqual(1, info.misses)
+        self.assertEqual(1, info.currsize)
+
+        serializer.clear_caches()
+        self.assertEqual(0, serializer.resolve_cache_info().currsize)
+
+    def test_user_meta_shares_resolved_type(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+
+        for i in range(3):
+            with tempfile.TemporaryFile() as file:
+                serializer.serialize(B(i), file, {'run': i})
+                file.flush()
+                file.seek(0)
+                self.assertEqual(i, serializer.deserialize(file).x)
+
+        info = serializer.resolve_cache_info()
+        self.assertEqual((2, 1, 1), (info.hits, info.misses, info.currsize))
+
+
+class TrustedTypeTests(TestCase):
+    def setUp(self):
+        self.registry = DefaultSerializerRegistry()
+
+    def test_trusted_type_is_not_resolved(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+
+        def failing_resolve(schema):
+            raise AssertionError('resolve must not be called')
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(B(42), file, {'key': 'value'})
+            file.flush()
+
+            file.seek(0)
+            serializer.resolve = failing_resolve  # type: ignore
+            self.assertEqual(42, serializer.deserialize(file, B, trusted=True).x)
+
+            file.seek(0)
+            with self.assertRaisesRegex(AssertionError, 'resolve must not be called'):
+                serializer.deserialize(file, B)
+
+    def test_trusted_type_mismatch(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+
+        class C:
+            pass
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize(B(42), file)
+            file.flush()
+
+            file.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(file, C, trusted=True)
+
+    def test_trusted_type_is_not_resolved_on_mismatch(self):
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+        schema = serializer.schema(B)
+        other_schema = Schema(schema.data_format, schema.schema_format, schema.schema_content + 'x')
+
+        def failing_resolve(schema):
+            raise AssertionError('resolve must not be called')
+
+        serializer.resolve = failing_resolve  # type: ignore
+        with tempfile.TemporaryFile() as file:
+            file.write(serializer._encode_header(other_schema))
+            file.write(cloudpickle.dumps(B(42)))
+            file.flush()
+
+            file.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(file, B, trusted=True)
+
+    def test_trusted_generic_type(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert serializer
+
+        with tempfile.TemporaryFile() as file:
+            serializer.serialize([1, 2, 3], file)
+            file.flush()
+
+            file.seek(0)
+            self.assertEqual([1, 2, 3], serializer.deserialize(file, List[int], trusted=True))
+            file.seek(0)
+            with self.assertRaisesRegex(TypeError, 'Cannot deserialize data with schema type*'):
+                serializer.deserialize(file, List[str], trusted=True)
+
+    def test_trusted_type_of_other_versions(self):
+        serializer = self.registry.find_serializer_by_type(List[int])
+        assert serializer
+        schema = serializer.schema(List[int])
+        content = json.loads(schema.schema_content)
+        content['args'][0]['meta'] = {'serialzy': '0.0.1'}
+        old_schema = Schema(schema.data_format, schema.schema_format, json.dumps(content), {'serialzy': '0.0.1'})
+
+        with tempfile.TemporaryFile() as file:
+            file.write(serializer._encode_header(old_schema))
+            serializer._serialize([1, 2, 3], file)
+            file.flush()
+
+            file.seek(0)
+            self.assertEqual([1, 2, 3], serializer.deserialize(file, List[int], trusted=True))
+
+        serializer = self.registry.find_serializer_by_type(B)
+        assert serializer
+        schema = serializer.schema(B)
+        # another protocol stands for another version of cloudpickle
+        old_schema = Schema(schema.data_format, schema.schema_format,
+                            base64.b64encode(cloudpickle.dumps(B, protocol=4)).decode('ascii'),
+                            {'cloudpickle': '0.0.1'})
+        self.assertNotEqual(schema.schema_content, old_schema.schema_content)
+
+        with tempfile.TemporaryFile() as file:
+            file.write(serializer._encode_header(old_schema))
+            file.write(cloudpickle.dumps(B(42)))
+            file.flush()
+
+            file.seek(0)
+            self.assertEqual(42, serializer.deserialize(file, B, trusted=True).x)
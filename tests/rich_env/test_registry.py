@@ -1,14 +1,26 @@
-from typing import Any, BinaryIO, Callable, Dict, Type, Union, Optional
-from unittest import TestCase
-
-from serialzy.api import Serializer, Schema, VersionBoundary
-from serialzy.registry import DefaultSerializerRegistry
+import ast
+import dataclasses
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+from typing import Any, BinaryIO, Callable, Dict, List, Tuple, Type, Union, Optional
+from unittest import TestCase, mock
+
+import serialzy.serializers
+from serialzy.api import Serializer, Schema, TypeMatcher, VersionBoundary
+from serialzy.manifest import SERIALIZERS_MANIFEST, SerializerManifestEntry
+from serialzy.registry import DefaultSerializerRegistry, FrozenSerializerRegistry
+from serialzy.serializers.primitive import PrimitiveSerializer
+from serialzy.utils import load_all_modules_from
 
 
 def generate_serializer(
         supported_types: Union[Type, Callable[[Type], bool]] = lambda x: True,
         available: bool = True,
         stable: bool = True,
+        type_matcher: Optional[TypeMatcher] = None,
 ) -> Type[Serializer]:
     class MockType:
         pass
@@ -44,6 +56,9 @@ def generate_serializer(
         def supported_types(self) -> Union[Type, Callable[[Type], bool]]:
             return supported_types
 
+        def type_matcher(self) -> Optional[TypeMatcher]:
+            return type_matcher
+
     return TestSerializer
 
 
@@ -51,6 +66,11 @@ class A:
     pass
 
 
+@dataclasses.dataclass
+class WithA:
+    a: A
+
+
 class SerializationRegistryTests(TestCase):
     def setUp(self):
         self.registry = DefaultSerializerRegistry()
@@ -138,3 +158,247 @@ class SerializationRegistryTests(TestCase):
 
         self.registry.register_serializer(serializer_2, 1)
         self.assertEqual(serializer_2, self.registry.find_serializer_by_type(A))
+
+    def test_type_matchers(self):
+        checked: List[Type] = []
+
+        def check(typ: Type) -> bool:
+            checked.append(typ)
+            return True
+
+        class B(A):
+            pass
+
+        by_module = generate_serializer(supported_types=check, type_matcher=TypeMatcher(modules=('tests',)))()
+        self.registry.register_serializer(by_module, priority=0)
+        self.assertEqual(by_module, self.registry.find_serializer_by_type(B))
+        self.assertNotEqual(by_module, self.registry.find_serializer_by_type(int))
+        self.assertNotEqual(by_module, self.registry.find_serializer_by_type(List[int]))
+        self.assertEqual([B], checked)
+        self.registry.unregister_serializer(by_module)
+
+        by_base = generate_serializer(supported_types=check, type_matcher=TypeMatcher(bases=(A,)))()
+        self.registry.register_serializer(by_base, priority=0)
+        self.assertEqual(by_base, self.registry.find_serializer_by_type(B))
+        self.assertNotEqual(by_base, self.registry.find_serializer_by_type(str))
+        self.registry.unregister_serializer(by_base)
+
+        by_type = generate_serializer(supported_types=check, type_matcher=TypeMatcher(types=(list,)))()
+        self.registry.register_serializer(by_type, priority=0)
+        self.assertEqual(by_type, self.registry.find_serializer_by_type(List[int]))
+        self.assertNotEqual(by_type, self.registry.find_serializer_by_type(B))
+        # registration and removal check cached types the type matcher matches, to invalidate only their lookups
+        self.assertEqual([B, B, B, B, List[int], List[int]], checked)
+
+    def test_cached_lookups(self):
+        checked: List[Type] = []
+
+        def check(typ: Type) -> bool:
+            checked.append(typ)
+            return False
+
+        cloudpickle = self.registry.find_serializer_by_type(A)
+        assert cloudpickle
+        self.registry.unregister_serializer(cloudpickle)
+        self.registry.register_serializer(generate_serializer(supported_types=check)())
+
+        # misses are cached
+        self.assertIsNone(self.registry.find_serializer_by_type(A))
+        self.assertIsNone(self.registry.find_serializer_by_type(A))
+        self.assertEqual([A], checked)
+        self.assertIsNone(self.registry.find_serializer_by_data_format('unknown'))
+        self.assertIsNone(self.registry.find_serializer_by_data_format('unknown'))
+        self.assertEqual(1, self.registry.data_format_cache_info().hits)
+
+        class Limited(DefaultSerializerRegistry):
+            TYPE_CACHE_SIZE = 2
+
+        registry = Limited()
+        for typ in (int, str, float, int):
+            registry.find_serializer_by_type(typ)
+        info = registry.type_cache_info()
+        self.assertEqual((0, 4, 2, 2, 2), (info.hits, info.misses, info.maxsize, info.currsize, info.evictions))
+
+    def test_cache_invalidation(self):
+        class B:
+            pass
+
+        def data_format(typ: Type) -> str:
+            serializer = self.registry.find_serializer_by_type(typ)
+            assert serializer
+            return serializer.data_format()
+
+        self.assertEqual("serialzy_sequence_unstable", data_format(List[B]))
+        self.registry.find_serializer_by_type(int)
+        self.registry.find_serializer_by_type(List[int])
+        self.assertEqual(4, self.registry.type_cache_info().currsize)  # B is looked up by the sequence serializer
+
+        stable_b = generate_serializer(supported_types=B, stable=True)()
+        self.registry.register_serializer(stable_b)
+        # lookups of B and types depending on it are dropped
+        self.assertEqual(2, self.registry.type_cache_info().currsize)
+        self.assertEqual(stable_b, self.registry.find_serializer_by_type(B))
+        self.assertEqual("serialzy_sequence_stable", data_format(List[B]))
+
+        self.registry.unregister_serializer(stable_b)
+        self.assertEqual(2, self.registry.type_cache_info().currsize)
+        self.assertEqual("serialzy_sequence_unstable", data_format(List[B]))
+
+        # predicates of serializers without type matchers are not called for every cached type
+        self.registry.register_serializer(generate_serializer(supported_types=lambda t: False)())
+        self.assertEqual(0, self.registry.type_cache_info().currsize)
+
+    def test_dependencies_of_cached_plans(self):
+        self.assertFalse(self.registry.find_serializer_by_type(WithA).stable())  # type: ignore
+        # the lookup is computed again from the plan of the record serializer
+        self.registry._serializer_type_cache.pop(WithA)
+        self.assertFalse(self.registry.find_serializer_by_type(WithA).stable())  # type: ignore
+
+        self.registry.register_serializer(generate_serializer(supported_types=A, stable=True)())
+        self.assertTrue(self.registry.find_serializer_by_type(WithA).stable())  # type: ignore
+
+    def test_freeze(self):
+        class B:
+            pass
+
+        types = [int, str, List[int], Dict[str, List[float]], Optional[int], B, List[B]]
+        for typ in types[:3]:
+            self.registry.find_serializer_by_type(typ)
+        frozen = self.registry.freeze()
+        for typ in types:
+            self.assertEqual(type(self.registry.find_serializer_by_type(typ)),
+                             type(frozen.find_serializer_by_type(typ)))
+        self.assertEqual(type(self.registry.find_serializer_by_data_format('serialzy_dict_stable')),
+                         type(frozen.find_serializer_by_data_format('serialzy_dict_stable')))
+        self.assertIsNone(frozen.find_serializer_by_data_format('unknown'))
+        self.assertIn(List[int], frozen._by_type)
+        # types unknown at freezing are memoized in a bounded cache
+        self.assertNotIn(List[B], frozen._by_type)
+        self.assertIn(List[B], dict(frozen._unknown_types.items()))
+        with mock.patch.object(FrozenSerializerRegistry, 'TYPE_CACHE_SIZE', 2):
+            small = self.registry.freeze()
+        for typ in (List[bytes], List[bytearray], List[complex]):
+            small.find_serializer_by_type(typ)
+        self.assertEqual((1, 2), (small._unknown_types.info().evictions, small._unknown_types.info().currsize))
+
+        # serializers of generic types look up their arguments in the frozen registry
+        sequence_serializer = frozen.find_serializer_by_type(List[int])
+        assert sequence_serializer
+        self.assertIs(frozen, getattr(sequence_serializer, '_registry'))
+        self.assertTrue(frozen.is_registered(sequence_serializer))
+        with tempfile.TemporaryFile() as file:
+            sequence_serializer.serialize([1, 2], file)
+            file.seek(0)
+            self.assertEqual([1, 2], sequence_serializer.deserialize(file))
+
+        with self.assertRaises(TypeError):
+            frozen.register_serializer(generate_serializer()())
+        with self.assertRaises(TypeError):
+            frozen.unregister_serializer(sequence_serializer)
+
+        stable_b = generate_serializer(supported_types=B, stable=True)()
+        self.registry.register_serializer(stable_b)
+        self.assertEqual(stable_b, self.registry.find_serializer_by_type(B))
+        self.assertNotEqual(stable_b, frozen.find_serializer_by_type(B))
+        self.assertFalse(frozen.is_registered(stable_b))
+
+    def test_manifest_matches_discovery(self):
+        load_all_modules_from(serialzy.serializers)
+        discovered: Dict[Tuple[str, str], SerializerManifestEntry] = {}
+        for serializer in self.registry._fetch_serializers_from(serialzy.serializers):
+            typ = type(serializer)
+            discovered.setdefault((typ.__module__, typ.__name__), SerializerManifestEntry(
+                typ.__module__, typ.__name__, serializer.data_format(), serializer.stable(),
+                serializer.type_matcher()))
+        self.assertEqual(list(discovered.values()), list(SERIALIZERS_MANIFEST))
+
+    def test_lazy_discovery(self):
+        code = "import sys; from serialzy.registry import DefaultSerializerRegistry; " \
+               "registry = DefaultSerializerRegistry(); registry.find_serializer_by_type(int); " \
+               "print(sorted(m for m in sys.modules if m.startswith('serialzy.serializers.')))"
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        # serializers without type matchers are loaded for any type
+        self.assertEqual(['serialzy.serializers.ellipsis', 'serialzy.serializers.primitive',
+                          'serialzy.serializers.proto', 'serialzy.serializers.record',
+                          'serialzy.serializers.sequence'], ast.literal_eval(output))
+
+        registry = DefaultSerializerRegistry()
+        registry.unregister_serializer(PrimitiveSerializer())
+        self.assertNotIsInstance(registry.find_serializer_by_type(int), PrimitiveSerializer)
+        self.assertIsNone(registry.find_serializer_by_data_format('primitive_type'))
+        registry.register_serializer(PrimitiveSerializer())
+        self.assertIsInstance(registry.find_serializer_by_type(int), PrimitiveSerializer)
+        with self.assertRaises(ValueError):
+            registry.register_serializer(PrimitiveSerializer())
+
+    def test_plugins_discovery(self):
+        with tempfile.TemporaryDirectory() as path:
+            files = {
+                'complex_plugin-1.0.dist-info/METADATA': 'Metadata-Version: 2.1\nName: complex-plugin\nVersion: 1.0\n',
+                'complex_plugin-1.0.dist-info/entry_points.txt':
+                    '[serialzy.serializers]\ncomplex = complex_plugin_manifest:ENTRIES\n',
+                'complex_plugin_manifest.py': """
+                    from serialzy.api import TypeMatcher
+                    from serialzy.manifest import SerializerManifestEntry
+                    ENTRIES = [SerializerManifestEntry('complex_plugin', 'ComplexSerializer', 'complex', True,
+                                                       TypeMatcher(types=(complex,)))]
+                """,
+                'complex_plugin.py': """
+                    from serialzy.base import DefaultSchemaSerializerByReference
+                    from serialzy.api import TypeMatcher
+
+                    class ComplexSerializer(DefaultSchemaSerializerByReference):
+                        def _serialize(self, obj, dest):
+                            dest.write(str(obj).encode())
+
+                        def _deserialize(self, source, schema_type, user_type=None):
+                            return complex(source.read().decode())
+
+                        def supported_types(self):
+                            return complex
+
+                        def type_matcher(self):
+                            return TypeMatcher(types=(complex,))
+
+                        def available(self):
+                            return True
+
+                        def stable(self):
+                            return True
+
+                        def data_format(self):
+                            return 'complex'
+
+                        def meta(self):
+                            return {}
+
+                        def requirements(self):
+                            return {}
+                """,
+            }
+            for name, content in files.items():
+                os.makedirs(os.path.dirname(os.path.join(path, name)), exist_ok=True)
+                with open(os.path.join(path, name), 'w') as file:
+                    file.write(textwrap.dedent(content))
+
+            code = "import sys; from serialzy.registry import DefaultSerializerRegistry; " \
+                   "registry = DefaultSerializerRegistry(); registry.find_serializer_by_type(int); " \
+                   "print('complex_plugin' in sys.modules); " \
+                   "print(type(registry.find_serializer_by_type(complex)).__name__); " \
+                   "print(type(registry.find_serializer_by_data_format('complex')).__name__)"
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join([path] + sys.path))
+            output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True,
+                                    env=env).stdout
+            self.assertEqual(['False', 'ComplexSerializer', 'ComplexSerializer'], output.split())
+
+    def test_broken_plugin(self):
+        # serializers without type matchers are loaded on any lookup
+        entry = SerializerManifestEntry('missing_plugin', 'MissingSerializer', 'missing', True, None)
+        with mock.patch('serialzy.registry.plugins_manifest', return_value=(entry,)):
+            registry = DefaultSerializerRegistry()
+            with self.assertLogs('serialzy.registry', 'WARNING') as logs:
+                self.assertIsInstance(registry.find_serializer_by_type(int), PrimitiveSerializer)
+            self.assertIn('Cannot load serializer missing_plugin.MissingSerializer', logs.output[0])
+
+            self.assertIsInstance(registry.find_serializer_by_type(float), PrimitiveSerializer)
+            self.assertIsNone(registry.find_serializer_by_data_format('missing'))
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from serialzy.utils import InstalledPackages, all_installed_packages
+
+
+class InstalledPackagesTests(TestCase):
+    def test_lookup(self):
+        packages = InstalledPackages()
+        installed = all_installed_packages()
+        self.assertEqual(installed['packaging'], packages['packaging'])
+        self.assertEqual(installed['pure-protobuf'], packages['pure-protobuf'])
+        self.assertEqual(installed['pure-protobuf'], packages['pure_protobuf'])
+        self.assertNotIn('not-installed-package', packages)
+        with self.assertRaises(KeyError):
+            _ = packages['not-installed-package']
+        self.assertEqual(len(installed), len(packages))
+
+    def test_nothing_is_scanned_on_import(self):
+        code = "import sys, serialzy.registry; " \
+               "print('pkg_resources' in sys.modules, 'importlib.metadata' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        self.assertEqual('False False', output.strip())